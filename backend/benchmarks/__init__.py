@@ -0,0 +1,6 @@
+"""Benchmarks for hot paths in the search pipeline.
+
+Run a benchmark module directly, e.g. `python -m backend.benchmarks.parsers`.
+`search_layer` load-tests the search entry points offline against the
+record/replay stand-in server in `replay`.
+"""
@@ -0,0 +1,70 @@
+"""Benchmark batch English detection against the previous per-word list scan.
+
+Classifies a batch of mixed-language snippets the size of a comprehensive
+run's results and reports the time per batch and agreement between the two.
+
+    python -m backend.benchmarks.language [--batch 500] [--repeat 20]
+"""
+
+import argparse
+import timeit
+
+from backend.utils.language import detect_english
+
+
+SAMPLES = [
+    "Tesla reported quarterly revenue of $25 billion, and deliveries were higher than analysts had expected.",
+    "The company has been expanding its battery factories while margins were under pressure this year.",
+    "Elon Musk said on Wednesday that the new model would be available in the United States by spring.",
+    "Tesla, Inc. is an American multinational automotive and clean energy company headquartered in Austin.",
+    "El fabricante de automóviles eléctricos presentó resultados trimestrales por encima de lo esperado.",
+    "Der Elektroautohersteller meldete für das Quartal einen Umsatz, der über den Erwartungen lag.",
+    "Le constructeur a annoncé une hausse de ses livraisons au troisième trimestre selon les analystes.",
+    "特斯拉公布了第三季度财报，营收超出分析师预期，交付量创下新高。",
+    "Компания сообщила о росте выручки в третьем квартале благодаря увеличению поставок.",
+    "Tesla Q3 earnings beat",
+]
+
+
+def legacy_is_english(text: str) -> bool:
+    """The per-word list scan `is_english` used before the batch classifier."""
+    if not text:
+        return False
+    english_indicators = [
+        'the', 'is', 'are', 'was', 'were', 'been', 'being',
+        'have', 'has', 'had', 'do', 'does', 'did',
+        'will', 'would', 'could', 'should', 'may', 'might',
+        'and', 'but', 'or', 'because', 'if', 'when', 'while'
+    ]
+    words = text.lower().split()
+    if len(words) < 3:
+        return True
+    matches = sum(1 for word in words if word in english_indicators)
+    return (matches / len(words)) > 0.05
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch", type=int, default=500, help="Snippets per batch")
+    parser.add_argument("--repeat", type=int, default=20, help="Batches timed per implementation")
+    args = parser.parse_args()
+
+    batch = [SAMPLES[i % len(SAMPLES)] for i in range(args.batch)]
+
+    legacy = timeit.Timer(lambda: [legacy_is_english(text) for text in batch])
+    current = timeit.Timer(lambda: detect_english(batch))
+    legacy_ms = min(legacy.repeat(repeat=5, number=args.repeat)) / args.repeat * 1000
+    current_ms = min(current.repeat(repeat=5, number=args.repeat)) / args.repeat * 1000
+
+    print(f"{'implementation':<20}{'ms/batch':>10}{'us/text':>10}")
+    print(f"{'list scan':<20}{legacy_ms:>10.3f}{legacy_ms * 1000 / len(batch):>10.2f}")
+    print(f"{'batch frozenset':<20}{current_ms:>10.3f}{current_ms * 1000 / len(batch):>10.2f}")
+    print(f"speedup: {legacy_ms / current_ms:.1f}x")
+
+    print("\nper-sample decisions (list scan -> batch, confidence):")
+    for text, score in zip(SAMPLES, detect_english(SAMPLES)):
+        print(f"  {legacy_is_english(text)!s:>5} -> {score.is_english!s:<5} {score.confidence:.2f}  {text[:50]}")
+
+
+if __name__ == "__main__":
+    main()
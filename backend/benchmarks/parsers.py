@@ -0,0 +1,55 @@
+"""Benchmark the lxml fast-path parsers against the BeautifulSoup fallback.
+
+Uses the synthetic Google News feed and DuckDuckGo LinkedIn results page
+in `corpus/` (see corpus/README.md), parsing the first few items as the
+providers do. Pass --corpus to time saved real responses with the same
+file names instead.
+
+    python -m backend.benchmarks.parsers [--limit 5] [--repeat 200] [--corpus DIR]
+"""
+
+import argparse
+import timeit
+from pathlib import Path
+
+from backend.utils.result_parsers import (
+    _parse_rss_items_lxml, _parse_rss_items_bs4,
+    _parse_result_links_lxml, _parse_result_links_bs4
+)
+
+
+CORPUS_DIR = Path(__file__).parent / "corpus"
+
+CASES = [
+    ("google_news_rss.xml", _parse_rss_items_lxml, _parse_rss_items_bs4),
+    ("ddg_linkedin.html", _parse_result_links_lxml, _parse_result_links_bs4),
+]
+
+
+def bench(fn, content: bytes, limit: int, repeat: int) -> float:
+    """Best per-call time in ms over `repeat` calls."""
+    timer = timeit.Timer(lambda: fn(content, limit))
+    return min(timer.repeat(repeat=5, number=max(1, repeat // 5))) / max(1, repeat // 5) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limit", type=int, default=5, help="Items to extract per document")
+    parser.add_argument("--repeat", type=int, default=200, help="Calls per parser")
+    parser.add_argument("--corpus", type=Path, default=CORPUS_DIR, help="Directory holding the documents")
+    args = parser.parse_args()
+
+    print(f"{'document':<24}{'size':>10}{'lxml ms':>10}{'bs4 ms':>10}{'speedup':>10}")
+    for filename, fast, fallback in CASES:
+        content = (args.corpus / filename).read_bytes()
+        assert fast(content, args.limit) == fallback(content, args.limit), f"{filename}: parsers disagree"
+        fast_ms = bench(fast, content, args.limit, args.repeat)
+        fallback_ms = bench(fallback, content, args.limit, args.repeat)
+        print(
+            f"{filename:<24}{len(content) // 1024:>8}KB{fast_ms:>10.3f}{fallback_ms:>10.3f}"
+            f"{fallback_ms / fast_ms:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,441 @@
+"""Record/replay stand-in for the search providers' upstream sites.
+
+The recorder runs real searches with the shared HTTP pool on a recording
+transport and saves every exchange to a fixture file. The replay server
+serves those exchanges from 127.0.0.1, with optional latency and error
+injection, so the search layer can be benchmarked and load-tested offline:
+
+    python -m backend.benchmarks.replay record Tesla "Nikola Tesla" -o exchanges.json
+    python -m backend.benchmarks.replay serve exchanges.json --latency-ms 80 --error-rate 0.05
+
+A recorded URL is served at http://127.0.0.1:<port>/<host><path>, and
+`point_providers_at` rewrites the provider base URLs to match. The
+duckduckgo_search library cannot be pointed at another host, so its
+results are recorded at the library level and served to a `ReplayDDGS`
+stand-in instead.
+
+`corpus/search_exchanges.json` is a small synthetic fixture built from the
+parser corpus, matching the requests made for the query "Tesla".
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import httpx
+import requests
+
+from backend.config import settings
+
+
+DEFAULT_FIXTURES = Path(__file__).parent / "corpus" / "search_exchanges.json"
+
+# Pseudo-host under which duckduckgo_search library calls are recorded
+DDGS_HOST = "duckduckgo_search"
+
+
+@dataclass
+class Exchange:
+    """One recorded request and its response."""
+    host: str
+    path: str
+    query: List[Tuple[str, str]]
+    status: int = 200
+    content_type: str = "text/html"
+    body: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)  # Extra response headers, e.g. Location
+
+    @property
+    def key(self) -> Tuple[str, str, Tuple[Tuple[str, str], ...]]:
+        return self.host, self.path, tuple(sorted(self.query))
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "Exchange":
+        parts = urlsplit(url)
+        return cls(parts.netloc, parts.path or "/", parse_qsl(parts.query, keep_blank_values=True), **kwargs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        try:
+            body, encoding = self.body.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(self.body).decode("ascii"), "base64"
+        return {
+            "host": self.host,
+            "path": self.path,
+            "query": [list(pair) for pair in self.query],
+            "status": self.status,
+            "content_type": self.content_type,
+            "headers": self.headers,
+            "encoding": encoding,
+            "body": body
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Exchange":
+        body = data.get("body", "")
+        return cls(
+            host=data["host"],
+            path=data["path"],
+            query=[tuple(pair) for pair in data.get("query", [])],
+            status=data.get("status", 200),
+            content_type=data.get("content_type", "text/html"),
+            body=base64.b64decode(body) if data.get("encoding") == "base64" else body.encode("utf-8"),
+            headers=data.get("headers", {})
+        )
+
+
+def save_exchanges(path: Path, exchanges: List[Exchange]):
+    Path(path).write_text(json.dumps([e.to_dict() for e in exchanges], indent=1), encoding="utf-8")
+
+
+def load_exchanges(path: Path) -> List[Exchange]:
+    return [Exchange.from_dict(d) for d in json.loads(Path(path).read_text(encoding="utf-8"))]
+
+
+def _ddgs_query(keywords: str, max_results: Optional[int]) -> List[Tuple[str, str]]:
+    query = [("keywords", keywords)]
+    if max_results is not None:
+        query.append(("max_results", str(max_results)))
+    return query
+
+
+class Recorder:
+    """Collects exchanges from a recording transport and DDGS wrapper."""
+
+    def __init__(self):
+        self.exchanges: List[Exchange] = []
+        self._lock = threading.Lock()
+
+    def add(self, exchange: Exchange):
+        with self._lock:
+            self.exchanges.append(exchange)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """httpx transport that records every exchange passing through it."""
+
+    def __init__(self, recorder: Recorder, inner: Optional[httpx.AsyncBaseTransport] = None):
+        self.recorder = recorder
+        self.inner = inner or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.inner.handle_async_request(request)
+        body = await httpx.Response(
+            response.status_code, headers=response.headers, stream=response.stream
+        ).aread()  # Decoded body; content-encoding is not replayed
+        self.recorder.add(Exchange.from_url(
+            str(request.url),
+            status=response.status_code,
+            content_type=response.headers.get("content-type", "application/octet-stream"),
+            body=body,
+            headers={"Location": response.headers["location"]} if "location" in response.headers else {}
+        ))
+        headers = [
+            (name, value) for name, value in response.headers.multi_items()
+            if name.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+        ]
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    async def aclose(self):
+        await self.inner.aclose()
+
+
+class RecordingDDGS:
+    """Wraps a DDGS session and records its text search results."""
+
+    def __init__(self, recorder: Recorder, inner):
+        self.recorder = recorder
+        self.inner = inner
+
+    def text(self, keywords: str, max_results: Optional[int] = None, **kwargs) -> List[Dict[str, Any]]:
+        try:
+            results = list(self.inner.text(keywords, max_results=max_results, **kwargs))
+        except Exception:
+            # A failed DDGS session stays failed; record the rest on a fresh one
+            self.inner = type(self.inner)()
+            raise
+        self.recorder.add(Exchange(
+            DDGS_HOST, "/text", _ddgs_query(keywords, max_results),
+            content_type="application/json", body=json.dumps(results).encode("utf-8")
+        ))
+        return results
+
+
+async def record(queries: List[str], providers: List[str], limit: int) -> List[Exchange]:
+    """Run live searches for `queries` and return the recorded exchanges.
+
+    Covers the factory path (`gather_search_results`) and `SearchClient`.
+    """
+    from backend.utils import http_pool
+    from backend.utils.search import gather_search_results
+    from backend.utils.search_providers import ddg
+    from backend.utils.search_utils import SearchClient
+
+    recorder = Recorder()
+    previous_pool, previous_ddgs = http_pool._http_pool, ddg._ddgs
+    http_pool._http_pool = http_pool.HTTPClientPool(transport=RecordingTransport(recorder))
+    ddg._ddgs = RecordingDDGS(recorder, ddg.DDGS())
+    client = SearchClient()
+    try:
+        await gather_search_results(queries, limit=limit, providers=providers, use_cache=False)
+        for query in queries:
+            await client.search_all_providers(query, use_cache=False)
+    finally:
+        await client.close()
+        await http_pool.close_http_pool()
+        http_pool._http_pool, ddg._ddgs = previous_pool, previous_ddgs
+    return recorder.exchanges
+
+
+@dataclass
+class ReplayStats:
+    requests: int = 0
+    hits: int = 0
+    fallbacks: int = 0  # Served a recording of the same endpoint for another query
+    misses: int = 0
+    injected_errors: int = 0
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real upstreams
+
+    def do_GET(self):
+        self.server.replay.handle(self)
+
+    def log_message(self, *args):
+        pass
+
+
+class _ReplayHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+class ReplayServer:
+    """Serves recorded exchanges from a local HTTP server.
+
+    Args:
+        exchanges: Recorded exchanges to serve.
+        latency_ms: Delay added to every response.
+        jitter_ms: Extra random delay of up to this much.
+        error_rate: Share of requests answered with `error_status` instead.
+        error_status: Status code for injected errors.
+        fallback: Serve a recording of the same endpoint when the exact
+            query was not recorded, so load tests can use unique queries.
+        seed: Seed for jitter and error injection, for repeatable runs.
+    """
+
+    def __init__(
+        self,
+        exchanges: List[Exchange],
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        error_rate: float = 0,
+        error_status: int = 503,
+        fallback: bool = True,
+        seed: int = 0
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.fallback = fallback
+        self.stats = ReplayStats()
+
+        self._exact: Dict[tuple, Exchange] = {}
+        self._by_endpoint: Dict[Tuple[str, str], List[Exchange]] = {}
+        for exchange in exchanges:
+            self._exact.setdefault(exchange.key, exchange)
+            self._by_endpoint.setdefault((exchange.host, exchange.path), []).append(exchange)
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[_ReplayHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("Replay server is not running")
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def url_for(self, upstream_url: str) -> str:
+        """Replay address of an upstream URL (without its query string)."""
+        parts = urlsplit(upstream_url)
+        return f"{self.url}/{parts.netloc}{parts.path or '/'}"
+
+    def start(self, port: int = 0) -> "ReplayServer":
+        self._server = _ReplayHTTPServer(("127.0.0.1", port), _ReplayHandler)
+        self._server.replay = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def lookup(self, host: str, path: str, query: List[Tuple[str, str]]) -> Optional[Exchange]:
+        with self._lock:
+            exchange = self._exact.get((host, path, tuple(sorted(query))))
+            if exchange is not None:
+                self.stats.hits += 1
+                return exchange
+            candidates = self._by_endpoint.get((host, path)) if self.fallback else None
+            if not candidates:
+                self.stats.misses += 1
+                return None
+            # Rotate through the endpoint's recordings, deterministically
+            self.stats.fallbacks += 1
+            return candidates[self.stats.fallbacks % len(candidates)]
+
+    def _draw(self) -> Tuple[float, bool]:
+        with self._lock:
+            self.stats.requests += 1
+            delay = self.latency_ms + (self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+            failed = self._random.random() < self.error_rate
+            if failed:
+                self.stats.injected_errors += 1
+        return delay / 1000, failed
+
+    def handle(self, handler: BaseHTTPRequestHandler):
+        delay, failed = self._draw()
+        if delay:
+            time.sleep(delay)
+
+        parts = urlsplit(handler.path)
+        host, _, path = parts.path.lstrip("/").partition("/")
+        exchange = None if failed else self.lookup(host, "/" + path, parse_qsl(parts.query, keep_blank_values=True))
+
+        if failed:
+            status, content_type, body, headers = self.error_status, "text/plain", b"injected error", {}
+        elif exchange is None:
+            status, content_type, body, headers = 404, "text/plain", b"no recording", {}
+        else:
+            status, content_type, body = exchange.status, exchange.content_type, exchange.body
+            headers = dict(exchange.headers)
+            if "Location" in headers and "://" in headers["Location"]:
+                # Keep redirects on the replay server
+                location = urlsplit(headers["Location"])
+                headers["Location"] = f"{self.url}/{location.netloc}{location.path}" + (
+                    f"?{location.query}" if location.query else ""
+                )
+
+        handler.send_response(status)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+
+class ReplayDDGS:
+    """Stand-in for `duckduckgo_search.DDGS` that answers from a replay server."""
+
+    def __init__(self, base_url: str, timeout: Optional[float] = None):
+        self.base_url = base_url
+        self.timeout = timeout or settings.SEARCH_PROVIDER_TIMEOUT_SECONDS
+        self.session = requests.Session()
+
+    def text(self, keywords: str, max_results: Optional[int] = None, **kwargs) -> List[Dict[str, Any]]:
+        response = self.session.get(
+            f"{self.base_url}/{DDGS_HOST}/text",
+            params=urlencode(_ddgs_query(keywords, max_results)),
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.json()
+
+
+@contextmanager
+def point_providers_at(server: ReplayServer) -> Iterator[None]:
+    """Send every provider's upstream traffic to the replay server.
+
+    Rewrites the provider base URLs in settings and swaps the shared DDGS
+    session for a `ReplayDDGS`; both are restored afterwards.
+    """
+    from backend.utils.search_providers import ddg
+
+    names = ("GOOGLE_NEWS_RSS_URL", "DUCKDUCKGO_HTML_URL", "WIKIPEDIA_API_URL")
+    previous = {name: getattr(settings, name) for name in names}
+    previous_ddgs = ddg._ddgs
+    try:
+        for name in names:
+            setattr(settings, name, server.url_for(previous[name]))
+        ddg._ddgs = ReplayDDGS(server.url)
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(settings, name, value)
+        ddg._ddgs = previous_ddgs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record or replay search provider traffic.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_cmd = commands.add_parser("record", help="Record live provider exchanges")
+    record_cmd.add_argument("queries", nargs="+")
+    # Required, so a casual run cannot overwrite the committed fixtures
+    record_cmd.add_argument("-o", "--output", type=Path, required=True)
+    record_cmd.add_argument("--providers", nargs="+", default=None, help="Defaults to SEARCH_PROVIDERS")
+    record_cmd.add_argument("--limit", type=int, default=5)
+
+    serve_cmd = commands.add_parser("serve", help="Serve recorded exchanges")
+    serve_cmd.add_argument("fixtures", type=Path, nargs="?", default=DEFAULT_FIXTURES)
+    serve_cmd.add_argument("--port", type=int, default=8765)
+    serve_cmd.add_argument("--latency-ms", type=float, default=0)
+    serve_cmd.add_argument("--jitter-ms", type=float, default=0)
+    serve_cmd.add_argument("--error-rate", type=float, default=0)
+    serve_cmd.add_argument("--error-status", type=int, default=503)
+    serve_cmd.add_argument("--exact", action="store_true", help="404 on queries that were not recorded")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        providers = args.providers or settings.SEARCH_PROVIDERS
+        exchanges = asyncio.run(record(args.queries, providers, args.limit))
+        save_exchanges(args.output, exchanges)
+        print(f"Recorded {len(exchanges)} exchanges to {args.output}")
+        return
+
+    server = ReplayServer(
+        load_exchanges(args.fixtures),
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        fallback=not args.exact
+    ).start(args.port)
+    print(f"Replaying {args.fixtures} at {server.url} (Ctrl+C to stop)")
+    for name in ("GOOGLE_NEWS_RSS_URL", "DUCKDUCKGO_HTML_URL", "WIKIPEDIA_API_URL"):
+        print(f"  {name}={server.url_for(getattr(settings, name))}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Benchmark the search layer against the record/replay stand-in server.
+
+Runs `get_search_results` (blocking, one worker thread per concurrent
+caller) and `SearchClient.search_all_providers` (asyncio tasks) at growing
+concurrency and reports throughput and p50/p95/p99 latency per call.
+Every call uses a distinct query, so the search cache and single-flight
+coalescing stay out of the measurement; the replay server answers them
+from recordings of the same endpoint.
+
+    python -m backend.benchmarks.search_layer [--concurrency 1 4 16] [--calls 64]
+        [--latency-ms 50] [--jitter-ms 20] [--error-rate 0.02] [--rate-limits]
+
+Production rate limits would dominate the numbers, so they are lifted
+unless `--rate-limits` is given. Per-provider connection limits of the
+shared HTTP pool stay in effect.
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List
+
+import numpy as np
+
+from backend.benchmarks.replay import DEFAULT_FIXTURES, ReplayServer, load_exchanges, point_providers_at
+from backend.config import settings
+from backend.utils import provider_health, rate_limit
+from backend.utils.http_pool import close_http_pool
+from backend.utils.search import get_search_results
+from backend.utils.search_utils import SearchClient
+
+
+@dataclass
+class LevelResult:
+    target: str
+    concurrency: int
+    calls: int
+    failed: int  # Calls that came back without any result
+    seconds: float
+    latencies_ms: np.ndarray
+
+    def row(self) -> str:
+        p50, p95, p99 = np.percentile(self.latencies_ms, [50, 95, 99])
+        return (
+            f"{self.target:<22}{self.concurrency:>6}{self.calls / self.seconds:>10.1f}"
+            f"{p50:>10.1f}{p95:>10.1f}{p99:>10.1f}{self.failed:>8}"
+        )
+
+
+def _reset_search_state(keep_rate_limits: bool):
+    """Fresh circuit breakers and rate limiter for each run."""
+    provider_health._health_board = None
+    rate_limit._search_limiter = None
+    if not keep_rate_limits:
+        settings.SEARCH_RATE_LIMITS = {}
+        settings.SEARCH_RATE_LIMIT_DEFAULT_QPS = 1e6
+        settings.SEARCH_RATE_LIMIT_DEFAULT_BURST = 1e6
+        settings.MAX_CONCURRENT_SEARCHES = 1024
+
+
+def bench_get_search_results(queries: List[str], concurrency: int) -> LevelResult:
+    def call(query: str):
+        start = time.perf_counter()
+        results = get_search_results(query, limit=5, use_cache=False)
+        return (time.perf_counter() - start) * 1000, not results
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(call, queries))
+    seconds = time.perf_counter() - start
+    return LevelResult(
+        "get_search_results", concurrency, len(queries),
+        sum(failed for _, failed in outcomes), seconds, np.array([ms for ms, _ in outcomes])
+    )
+
+
+async def bench_search_client(queries: List[str], concurrency: int) -> LevelResult:
+    client = SearchClient()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(query: str):
+        async with semaphore:
+            start = time.perf_counter()
+            results = await client.search_all_providers(query, use_cache=False)
+            return (time.perf_counter() - start) * 1000, not results
+
+    try:
+        start = time.perf_counter()
+        outcomes = await asyncio.gather(*(call(query) for query in queries))
+        seconds = time.perf_counter() - start
+    finally:
+        await client.close()
+        await close_http_pool()
+    return LevelResult(
+        "SearchClient", concurrency, len(queries),
+        sum(failed for _, failed in outcomes), seconds, np.array([ms for ms, _ in outcomes])
+    )
+
+
+def run(
+    server: ReplayServer,
+    concurrency_levels: List[int],
+    calls: int,
+    keep_rate_limits: bool = False,
+    report: Callable[[str], None] = print
+) -> List[LevelResult]:
+    """Benchmark both entry points at each concurrency level against `server`."""
+    settings.SEARCH_CACHE_ENABLED = False
+    results = []
+    with point_providers_at(server):
+        report(f"{'target':<22}{'conc':>6}{'calls/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'failed':>8}")
+        for concurrency in concurrency_levels:
+            _reset_search_state(keep_rate_limits)
+            queries = [f"Tesla {concurrency}-{i}" for i in range(calls)]
+            results.append(bench_get_search_results(queries, concurrency))
+            report(results[-1].row())
+
+            _reset_search_state(keep_rate_limits)
+            results.append(asyncio.run(bench_search_client(queries, concurrency)))
+            report(results[-1].row())
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--calls", type=int, default=64, help="Calls per target and concurrency level")
+    parser.add_argument("--latency-ms", type=float, default=50, help="Simulated upstream latency")
+    parser.add_argument("--jitter-ms", type=float, default=20)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--rate-limits", action="store_true", help="Keep the configured search rate limits")
+    args = parser.parse_args()
+
+    with ReplayServer(
+        load_exchanges(args.fixtures),
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate
+    ) as server:
+        run(server, args.concurrency, args.calls, keep_rate_limits=args.rate_limits)
+        stats = server.stats
+        print(
+            f"\nreplay server: {stats.requests} requests, {stats.hits} exact, "
+            f"{stats.fallbacks} fallback, {stats.misses} missed, {stats.injected_errors} injected errors"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -61,7 +61,25 @@ class Settings(BaseSettings):
     EXTRACTION_MODEL: str = "gpt-3.5-turbo"  # Fast model for information extraction
     VERIFICATION_MODEL: str = "gpt-4"  # Complex reasoning for cross-referencing
     SYNTHESIS_MODEL: str = "gpt-4"  # Complex reasoning for narrative generation
-    
+
+    # LLMClient response cache: bounded in-memory LRU in front of SQLite
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_PATH: str = "./cache/llm_cache.sqlite3"  # Empty disables the disk tier
+    LLM_CACHE_TTL_SECONDS: int = 604800
+    LLM_CACHE_MEMORY_ENTRIES: int = 512
+    LLM_CACHE_MEMORY_MAX_BYTES: int = 16 * 1024 * 1024
+    LLM_CACHE_DISK_MAX_BYTES: int = 256 * 1024 * 1024  # Least recently used responses are dropped beyond this
+    # Task types cached by default; synthesis is left out so re-runs get fresh prose
+    LLM_CACHE_TASK_TYPES: List[str] = ["planning", "extraction", "verification"]
+
+    # Semantic LLM cache: near-duplicate prompts served from a hashed n-gram index
+    SEMANTIC_CACHE_ENABLED: bool = True
+    SEMANTIC_CACHE_AUDIT: bool = False  # Log would-be hits without serving them, to tune the threshold
+    SEMANTIC_CACHE_THRESHOLD: float = 0.92  # Cosine similarity of the prompts' variable parts
+    SEMANTIC_CACHE_MAX_ENTRIES: int = 2048
+    SEMANTIC_CACHE_DIM: int = 1024  # Index size is MAX_ENTRIES x DIM float32
+    SEMANTIC_CACHE_TASK_TYPES: List[str] = ["planning", "extraction"]
+
     # Research Depth Settings (per FR-001, FR-004)
     # quick: 3-5 sub-questions, 1 level recursion
     # standard: 5-7 sub-questions, 2 levels recursion
@@ -80,11 +98,145 @@ class Settings(BaseSettings):
     MIN_WORDS_PER_SECTION: int = 300  # FR-007: Minimum 300 words per major section
     MIN_SOURCES_PER_SECTION: int = 3  # SC-004: At least 3 sources per section
     
+    # Legacy module LLM calls (backend/utils/llm.py)
+    LLM_TIMEOUT_SECONDS: float = 60  # Per call, including queueing for a connection
+    LLM_POOL_MAX_CONNECTIONS: int = 20
+    LLM_MAX_CONCURRENCY: int = 8  # Concurrent calls per LLM provider
+
     # Rate Limiting (LLM and Search providers)
-    LLM_RATE_LIMIT_RPM: int = 60  # Requests per minute
-    MAX_CONCURRENT_SEARCHES: int = 3  # Balance speed vs rate limits
+    LLM_RATE_LIMIT_RPM: int = 60  # Requests per minute, per model
+    LLM_RATE_LIMIT_TPM: int = 90000  # Prompt + completion tokens per minute, per model
+    LLM_RATE_LIMIT_BURST_SECONDS: float = 10  # Seconds of RPM/TPM budget that may be spent at once
+    # Per-model overrides, e.g. {"gpt-4": {"rpm": 500, "tpm": 30000, "concurrency": 4}}
+    LLM_MODEL_RATE_LIMITS: Dict[str, Dict[str, float]] = {}
+    LLM_SCHEDULER_ENABLED: bool = True
+    LLM_SCHEDULER_MAX_CONCURRENCY: int = 8  # Concurrent LLMClient calls per model
+    # Queued LLMClient calls run lowest value first
+    LLM_TASK_PRIORITIES: Dict[str, int] = {
+        "synthesis": 0,
+        "planning": 0,
+        "verification": 1,
+        "extraction": 2,
+    }
+    MAX_CONCURRENT_SEARCHES: int = 3  # Per upstream; balance speed vs rate limits
     SEARCH_TIMEOUT_SECONDS: int = 30  # Per search request
     MAX_SEARCH_RESULTS_PER_QUERY: int = 5  # Results to process per sub-question
+    SEARCH_FANOUT_CONCURRENCY: int = 8  # Max (query, provider) pairs in flight per fan-out
+    SEARCH_FANOUT_DEADLINE_SECONDS: float = 20  # Overall fan-out budget; partial results after this
+
+    # Shared HTTP connection pool for search providers
+    SEARCH_POOL_MAX_CONNECTIONS: int = 100
+    SEARCH_POOL_MAX_KEEPALIVE: int = 20
+    SEARCH_POOL_KEEPALIVE_SECONDS: float = 30
+    SEARCH_PROVIDER_TIMEOUT_SECONDS: float = 10
+    SEARCH_HTTP2: bool = True  # Used only when the optional h2 package is installed
+    SEARCH_PROVIDER_DEFAULT_CONNECTIONS: int = 4
+    SEARCH_PROVIDER_CONNECTION_LIMITS: Dict[str, int] = {
+        "google_news": 10,
+        "wikipedia": 10,
+        "linkedin": 2,
+        "duckduckgo": 4,
+        "pages": 8,  # Full-page fetches for extraction, across all domains
+    }
+
+    # Per-upstream rate limits; callers queue for capacity instead of failing.
+    # Concurrency defaults to MAX_CONCURRENT_SEARCHES per upstream.
+    SEARCH_RATE_LIMIT_DEFAULT_QPS: float = 5
+    SEARCH_RATE_LIMIT_DEFAULT_BURST: float = 10
+    SEARCH_RATE_LIMITS: Dict[str, Dict[str, float]] = {
+        "duckduckgo": {"qps": 1, "burst": 3},  # Blocks aggressively on bursts
+        "google_news": {"qps": 2, "burst": 5},
+        "wikipedia": {"qps": 10, "burst": 20, "concurrency": 10},
+    }
+
+    # Site-scoped DuckDuckGo providers (reddit, github, ...) share OR'd site: queries
+    SEARCH_MULTIPLEX_SITES: bool = True
+    SEARCH_MULTIPLEX_MAX_ROUNDS: int = 3  # Follow-up queries for sites still short of their limit
+    SEARCH_MULTIPLEX_OVERFETCH: int = 2  # Results requested per missing result
+
+    # Provider health tracking and circuit breaker
+    PROVIDER_HEALTH_WINDOW: int = 50  # Calls kept per provider for success rate/latency
+    CIRCUIT_MIN_CALLS: int = 5  # Recent calls considered before tripping
+    CIRCUIT_FAILURE_THRESHOLD: float = 0.8  # Failure share of recent calls that opens the circuit
+    CIRCUIT_COOLDOWN_SECONDS: float = 60  # Time open before a recovery probe is allowed
+
+    # Near-duplicate elimination before extraction (canonical URLs + SimHash)
+    DEDUP_ENABLED: bool = True
+    DEDUP_SIMHASH_MAX_DISTANCE: int = 6  # Differing bits (of 64) still counted as the same document
+    DEDUP_MIN_TOKENS: int = 8  # Shorter texts only match when identical
+
+    # Local BM25 ranking of search results before LLM extraction
+    RELEVANCE_RANKING_ENABLED: bool = True  # False extracts from results as they stream in
+    RELEVANCE_MIN_SCORE: float = 0.2  # Relative to the best result for the sub-question
+    BM25_K1: float = 1.5
+    BM25_B: float = 0.75
+
+    # Batched extraction: a question's ranked results share one LLM call
+    EXTRACTION_BATCH_ENABLED: bool = True  # Needs RELEVANCE_RANKING_ENABLED; streamed results go one by one
+    EXTRACTION_BATCH_SIZE: int = 5  # Results per call
+    EXTRACTION_BATCH_MAX_CHARS: int = 12000  # Result content per call (about three fetched pages)
+    EXTRACTION_BATCH_TOKENS_PER_RESULT: int = 400  # Response budget per result
+
+    # Raw search snapshots per agentic run, for audit and re-synthesis without searching (FR-020)
+    SNAPSHOTS_ENABLED: bool = True
+    SNAPSHOT_PATH: str = "./cache/search_snapshots.sqlite3"  # Empty disables snapshots
+    SNAPSHOT_COMPRESSION_LEVEL: int = 6  # zlib level, 1 (fast) - 9 (small)
+
+    # Per-provider result limits and ordering learned from extraction / citation yield
+    PROVIDER_YIELD_ENABLED: bool = True
+    PROVIDER_YIELD_PATH: str = "./cache/provider_yield.sqlite3"  # Empty string keeps counts in memory only
+    PROVIDER_YIELD_PRIOR: float = 0.5  # Assumed yield of a provider with no history
+    PROVIDER_YIELD_PRIOR_WEIGHT: float = 10.0  # Results' worth of evidence the prior counts for
+    PROVIDER_YIELD_DECAY: float = 0.98  # Applied to the counts on every update
+    PROVIDER_YIELD_MIN_LIMIT: int = 1  # Low-yield providers keep at least this many results
+    PROVIDER_YIELD_MAX_FACTOR: float = 2.0  # High-yield providers get at most this times the base limit
+
+    # Conditional GETs (ETag / Last-Modified) for feed providers such as Google News
+    FEED_CONDITIONAL_GET_ENABLED: bool = True
+    FEED_CACHE_ENTRIES: int = 256  # Feeds whose validators, body and parsed items are kept
+
+    # Optional full-page fetch of the top-ranked results before LLM extraction
+    PAGE_FETCH_ENABLED: bool = False
+    PAGE_FETCH_MAX_BYTES: int = 1_000_000  # Download cap per page; the rest is never read
+    PAGE_FETCH_TIMEOUT_SECONDS: float = 10
+    PAGE_FETCH_DOMAIN_QPS: float = 1  # Politeness per domain
+    PAGE_FETCH_DOMAIN_BURST: float = 2
+    PAGE_FETCH_DOMAIN_CONCURRENCY: int = 2
+    PAGE_FETCH_DOMAIN_LIMITERS: int = 1024  # Per-domain limiters kept; least recently used idle ones are dropped
+    PAGE_FETCH_MAX_REDIRECTS: int = 5
+    PAGE_FETCH_ALLOW_PRIVATE_HOSTS: bool = False  # Fetch loopback, private and link-local addresses (tests only)
+    PAGE_TEXT_MAX_CHARS: int = 4000  # Main text passed to extraction
+    PAGE_CACHE_PATH: str = "./cache/page_cache.sqlite3"  # Empty disables the disk cache
+    PAGE_CACHE_TTL_SECONDS: int = 604800
+    PAGE_CACHE_FAILURE_TTL_SECONDS: int = 3600  # Pages that failed are not retried before this
+
+    # MediaWiki Action API endpoint for the Wikipedia providers (English per NFR-007)
+    WIKIPEDIA_API_URL: str = "https://en.wikipedia.org/w/api.php"
+    # Other provider endpoints; point them at a replay server for offline benchmarks
+    GOOGLE_NEWS_RSS_URL: str = "https://news.google.com/rss/search"
+    DUCKDUCKGO_HTML_URL: str = "https://html.duckduckgo.com/html/"
+
+    # Search result cache: bounded in-memory LRU in front of SQLite
+    SEARCH_CACHE_ENABLED: bool = True
+    SEARCH_CACHE_MEMORY_ENTRIES: int = 1024
+    SEARCH_CACHE_PATH: str = "./cache/search_cache.sqlite3"  # Empty disables the disk tier
+    SEARCH_CACHE_DEFAULT_TTL_SECONDS: int = 3600
+    SEARCH_CACHE_EMPTY_TTL_SECONDS: int = 300  # Max TTL for empty answers; 0 never caches them
+    SEARCH_CACHE_TTL_SECONDS: Dict[str, int] = {
+        "google_news": 600,  # News goes stale within minutes
+        "duckduckgo": 3600,
+        "linkedin": 86400,
+        "reddit": 3600,
+        "github": 86400,
+        "medium": 86400,
+        "youtube": 86400,
+        "instagram": 86400,
+        "wikipedia": 604800,  # Encyclopedia entries change slowly
+    }
+    
+    # Entity resolution and query normalization for cache keys
+    QUERY_NORMALIZATION_ENABLED: bool = True
+    ENTITY_ALIAS_PATH: str = "./cache/entity_aliases.sqlite3"  # Empty keeps aliases in memory only
     
     # Logging (per NFR-003 to NFR-006)
     LOG_LEVEL: str = "INFO"
@@ -94,6 +246,8 @@ class Settings(BaseSettings):
     # Language Settings (per NFR-007, NFR-008)
     TARGET_LANGUAGE: str = "en"  # English only for MVP
     FILTER_NON_ENGLISH: bool = True
+    ENGLISH_MIN_INDICATOR_RATIO: float = 0.05  # Share of English function words needed to pass
+    ENGLISH_MIN_WORDS: int = 3  # Shorter texts pass as undetermined
 
     class Config:
         env_file = ".env"
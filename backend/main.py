@@ -3,17 +3,31 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from typing import List
+from typing import List, Optional
 import os
 
 from backend.config import settings, RESEARCH_MODULES
 from backend.models import (
     ResearchRequest, ResearchResponse, HealthResponse,
-    ModuleInfo, ReportRequest, EntityType
+    ModuleInfo, ReportRequest, EntityType, EntityAliasRequest
 )
 from backend.modules import ResearcherManager
 from backend.utils.report_generator import ReportGenerator
 from backend.utils.search import PROVIDER_MAP
+from backend.utils.http_pool import get_http_pool, close_http_pool
+from backend.utils.search_cache import get_search_cache
+from backend.utils.llm_cache import get_llm_cache
+from backend.utils.semantic_cache import get_semantic_cache
+from backend.utils.llm_scheduler import get_llm_scheduler
+from backend.utils.single_flight import get_search_flight
+from backend.utils.provider_health import get_health_board
+from backend.utils.rate_limit import get_search_limiter
+from backend.utils.entities import get_entity_resolver
+from backend.utils.page_fetcher import get_page_fetcher
+from backend.utils.feed_cache import get_feed_cache
+from backend.utils.provider_yield import get_yield_tracker
+from backend.utils.snapshots import get_snapshot_store
+from backend.utils.llm import llm_service
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -109,6 +123,119 @@ async def get_providers():
     return list(PROVIDER_MAP.keys())
 
 
+@app.get(f"{settings.API_PREFIX}/providers/health")
+async def get_provider_health():
+    """Get rolling success rate, latency and circuit breaker state per provider."""
+    return get_health_board().snapshot(list(PROVIDER_MAP.keys()))
+
+
+@app.get(f"{settings.API_PREFIX}/providers/pool")
+async def get_provider_pool_stats():
+    """Get connection pool statistics for the search providers."""
+    return get_http_pool().stats()
+
+
+@app.get(f"{settings.API_PREFIX}/llm/pool")
+async def get_llm_pool_stats():
+    """Get connection pool statistics and call counters for the research modules' LLM calls."""
+    return llm_service.stats()
+
+
+@app.get(f"{settings.API_PREFIX}/llm/limits")
+async def get_llm_rate_limits():
+    """Get per-model RPM/TPM limits with queue depth by task type and wait times."""
+    scheduler = get_llm_scheduler()
+    if scheduler is None:
+        return {"enabled": False}
+    return {"enabled": True, "models": scheduler.stats()}
+
+
+@app.get(f"{settings.API_PREFIX}/llm/cache")
+async def get_llm_cache_stats():
+    """Get hit/miss/eviction statistics for the agentic workflow's LLM response caches."""
+    cache = get_llm_cache()
+    semantic = get_semantic_cache()
+    return {
+        "enabled": cache is not None,
+        **(cache.stats() if cache is not None else {}),
+        "semantic": {"enabled": True, **semantic.stats()} if semantic is not None else {"enabled": False}
+    }
+
+
+@app.get(f"{settings.API_PREFIX}/providers/cache")
+async def get_search_cache_stats():
+    """Get hit/miss/eviction statistics for the search result cache."""
+    cache = get_search_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
+@app.get(f"{settings.API_PREFIX}/providers/coalescing")
+async def get_search_coalescing_stats():
+    """Get how many identical in-flight searches were deduplicated."""
+    return get_search_flight().stats()
+
+
+@app.get(f"{settings.API_PREFIX}/providers/limits")
+async def get_search_rate_limits():
+    """Get per-upstream rate limits with current wait time and queue depth."""
+    return get_search_limiter().stats()
+
+
+@app.get(f"{settings.API_PREFIX}/providers/yield")
+async def get_provider_yield():
+    """Get the learned share of useful results by research type and provider."""
+    tracker = get_yield_tracker()
+    if tracker is None:
+        return {"enabled": False}
+    return {"enabled": True, "research_types": tracker.stats()}
+
+
+@app.get(f"{settings.API_PREFIX}/providers/feeds")
+async def get_feed_cache_stats():
+    """Get conditional GET counters: 304s, bytes saved and parse time avoided."""
+    feeds = get_feed_cache()
+    if feeds is None:
+        return {"enabled": False}
+    return {"enabled": True, **feeds.stats()}
+
+
+@app.get(f"{settings.API_PREFIX}/providers/pages")
+async def get_page_fetch_stats():
+    """Get full-page fetch counters and page cache size."""
+    fetcher = get_page_fetcher()
+    if fetcher is None:
+        return {"enabled": False}
+    return {"enabled": True, **fetcher.stats()}
+
+
+@app.get(f"{settings.API_PREFIX}/entities/aliases")
+async def get_entity_aliases():
+    """Get known entity aliases, grouped by canonical entity key."""
+    resolver = get_entity_resolver()
+    if resolver is None:
+        return {"enabled": False}
+    return {"enabled": True, "entities": resolver.aliases()}
+
+
+@app.post(f"{settings.API_PREFIX}/entities/aliases")
+async def add_entity_alias(request: EntityAliasRequest):
+    """Map an alias (e.g. "TSLA") onto an entity, so both share cache entries."""
+    resolver = get_entity_resolver()
+    if resolver is None:
+        raise HTTPException(status_code=400, detail="Query normalization is disabled")
+    entity = resolver.add_alias(request.alias, request.canonical)
+    return {"alias": request.alias, "entity_key": entity.key, "entity_name": entity.name}
+
+
+@app.on_event("shutdown")
+async def shutdown_http_pool():
+    """Close pooled search and LLM connections on shutdown."""
+    await close_http_pool()
+    await llm_service.aclose()
+
+
 @app.post(f"{settings.API_PREFIX}/research", response_model=ResearchResponse)
 async def perform_research(request: ResearchRequest):
     """Perform research on an entity."""
@@ -123,7 +250,9 @@ async def perform_research(request: ResearchRequest):
         
         # Perform research
         manager = ResearcherManager(request.entity_name, request.entity_type.value)
-        results = await manager.perform_research(request.research_types, request.selected_providers)
+        results = await manager.perform_research(
+            request.research_types, request.selected_providers, request.bypass_cache
+        )
         
         # Generate report
         report_id = None
@@ -242,15 +371,25 @@ async def generate_research_plan(query: str, depth_level: DepthLevel = DepthLeve
     return plan
 
 
-async def _run_research_async(request: AgenticResearchRequest, session_id: str):
-    """Background task to run the full research workflow."""
+async def _run_research_async(
+    request: AgenticResearchRequest,
+    session_id: str,
+    source_request_id: Optional[str] = None
+):
+    """Background task to run the full research workflow.
+    
+    With `source_request_id`, the run replays that run's search snapshot instead of searching.
+    """
     workflow = _get_workflow()
     
     try:
         async def progress_callback(progress):
             _research_sessions[session_id].update(progress)
         
-        report = await workflow.execute(request, progress_callback)
+        if source_request_id:
+            report = await workflow.resynthesize(source_request_id, session_id, progress_callback)
+        else:
+            report = await workflow.execute(request, progress_callback)
         
         # Store completed report
         _research_sessions[session_id]["report"] = report.to_dict()
@@ -305,6 +444,57 @@ async def execute_research(request: AgenticResearchRequest):
     }
 
 
+@app.get("/api/research/{request_id}/snapshot")
+async def get_research_snapshot(request_id: str):
+    """Summarize the stored raw search results of a research run (FR-020)."""
+    snapshots = get_snapshot_store()
+    snapshot = await asyncio.to_thread(snapshots.load_run, request_id) if snapshots is not None else None
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail=f"No search snapshot for research request {request_id}")
+    return snapshot.summary()
+
+
+@app.post("/api/research/{request_id}/resynthesize")
+async def resynthesize_research(request_id: str):
+    """Re-run extraction, verification and synthesis from a run's search snapshot.
+    
+    No searches are made. Returns a new request_id to poll like /api/research/execute.
+    """
+    snapshots = get_snapshot_store()
+    snapshot = await asyncio.to_thread(snapshots.load_run, request_id) if snapshots is not None else None
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail=f"No search snapshot for research request {request_id}")
+    
+    new_request_id = str(uuid.uuid4())
+    request = snapshot.request.model_copy(update={"id": new_request_id})
+    log_workflow_event(
+        api_logger, "resynthesis_requested", new_request_id, "init", source_request_id=request_id
+    )
+    
+    _research_sessions[new_request_id] = {
+        "request": request.model_dump(),
+        "source_request_id": request_id,
+        "status": WorkflowStatus.PLANNING.value,
+        "current_stage": "initializing",
+        "progress_percent": 0,
+        "questions_completed": 0,
+        "questions_total": len(snapshot.plan.sub_questions),
+        "plan": None,
+        "report": None,
+        "started_at": datetime.now().isoformat(),
+        "completed_at": None
+    }
+    
+    asyncio.create_task(_run_research_async(request, new_request_id, source_request_id=request_id))
+    
+    return {
+        "request_id": new_request_id,
+        "source_request_id": request_id,
+        "status": "planning",
+        "message": "Re-synthesis started. Poll /api/research/{id}/status for updates."
+    }
+
+
 @app.get("/api/research/{request_id}/status", response_model=ResearchProgress)
 async def get_research_status(request_id: str):
     """Get the current status and progress of a research request.
@@ -18,6 +18,7 @@ class ResearchRequest(BaseModel):
     entity_type: EntityType = Field(..., description="Type of entity")
     research_types: List[str] = Field(..., description="List of research types to perform")
     selected_providers: Optional[List[str]] = Field(None, description="List of search providers to use")
+    bypass_cache: bool = Field(False, description="Skip cached search results and fetch fresh ones")
     
     class Config:
         json_schema_extra = {
@@ -68,6 +69,12 @@ class HealthResponse(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
+class EntityAliasRequest(BaseModel):
+    """Request model for mapping an alias onto an entity."""
+    alias: str = Field(..., description="Alternative name, e.g. a ticker or former name")
+    canonical: str = Field(..., description="Name of the entity the alias refers to")
+
+
 class ReportRequest(BaseModel):
     """Request model for report generation."""
     entity_name: str
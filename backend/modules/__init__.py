@@ -5,6 +5,7 @@ from backend.modules.base import BaseResearcher
 from typing import Dict, Any
 from backend.config import RESEARCH_MODULES
 from backend.models import ResearchResult
+from backend.utils.entities import get_entity_resolver
 from datetime import datetime
 
 
@@ -17,6 +18,12 @@ class ResearcherManager:
         self.entity_name = entity_name
         self.entity_type = entity_type
         
+        # Research the canonical entity, so "Tesla", "Tesla Inc" and "Tesla, Inc."
+        # produce the same queries and prompts (and share their cache entries)
+        resolver = get_entity_resolver()
+        self.entity = resolver.resolve(entity_name) if resolver is not None else None
+        self.research_name = self.entity.name if self.entity is not None else entity_name
+        
         # Lazy import to avoid circular dependencies
         if not self.MODULE_MAP:
             from backend.modules.financial import FinancialResearcher
@@ -43,7 +50,12 @@ class ResearcherManager:
                 "trends": TrendsResearcher,
             }
     
-    async def perform_research(self, research_types: List[str], selected_providers: List[str] = None) -> List[ResearchResult]:
+    async def perform_research(
+        self,
+        research_types: List[str],
+        selected_providers: List[str] = None,
+        bypass_cache: bool = False
+    ) -> List[ResearchResult]:
         """Perform research for the specified types."""
         results = []
         
@@ -52,7 +64,7 @@ class ResearcherManager:
                 continue
             
             researcher_class = self.MODULE_MAP[research_type]
-            researcher = researcher_class(self.entity_name, self.entity_type)
+            researcher = researcher_class(self.research_name, self.entity_type)
             
             if selected_providers:
                 # If specific providers are selected, we can pass them to the researcher
@@ -60,6 +72,8 @@ class ResearcherManager:
                 # We should update BaseResearcher to store it or pass it.
                 # For now, let's inject it into the researcher instance if it supports it.
                 researcher.selected_providers = selected_providers
+            researcher.use_search_cache = not bypass_cache
+            researcher.research_type = research_type
 
             data = await researcher.research()
             summary = researcher.generate_summary(data)
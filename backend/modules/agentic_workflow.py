@@ -8,21 +8,27 @@ Flow:
 2. EXECUTE: DeepResearcher performs searches with recursion
 3. VERIFY: Verifier cross-references and detects discrepancies  
 4. SYNTHESIZE: Synthesizer generates narrative report
+
+A run's plan and raw search results are snapshotted (FR-020), so steps
+2-4 can be re-run from the snapshot without searching again.
 """
 
 import asyncio
+import uuid
 from typing import Optional, Dict, Any
 from datetime import datetime
 
 from backend.models import (
     AgenticResearchRequest, ResearchPlan, ResearchProgress,
-    DepthLevel, WorkflowStatus
+    DepthLevel, WorkflowStatus, QuestionStatus
 )
 from backend.modules.planner import Planner, create_research_plan
 from backend.modules.deep_researcher import DeepResearcher, execute_research
 from backend.modules.verifier import Verifier, verify_findings
 from backend.modules.synthesizer import Synthesizer, generate_report, NarrativeReport
+from backend.utils.llm_scheduler import llm_request_id
 from backend.utils.logging_utils import get_logger, StageTimer, log_workflow_event
+from backend.utils.snapshots import get_snapshot_store
 
 
 logger = get_logger(__name__)
@@ -59,6 +65,8 @@ class AgenticWorkflow:
             NarrativeReport with complete research results
         """
         request_id = request.id
+        # Attribute this run's LLM calls for fair scheduling across concurrent runs
+        llm_request_id.set(request_id)
         
         # Initialize progress
         self._update_progress(request_id, WorkflowStatus.PENDING, "initializing", 0)
@@ -86,77 +94,157 @@ class AgenticWorkflow:
                 num_questions=len(plan.sub_questions)
             )
             
-            # ===== PHASE 2: EXECUTING =====
-            self._update_progress(request_id, WorkflowStatus.EXECUTING, "searching and extracting", 15)
-            if progress_callback:
-                await progress_callback(self.progress[request_id])
-            
-            findings = await self.researcher.execute_research(plan, request.depth_level)
-            
-            self._update_progress(
-                request_id, WorkflowStatus.EXECUTING, "search complete",
-                50, questions_completed=plan.completed_questions
-            )
-            
-            log_workflow_event(
-                logger, "execution_complete", request_id, "executing",
-                num_findings=len(findings)
-            )
+            # Keep the plan so the run can be re-synthesized from its search snapshot
+            snapshots = get_snapshot_store()
+            if snapshots is not None:
+                await asyncio.to_thread(snapshots.save_run, request, plan)
             
-            # ===== PHASE 3: VERIFYING =====
-            self._update_progress(request_id, WorkflowStatus.VERIFYING, "cross-referencing sources", 60)
-            if progress_callback:
-                await progress_callback(self.progress[request_id])
-            
-            verified_facts, discrepancies = await self.verifier.verify_findings(
-                findings, request_id
-            )
-            
-            self._update_progress(
-                request_id, WorkflowStatus.VERIFYING, "verification complete", 75
-            )
-            
-            log_workflow_event(
-                logger, "verification_complete", request_id, "verifying",
-                verified_facts=len(verified_facts), discrepancies=len(discrepancies)
-            )
-            
-            # ===== PHASE 4: SYNTHESIZING =====
-            self._update_progress(request_id, WorkflowStatus.SYNTHESIZING, "generating report", 80)
-            if progress_callback:
-                await progress_callback(self.progress[request_id])
+            return await self._execute_plan(request, plan, self.researcher, progress_callback)
             
-            report = await self.synthesizer.generate_report(
-                request_id=request_id,
-                query=request.query,
-                verified_facts=verified_facts,
-                discrepancies=discrepancies
-            )
-            
-            self._update_progress(
-                request_id, WorkflowStatus.COMPLETED, "complete", 100
-            )
+        except Exception as e:
+            self._record_failure(request_id, e)
+            raise
+    
+    async def resynthesize(
+        self,
+        source_request_id: str,
+        request_id: Optional[str] = None,
+        progress_callback: Optional[callable] = None
+    ) -> NarrativeReport:
+        """Re-run extraction, verification and synthesis from a run's search snapshot.
+        
+        The stored plan is reused and every search is answered from the
+        snapshot, so no search calls are made; useful after changing an
+        extraction or synthesis prompt or model.
+        
+        Args:
+            source_request_id: Run whose snapshot is replayed
+            request_id: ID of the new run (generated if omitted)
+            progress_callback: Optional callback for progress updates
             
-            log_workflow_event(
-                logger, "workflow_completed", request_id, "complete",
-                sections=len(report.sections), word_count=report.total_word_count
-            )
+        Returns:
+            NarrativeReport of the new run
             
+        Raises:
+            KeyError: If there is no snapshot for `source_request_id`
+        """
+        snapshots = get_snapshot_store()
+        snapshot = await asyncio.to_thread(snapshots.load_run, source_request_id) if snapshots is not None else None
+        if snapshot is None:
+            raise KeyError(f"No search snapshot for research request {source_request_id}")
+        
+        request_id = request_id or str(uuid.uuid4())
+        llm_request_id.set(request_id)
+        request = snapshot.request.model_copy(update={"id": request_id})
+        plan = snapshot.plan.model_copy(deep=True, update={"request_id": request_id})
+        for question in plan.sub_questions:
+            question.status = QuestionStatus.PENDING
+        
+        self._update_progress(
+            request_id, WorkflowStatus.PLANNING, "plan loaded from snapshot",
+            10, questions_total=len(plan.sub_questions)
+        )
+        log_workflow_event(
+            logger, "resynthesis_started", request_id, "init",
+            source_request_id=source_request_id, snapshot_questions=len(snapshot.questions)
+        )
+        
+        try:
+            researcher = DeepResearcher(replay=snapshot)
+            report = await self._execute_plan(request, plan, researcher, progress_callback)
+            if researcher.search_client.misses:
+                # New recursive topics (e.g. from a changed prompt) are not searched
+                logger.info(
+                    "snapshot_misses",
+                    request_id=request_id,
+                    misses=len(researcher.search_client.misses)
+                )
             return report
-            
         except Exception as e:
-            self._update_progress(
-                request_id, WorkflowStatus.FAILED, 
-                f"error: {str(e)[:50]}", 
-                self.progress.get(request_id, {}).get("progress_percent", 0)
-            )
-            
-            log_workflow_event(
-                logger, "workflow_failed", request_id, "error",
-                error=str(e)
-            )
+            self._record_failure(request_id, e)
             raise
     
+    async def _execute_plan(
+        self,
+        request: AgenticResearchRequest,
+        plan: ResearchPlan,
+        researcher: DeepResearcher,
+        progress_callback: Optional[callable] = None
+    ) -> NarrativeReport:
+        """Phases 2-4: execute the plan's searches, verify and synthesize."""
+        request_id = request.id
+        
+        # ===== PHASE 2: EXECUTING =====
+        self._update_progress(request_id, WorkflowStatus.EXECUTING, "searching and extracting", 15)
+        if progress_callback:
+            await progress_callback(self.progress[request_id])
+        
+        findings = await researcher.execute_research(plan, request.depth_level)
+        
+        self._update_progress(
+            request_id, WorkflowStatus.EXECUTING, "search complete",
+            50, questions_completed=plan.completed_questions
+        )
+        
+        log_workflow_event(
+            logger, "execution_complete", request_id, "executing",
+            num_findings=len(findings)
+        )
+        
+        # ===== PHASE 3: VERIFYING =====
+        self._update_progress(request_id, WorkflowStatus.VERIFYING, "cross-referencing sources", 60)
+        if progress_callback:
+            await progress_callback(self.progress[request_id])
+        
+        verified_facts, discrepancies = await self.verifier.verify_findings(
+            findings, request_id
+        )
+        
+        self._update_progress(
+            request_id, WorkflowStatus.VERIFYING, "verification complete", 75
+        )
+        
+        log_workflow_event(
+            logger, "verification_complete", request_id, "verifying",
+            verified_facts=len(verified_facts), discrepancies=len(discrepancies)
+        )
+        
+        # ===== PHASE 4: SYNTHESIZING =====
+        self._update_progress(request_id, WorkflowStatus.SYNTHESIZING, "generating report", 80)
+        if progress_callback:
+            await progress_callback(self.progress[request_id])
+        
+        report = await self.synthesizer.generate_report(
+            request_id=request_id,
+            query=request.query,
+            verified_facts=verified_facts,
+            discrepancies=discrepancies
+        )
+        
+        self._update_progress(
+            request_id, WorkflowStatus.COMPLETED, "complete", 100
+        )
+        
+        log_workflow_event(
+            logger, "workflow_completed", request_id, "complete",
+            sections=len(report.sections), word_count=report.total_word_count
+        )
+        
+        return report
+    
+    def _record_failure(self, request_id: str, error: Exception):
+        """Mark a request as failed in progress tracking and the log."""
+        self._update_progress(
+            request_id, WorkflowStatus.FAILED, 
+            f"error: {str(error)[:50]}", 
+            self.progress.get(request_id, {}).get("progress_percent", 0)
+        )
+        
+        log_workflow_event(
+            logger, "workflow_failed", request_id, "error",
+            error=str(error)
+        )
+    
     def _update_progress(
         self,
         request_id: str,
@@ -4,7 +4,10 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
 import json
 import asyncio
-from backend.utils.search import get_search_results
+from backend.config import settings
+from backend.utils.search import gather_attributed_results
+from backend.utils.dedup import dedupe_result_dicts
+from backend.utils.provider_yield import get_yield_tracker, cited_results
 from backend.utils.llm import llm_service
 
 
@@ -16,6 +19,8 @@ class BaseResearcher(ABC):
         self.entity_type = entity_type
         self.search_provider = search_provider
         self.selected_providers: Optional[List[str]] = None
+        self.use_search_cache: bool = True
+        self.research_type: Optional[str] = None  # Set by ResearcherManager; keys the learned provider yields
     
     @abstractmethod
     async def research(self) -> Dict[str, Any]:
@@ -78,25 +83,31 @@ class BaseResearcher(ABC):
             providers = ["duckduckgo", "google_news", "wikipedia"]
 
         # Limit total results to avoid overwhelming context window, but gather from multiple queries
-        all_results = []
-        for query in queries:
-            results = get_search_results(query, limit=3, providers=providers)
-            all_results.extend(results)
-
-        # Deduplicate results by URL or Title
-        seen = set()
-        unique_results = []
-        for res in all_results:
-            identifier = res.get('url') or res.get('title')
-            if identifier and identifier not in seen:
-                seen.add(identifier)
-                unique_results.append(res)
+        limit = 3
+        limits = None
+        tracker = get_yield_tracker() if self.research_type else None
+        if tracker is not None:
+            # Providers whose results get cited for this research type go first, with more results
+            plan = tracker.plan(self.research_type, providers, limit)
+            providers = [name for name, _ in plan]
+            limits = dict(plan)
+
+        pairs = await gather_attributed_results(
+            queries, limit=limit, providers=providers, use_cache=self.use_search_cache, limits=limits
+        )
+        all_results = [dict(result, provider=name) for name, result in pairs]
+
+        # Collapse syndicated copies, redirect/AMP/tracking variants and exact repeats
+        if settings.DEDUP_ENABLED:
+            unique_results = dedupe_result_dicts(all_results)
+        else:
+            unique_results = all_results
 
         # 3. Prepare Context
         context = ""
         for item in unique_results:
             context += f"Source: {item.get('source')} - Title: {item.get('title')}\n"
-            context += f"URL: {item.get('url', 'N/A')}\n"
+            context += f"URL: {item.get('link') or item.get('url', 'N/A')}\n"
             context += f"Snippet: {item.get('snippet', 'No snippet')}\n"
             context += "---\n"
 
@@ -105,12 +116,27 @@ class BaseResearcher(ABC):
 
         # 4. Synthesize
         data = await self._synthesize_report(context, schema)
+        if tracker is not None:
+            self._record_yield(tracker, unique_results, data.get("key_sources"))
 
         # Ensure we return the raw results for the frontend source list
         data["_raw_search_results"] = unique_results
 
         return data
 
+    def _record_yield(self, tracker, results: List[Dict[str, Any]], key_sources: Any):
+        """Count each provider's results and how many of them the report cites."""
+        if not isinstance(key_sources, list):
+            key_sources = [key_sources] if key_sources else []
+        served: Dict[str, int] = {}
+        cited: Dict[str, int] = {}
+        for result, is_cited in zip(results, cited_results(results, key_sources)):
+            provider = result.get("provider")
+            served[provider] = served.get(provider, 0) + 1
+            if is_cited:
+                cited[provider] = cited.get(provider, 0) + 1
+        tracker.record(self.research_type, served, cited)
+
     def generate_summary(self, data: Dict[str, Any]) -> str:
         """
         Generate a summary from the research data.
@@ -7,7 +7,8 @@ Per FR-004: System MUST implement a recursion depth limit (default: 2-3 levels).
 
 import uuid
 import asyncio
-from typing import List, Dict, Any, Optional, Set
+from contextlib import aclosing
+from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 
@@ -16,6 +17,11 @@ from backend.models import (
 )
 from backend.utils.llm_utils import get_llm_client, TaskType
 from backend.utils.search_utils import get_search_client, SearchResult
+from backend.utils.dedup import DuplicateIndex
+from backend.utils.relevance import rank_results
+from backend.utils.page_fetcher import get_page_fetcher
+from backend.utils.provider_yield import get_yield_tracker, DEEP_RESEARCH
+from backend.utils.snapshots import get_snapshot_store, RunSnapshot, SnapshotSearchClient
 from backend.utils.logging_utils import get_logger, StageTimer
 from backend.config import settings
 
@@ -38,6 +44,12 @@ class ResearchFinding:
     confidence: float = 0.8
     triggers_recursion: bool = False
     recursion_topics: List[str] = None
+    alternate_source_urls: List[str] = None  # Duplicate copies of the source, for citations
+    
+    @property
+    def source_urls(self) -> List[str]:
+        """The source URL followed by the URLs of its duplicate copies."""
+        return [self.source_url] + list(self.alternate_source_urls or [])
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -49,7 +61,8 @@ class ResearchFinding:
             "extraction_timestamp": self.extraction_timestamp.isoformat(),
             "confidence": self.confidence,
             "triggers_recursion": self.triggers_recursion,
-            "recursion_topics": self.recursion_topics or []
+            "recursion_topics": self.recursion_topics or [],
+            "alternate_source_urls": self.alternate_source_urls or []
         }
 
 
@@ -77,6 +90,39 @@ Respond with valid JSON:
   "new_topics_to_research": ["topic1", "topic2"] or []
 }}"""
 
+BATCH_EXTRACTION_PROMPT = """Extract key facts and information from each of these search results to answer the question.
+
+Question: {question}
+
+Search Results:
+{results}
+
+Instructions:
+1. For each result, extract factual information that answers the question
+2. Keep every fact with the result it came from; use [] for a result with nothing relevant
+3. Identify any new topics or entities that should be researched further
+4. Rate your confidence in each result's extracted information (0.0-1.0)
+
+Respond with valid JSON with one entry per result ID:
+{{
+  "results": [
+    {{
+      "id": "R1",
+      "extracted_facts": [
+        "fact 1",
+        "fact 2"
+      ],
+      "confidence": 0.8,
+      "new_topics_to_research": ["topic1", "topic2"] or []
+    }}
+  ]
+}}"""
+
+BATCH_RESULT_TEMPLATE = """[{id}]
+Title: {title}
+URL: {url}
+Content: {content}"""
+
 
 class DeepResearcher:
     """Deep Researcher module with recursive search capability.
@@ -85,9 +131,17 @@ class DeepResearcher:
     to explore topics thoroughly while preventing infinite loops.
     """
     
-    def __init__(self, max_depth: int = None):
+    def __init__(self, max_depth: int = None, replay: Optional[RunSnapshot] = None):
+        """Initialize the researcher.
+        
+        Args:
+            max_depth: Recursion depth limit
+            replay: Snapshot of an earlier run; its stored results and pages are used
+                instead of searching and fetching, and nothing new is recorded
+        """
         self.llm_client = get_llm_client()
-        self.search_client = get_search_client()
+        self.replay = replay
+        self.search_client = SnapshotSearchClient(replay) if replay is not None else get_search_client()
         self.max_depth = max_depth or settings.MAX_RECURSION_DEPTH
         self.visited_topics: Set[str] = set()  # Prevent duplicate searches
     
@@ -125,7 +179,7 @@ class DeepResearcher:
                 question.status = QuestionStatus.IN_PROGRESS
                 
                 try:
-                    findings = await self._research_question(question, depth=0)
+                    findings = await self._research_question(question, depth=0, request_id=plan.request_id)
                     all_findings.extend(findings)
                     question.status = QuestionStatus.COMPLETED
                     
@@ -149,13 +203,15 @@ class DeepResearcher:
     async def _research_question(
         self,
         question: SubQuestion,
-        depth: int
+        depth: int,
+        request_id: Optional[str] = None
     ) -> List[ResearchFinding]:
         """Research a single question with potential recursion.
         
         Args:
             question: The sub-question to research
             depth: Current recursion depth
+            request_id: Run the question belongs to; its search results are snapshotted under it
             
         Returns:
             List of findings for this question
@@ -177,100 +233,375 @@ class DeepResearcher:
         self.visited_topics.add(normalized_query)
         
         findings: List[ResearchFinding] = []
+        duplicates = DuplicateIndex()
+        # Finding extracted from each duplicate cluster's representative
+        cluster_findings: Dict[int, ResearchFinding] = {}
+        candidates: List[Tuple[Optional[int], SearchResult]] = []
+        received = 0
+        processed = 0
+        provider_of: Dict[str, str] = {}  # Unique result URL -> provider, for yield tracking
+        extracted_urls: Set[str] = set()  # Results passed to extraction; only these count as served
+        # Raw results (duplicates included) and page text, kept for the run's snapshot (FR-020)
+        snapshots = get_snapshot_store() if self.replay is None and request_id else None
+        raw_results: List[Dict[str, Any]] = []
+        pages_used: Dict[str, str] = {}
         
-        # Execute search
-        search_results = await self.search_client.search_all_providers(
+        # Without ranking, extraction starts on each result as soon as it arrives
+        # while slower providers are still responding. Ranking needs every result
+        # to score them against each other.
+        search_results = self.search_client.stream_all_providers(
             query=question.text,
-            max_results_per_provider=settings.MAX_SEARCH_RESULTS_PER_QUERY
+            max_results_per_provider=settings.MAX_SEARCH_RESULTS_PER_QUERY,
+            research_type=DEEP_RESEARCH
         )
+        async with aclosing(search_results):
+            async for result in search_results:
+                received += 1
+                if snapshots is not None:
+                    raw_results.append(result.to_dict())
+                cluster_index = None
+                if settings.DEDUP_ENABLED:
+                    cluster_index, is_new = duplicates.add(result.url, result.title, result.snippet)
+                    if not is_new:
+                        # Same document as an earlier result: keep its URL for citations only
+                        logger.debug("skipping_duplicate_result", question_id=question.id, url=result.url)
+                        continue
+                provider_of[result.url] = result.source.value
+                
+                if settings.RELEVANCE_RANKING_ENABLED:
+                    candidates.append((cluster_index, result))
+                    continue
+                
+                processed += 1
+                extracted_urls.add(result.url)
+                pages = await self._fetch_pages([result])
+                pages_used.update(pages)
+                findings.extend(await self._process_result(
+                    question, result, depth, cluster_index, cluster_findings, pages.get(result.url), request_id
+                ))
+                
+                # Limit processed results to avoid rate limits; the rest of the search is cancelled
+                if processed >= settings.MAX_SEARCH_RESULTS_PER_QUERY:
+                    break
         
-        if not search_results:
+        if candidates:
+            # Only the top-k most relevant results go to the LLM
+            cluster_of = {id(result): cluster_index for cluster_index, result in candidates}
+            ranked = rank_results(question.text, [result for _, result in candidates])
+            logger.debug(
+                "search_results_ranked",
+                question_id=question.id,
+                candidates=len(candidates),
+                selected=len(ranked)
+            )
+            extracted_urls.update(result.url for result in ranked)
+            pages = await self._fetch_pages(ranked)
+            pages_used.update(pages)
+            if settings.EXTRACTION_BATCH_ENABLED:
+                for batch in self._extraction_batches(ranked, pages):
+                    extracted = await self._extract_batch(question, batch, pages)
+                    for result, finding in zip(batch, extracted):
+                        findings.extend(await self._follow_finding(
+                            question, result, finding, depth, cluster_of[id(result)], cluster_findings, request_id
+                        ))
+            else:
+                for result in ranked:
+                    findings.extend(await self._process_result(
+                        question, result, depth, cluster_of[id(result)], cluster_findings,
+                        pages.get(result.url), request_id
+                    ))
+        
+        if snapshots is not None:
+            await asyncio.to_thread(snapshots.save_question, request_id, question, raw_results, pages_used)
+        
+        if received == 0:
             logger.warning(
                 "no_search_results",
                 question_id=question.id,
                 query=question.text[:50]
             )
-            return findings
         
-        # Process each search result (limit to avoid rate limits)
-        for result in search_results[:settings.MAX_SEARCH_RESULTS_PER_QUERY]:
-            try:
-                finding = await self._extract_from_result(question, result)
-                if finding:
-                    findings.append(finding)
+        # A replay re-reads stored results; counting them again would skew the learned yields
+        tracker = get_yield_tracker() if self.replay is None else None
+        if tracker is not None and extracted_urls:
+            # A result paid off if extraction got facts out of it (recursive findings answer other questions).
+            # Results ranking dropped were never extracted, so they count neither way.
+            served: Dict[str, int] = {}
+            useful: Dict[str, int] = {}
+            for url in extracted_urls:
+                served[provider_of[url]] = served.get(provider_of[url], 0) + 1
+            for url in {f.source_url for f in findings if f.question_id == question.id and f.source_url in extracted_urls}:
+                useful[provider_of[url]] = useful.get(provider_of[url], 0) + 1
+            tracker.record(DEEP_RESEARCH, served, useful)
+        
+        # Duplicate copies stay citable as alternate sources of the extracted finding
+        for cluster_index, finding in cluster_findings.items():
+            finding.alternate_source_urls = [
+                url for url in duplicates.clusters[cluster_index].urls if url != finding.source_url
+            ]
+        
+        return findings
+    
+    async def _fetch_pages(self, results: List[SearchResult]) -> Dict[str, str]:
+        """Main text of the results' pages, when page fetching is enabled.
+        
+        Returns:
+            Page text by result URL; results whose page could not be fetched are absent
+        """
+        if self.replay is not None:
+            stored = self.replay.pages
+            return {result.url: stored[result.url] for result in results if result.url in stored}
+        fetcher = get_page_fetcher()
+        if fetcher is None or not results:
+            return {}
+        return await fetcher.fetch_many([result.url for result in results])
+    
+    async def _process_result(
+        self,
+        question: SubQuestion,
+        result: SearchResult,
+        depth: int,
+        cluster_index: Optional[int],
+        cluster_findings: Dict[int, ResearchFinding],
+        page_text: Optional[str] = None,
+        request_id: Optional[str] = None
+    ) -> List[ResearchFinding]:
+        """Extract from one result and follow its recursive topics.
+
+        Returns:
+            The finding (if any) followed by findings from recursive searches
+        """
+        try:
+            finding = await self._extract_from_result(question, result, page_text)
+        except Exception as e:
+            logger.error(
+                "extraction_failed",
+                question_id=question.id,
+                url=result.url,
+                error=str(e)
+            )
+            return []
+        return await self._follow_finding(
+            question, result, finding, depth, cluster_index, cluster_findings, request_id
+        )
+
+    async def _follow_finding(
+        self,
+        question: SubQuestion,
+        result: SearchResult,
+        finding: Optional[ResearchFinding],
+        depth: int,
+        cluster_index: Optional[int],
+        cluster_findings: Dict[int, ResearchFinding],
+        request_id: Optional[str] = None
+    ) -> List[ResearchFinding]:
+        """Keep a result's finding and follow its recursive topics.
+
+        Returns:
+            The finding (if any) followed by findings from recursive searches
+        """
+        findings: List[ResearchFinding] = []
+        try:
+            if finding:
+                findings.append(finding)
+                if cluster_index is not None:
+                    cluster_findings[cluster_index] = finding
+                
+                # Check for recursive topics (per FR-003)
+                if finding.triggers_recursion and depth < self.max_depth:
+                    recursive_findings = await self._handle_recursion(
+                        finding, question.id, depth + 1, request_id
+                    )
+                    findings.extend(recursive_findings)
                     
-                    # Check for recursive topics (per FR-003)
-                    if finding.triggers_recursion and depth < self.max_depth:
-                        recursive_findings = await self._handle_recursion(
-                            finding, question.id, depth + 1
-                        )
-                        findings.extend(recursive_findings)
-                        
-            except Exception as e:
-                logger.error(
-                    "extraction_failed",
-                    question_id=question.id,
-                    url=result.url,
-                    error=str(e)
-                )
+        except Exception as e:
+            logger.error(
+                "extraction_failed",
+                question_id=question.id,
+                url=result.url,
+                error=str(e)
+            )
         
         return findings
     
     async def _extract_from_result(
         self,
         question: SubQuestion,
-        result: SearchResult
+        result: SearchResult,
+        page_text: Optional[str] = None
     ) -> Optional[ResearchFinding]:
         """Extract information from a search result.
         
         Args:
             question: The question being answered
             result: The search result to extract from
+            page_text: Main text of the result's page, used instead of the snippet when available
             
         Returns:
             ResearchFinding or None if extraction failed
         """
+        # Page text is already capped at PAGE_TEXT_MAX_CHARS
+        content = self._extraction_content(result, page_text)
         prompt = EXTRACTION_PROMPT.format(
             question=question.text,
             title=result.title,
             url=result.url,
-            content=result.snippet[:1000]  # Limit content length
+            content=content
         )
         
         try:
             response = await self.llm_client.complete_json(
                 prompt=prompt,
                 task_type=TaskType.EXTRACTION,
-                temperature=0.3  # Lower temperature for factual extraction
-            )
-            
-            extracted_facts = response.get("extracted_facts", [])
-            if not extracted_facts:
-                return None
-            
-            new_topics = response.get("new_topics_to_research", [])
-            
-            return ResearchFinding(
-                id=str(uuid.uuid4()),
-                question_id=question.id,
-                content=" ".join(extracted_facts),
-                source_url=result.url,
-                source_title=result.title,
-                extraction_timestamp=datetime.now(),
-                confidence=response.get("confidence", 0.7),
-                triggers_recursion=len(new_topics) > 0,
-                recursion_topics=new_topics[:3]  # Limit recursion topics
+                temperature=0.3,  # Lower temperature for factual extraction
+                semantic_text=question.text,
+                semantic_scope=f"{result.url}\n{result.title}\n{content}"
             )
+            return self._finding_from_response(question, result, response)
             
         except Exception as e:
             logger.error("llm_extraction_failed", error=str(e))
             return None
+
+    @staticmethod
+    def _extraction_content(result: SearchResult, page_text: Optional[str]) -> str:
+        """Text extraction reads for a result: its page text, else its snippet."""
+        return page_text or result.snippet[:1000]  # Limit content length
+
+    @staticmethod
+    def _finding_from_response(
+        question: SubQuestion,
+        result: SearchResult,
+        response: Dict[str, Any]
+    ) -> Optional[ResearchFinding]:
+        """Build the finding for one result's extraction response; None without facts."""
+        extracted_facts = response.get("extracted_facts", [])
+        if not extracted_facts:
+            return None
+
+        new_topics = response.get("new_topics_to_research", [])
+
+        return ResearchFinding(
+            id=str(uuid.uuid4()),
+            question_id=question.id,
+            content=" ".join(extracted_facts),
+            source_url=result.url,
+            source_title=result.title,
+            extraction_timestamp=datetime.now(),
+            confidence=response.get("confidence", 0.7),
+            triggers_recursion=len(new_topics) > 0,
+            recursion_topics=new_topics[:3]  # Limit recursion topics
+        )
+
+    def _extraction_batches(
+        self,
+        results: List[SearchResult],
+        pages: Dict[str, str]
+    ) -> List[List[SearchResult]]:
+        """Split results into batches of at most EXTRACTION_BATCH_SIZE results
+        and EXTRACTION_BATCH_MAX_CHARS of content, keeping their order."""
+        batches: List[List[SearchResult]] = []
+        batch: List[SearchResult] = []
+        chars = 0
+        for result in results:
+            size = len(self._extraction_content(result, pages.get(result.url)))
+            if batch and (len(batch) >= settings.EXTRACTION_BATCH_SIZE
+                          or chars + size > settings.EXTRACTION_BATCH_MAX_CHARS):
+                batches.append(batch)
+                batch, chars = [], 0
+            batch.append(result)
+            chars += size
+        if batch:
+            batches.append(batch)
+        return batches
+
+    @staticmethod
+    def _valid_batch_item(item: Any) -> bool:
+        """Whether one entry of a batch response has the shape of a single-result response."""
+        if not isinstance(item, dict):
+            return False
+        facts = item.get("extracted_facts")
+        topics = item.get("new_topics_to_research", [])
+        confidence = item.get("confidence", 0.7)
+        return (
+            isinstance(facts, list) and all(isinstance(fact, str) for fact in facts)
+            and isinstance(topics, list) and all(isinstance(topic, str) for topic in topics)
+            and isinstance(confidence, (int, float)) and not isinstance(confidence, bool)
+        )
+
+    async def _extract_batch(
+        self,
+        question: SubQuestion,
+        results: List[SearchResult],
+        pages: Dict[str, str]
+    ) -> List[Optional[ResearchFinding]]:
+        """Extract from several results for the same question in one LLM call.
+
+        Each result is labelled R1, R2, ... in the prompt and the response
+        carries facts, confidence and recursion topics per ID. Results whose
+        entry is missing or malformed (or all of them, if the call fails)
+        are extracted again with a single-result call.
+
+        Returns:
+            One finding (or None) per result, in order
+        """
+        if len(results) == 1:
+            return [await self._extract_from_result(question, results[0], pages.get(results[0].url))]
+
+        ids = [f"R{n}" for n in range(1, len(results) + 1)]
+        contents = [self._extraction_content(result, pages.get(result.url)) for result in results]
+        prompt = BATCH_EXTRACTION_PROMPT.format(
+            question=question.text,
+            results="\n\n".join(
+                BATCH_RESULT_TEMPLATE.format(id=item_id, title=result.title, url=result.url, content=content)
+                for item_id, result, content in zip(ids, results, contents)
+            )
+        )
+
+        items: Dict[str, Dict[str, Any]] = {}
+        try:
+            response = await self.llm_client.complete_json(
+                prompt=prompt,
+                task_type=TaskType.EXTRACTION,
+                temperature=0.3,  # Lower temperature for factual extraction
+                # Room for every result's facts
+                max_tokens=max(2000, settings.EXTRACTION_BATCH_TOKENS_PER_RESULT * len(results)),
+                semantic_text=question.text,
+                semantic_scope="\n".join(
+                    f"{result.url}\n{result.title}\n{content}" for result, content in zip(results, contents)
+                )
+            )
+            entries = response.get("results") if isinstance(response, dict) else None
+            for entry in entries if isinstance(entries, list) else []:
+                if isinstance(entry, dict) and str(entry.get("id", "")).strip("[] ") in ids:
+                    items.setdefault(str(entry["id"]).strip("[] "), entry)
+        except Exception as e:
+            logger.error("llm_batch_extraction_failed", question_id=question.id, batch_size=len(results), error=str(e))
+
+        findings: List[Optional[ResearchFinding]] = []
+        fallbacks = 0
+        for item_id, result in zip(ids, results):
+            item = items.get(item_id)
+            if self._valid_batch_item(item):
+                findings.append(self._finding_from_response(question, result, item))
+            else:
+                fallbacks += 1
+                findings.append(await self._extract_from_result(question, result, pages.get(result.url)))
+
+        logger.info(
+            "batch_extraction_complete",
+            question_id=question.id,
+            batch_size=len(results),
+            fallbacks=fallbacks
+        )
+        return findings
     
     async def _handle_recursion(
         self,
         finding: ResearchFinding,
         parent_question_id: str,
-        new_depth: int
+        new_depth: int,
+        request_id: Optional[str] = None
     ) -> List[ResearchFinding]:
         """Handle recursive search for new topics.
         
@@ -280,6 +611,7 @@ class DeepResearcher:
             finding: The finding with new topics
             parent_question_id: ID of the parent question
             new_depth: Depth level for recursive questions
+            request_id: Run the recursive questions belong to
             
         Returns:
             List of findings from recursive searches
@@ -306,7 +638,7 @@ class DeepResearcher:
             )
             
             # Execute recursive research
-            findings = await self._research_question(recursive_question, new_depth)
+            findings = await self._research_question(recursive_question, new_depth, request_id)
             recursive_findings.extend(findings)
         
         return recursive_findings
@@ -2,7 +2,7 @@
 
 from typing import Dict, Any, List
 from .base import BaseResearcher
-from backend.utils.search import get_search_results
+from backend.utils.search import get_search_results_async
 from backend.utils.llm import llm_service
 
 class NewsResearcher(BaseResearcher):
@@ -13,7 +13,9 @@ class NewsResearcher(BaseResearcher):
         
         # 1. Get real news
         # We prefer google_news for this specific module
-        news_results = get_search_results(self.entity_name, limit=10, providers=["google_news"])
+        news_results = await get_search_results_async(
+            self.entity_name, limit=10, providers=["google_news"], use_cache=self.use_search_cache
+        )
         
         # Transform basic news items
         news_items = []
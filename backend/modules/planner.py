@@ -142,42 +142,52 @@ Query: {query}
 Generate {min_questions}-{max_questions} sub-questions that comprehensively cover this topic."""
         
         try:
+            # A rejected plan is dropped from the LLM caches, so a retry asks the LLM again
             response = await self.llm_client.complete_json(
                 prompt=user_prompt,
                 task_type=TaskType.PLANNING,
                 system_prompt=system_prompt,
-                temperature=0.7
+                temperature=0.7,
+                semantic_text=query,
+                validate=lambda response: self._parse_sub_questions(response, min_questions)
             )
-            
-            sub_questions = []
-            for i, sq in enumerate(response.get("sub_questions", [])):
-                sub_questions.append(SubQuestion(
-                    id=str(uuid.uuid4()),
-                    text=sq["text"],
-                    priority=sq.get("priority", i + 1),
-                    parent_id=None,
-                    depth=0,
-                    status=QuestionStatus.PENDING,
-                    created_at=datetime.now()
-                ))
-            
-            # Validate we have sufficient questions
-            if len(sub_questions) < min_questions:
-                logger.warning(
-                    "insufficient_questions_generated",
-                    generated=len(sub_questions),
-                    minimum=min_questions
-                )
-                raise PlanningError(
-                    f"LLM generated only {len(sub_questions)} questions, minimum required: {min_questions}"
-                )
-            
+            sub_questions = self._parse_sub_questions(response, min_questions)
             return sub_questions[:max_questions]  # Cap at max
             
         except Exception as e:
             logger.error("sub_question_generation_failed", error=str(e))
             raise PlanningError(f"Failed to generate research plan: {str(e)}") from e
     
+    def _parse_sub_questions(self, response: dict, min_questions: int) -> List[SubQuestion]:
+        """Build sub-questions from the LLM response.
+        
+        Raises:
+            PlanningError: If the response has fewer than `min_questions`
+        """
+        sub_questions = []
+        for i, sq in enumerate(response.get("sub_questions", [])):
+            sub_questions.append(SubQuestion(
+                id=str(uuid.uuid4()),
+                text=sq["text"],
+                priority=sq.get("priority", i + 1),
+                parent_id=None,
+                depth=0,
+                status=QuestionStatus.PENDING,
+                created_at=datetime.now()
+            ))
+        
+        # Validate we have sufficient questions
+        if len(sub_questions) < min_questions:
+            logger.warning(
+                "insufficient_questions_generated",
+                generated=len(sub_questions),
+                minimum=min_questions
+            )
+            raise PlanningError(
+                f"LLM generated only {len(sub_questions)} questions, minimum required: {min_questions}"
+            )
+        return sub_questions
+    
     def _generate_fallback_questions(self, query: str, count: int) -> List[SubQuestion]:
         """Generate basic fallback questions if LLM fails.
         
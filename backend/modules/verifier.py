@@ -18,6 +18,11 @@ from backend.config import settings
 logger = get_logger(__name__)
 
 
+def _source_urls(finding: Any) -> List[str]:
+    """A finding's source URL plus the URLs of duplicate copies merged into it."""
+    return [finding.source_url] + list(getattr(finding, "alternate_source_urls", None) or [])
+
+
 @dataclass
 class VerifiedFact:
     """A fact that has been verified against multiple sources.
@@ -179,7 +184,7 @@ class Verifier:
             id=str(uuid.uuid4()),
             claim=finding.content,
             confidence=min(finding.confidence * 0.7, 0.6),  # Reduce confidence for single source
-            source_urls=[finding.source_url],
+            source_urls=_source_urls(finding),
             source_count=1,
             is_consistent=True,
             verification_notes="Single source - not cross-verified"
@@ -227,7 +232,10 @@ class Verifier:
             # Process verified facts
             for vf in response.get("verified_facts", []):
                 # Find which sources support this fact
+                # Independent sources first, then duplicate copies of them
                 supporting_sources = [f.source_url for f in findings]
+                for f in findings:
+                    supporting_sources += [url for url in _source_urls(f) if url not in supporting_sources]
                 
                 verified_facts.append(VerifiedFact(
                     id=str(uuid.uuid4()),
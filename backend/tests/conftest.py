@@ -1,7 +1,120 @@
+import json
+from types import SimpleNamespace
+
 import pytest
 from httpx import AsyncClient
+from backend.config import settings
 from backend.main import app
 
+
+@pytest.fixture(autouse=True)
+def _disable_search_cache(monkeypatch):
+    """Keep tests off the shared on-disk search cache."""
+    monkeypatch.setattr(settings, "SEARCH_CACHE_ENABLED", False)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_provider_health(monkeypatch):
+    """Give each test its own provider health scoreboard."""
+    monkeypatch.setattr("backend.utils.provider_health._health_board", None)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_rate_limiter(monkeypatch):
+    """Give each test full token buckets and empty queues."""
+    monkeypatch.setattr("backend.utils.rate_limit._search_limiter", None)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_llm_scheduler(monkeypatch):
+    """Give each test full LLM budgets and empty queues."""
+    monkeypatch.setattr("backend.utils.llm_scheduler._llm_scheduler", None)
+
+
+@pytest.fixture(autouse=True)
+def _in_memory_entity_aliases(monkeypatch):
+    """Keep tests off the shared on-disk alias table."""
+    monkeypatch.setattr(settings, "ENTITY_ALIAS_PATH", "")
+    monkeypatch.setattr("backend.utils.entities._entity_resolver", None)
+
+
+@pytest.fixture(autouse=True)
+def _no_page_cache(monkeypatch):
+    """Keep tests off the shared on-disk page cache."""
+    monkeypatch.setattr(settings, "PAGE_CACHE_PATH", "")
+    monkeypatch.setattr("backend.utils.page_fetcher._page_fetcher", None)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_feed_cache(monkeypatch):
+    """Give each test an empty feed validator cache."""
+    monkeypatch.setattr("backend.utils.feed_cache._feed_cache", None)
+
+
+@pytest.fixture(autouse=True)
+def _in_memory_provider_yield(monkeypatch):
+    """Keep learned provider yields in memory and per test."""
+    monkeypatch.setattr(settings, "PROVIDER_YIELD_PATH", "")
+    monkeypatch.setattr("backend.utils.provider_yield._yield_tracker", None)
+
+
+@pytest.fixture(autouse=True)
+def _no_snapshots(monkeypatch):
+    """Keep tests off the shared on-disk search snapshots."""
+    monkeypatch.setattr(settings, "SNAPSHOT_PATH", "")
+    monkeypatch.setattr("backend.utils.snapshots._snapshot_store", None)
+
+
+@pytest.fixture(autouse=True)
+def _in_memory_llm_cache(monkeypatch):
+    """Keep cached LLM responses in memory and per test."""
+    monkeypatch.setattr(settings, "LLM_CACHE_PATH", "")
+    monkeypatch.setattr("backend.utils.llm_cache._llm_cache", None)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_semantic_cache(monkeypatch):
+    """Give each test an empty semantic LLM cache."""
+    monkeypatch.setattr("backend.utils.semantic_cache._semantic_cache", None)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_ddgs(monkeypatch):
+    """Give each test its own shared DuckDuckGo session."""
+    monkeypatch.setattr("backend.utils.search_providers.ddg._ddgs", None)
+
+
+class FakeDDGUpstream:
+    """DuckDuckGo as seen by a real DDGS session's HTTP client.
+
+    Set `down` to answer every request with a 503.
+    """
+
+    def __init__(self):
+        self.down = False
+        self.requests = 0
+
+    def client(self, **kwargs):
+        return self
+
+    def request(self, method, url, params=None, **kwargs):
+        self.requests += 1
+        if self.down:
+            return SimpleNamespace(status_code=503, content=b"", url=url)
+        if "d.js" in url:
+            rows = json.dumps([{"u": "https://example.com/tesla", "t": "Tesla", "a": "Tesla, Inc. makes cars"}])
+            return SimpleNamespace(status_code=200, content=f"DDG.pageLayout.load('d',{rows});DDG.end".encode(), url=url)
+        return SimpleNamespace(status_code=200, content=b'vqd="4-1234"', url=url)
+
+
+@pytest.fixture
+def ddg_upstream(monkeypatch):
+    """Route real DDGS sessions to a FakeDDGUpstream."""
+    upstream = FakeDDGUpstream()
+    monkeypatch.setattr("duckduckgo_search.duckduckgo_search.primp.Client", upstream.client)
+    return upstream
+
+
 @pytest.fixture
 async def client():
     async with AsyncClient(app=app, base_url="http://test") as ac:
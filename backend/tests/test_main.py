@@ -21,3 +21,20 @@ async def test_list_modules(client):
     first_module = data[0]
     assert "id" in first_module
     assert "name" in first_module
+
+@pytest.mark.asyncio
+async def test_entity_aliases(client):
+    response = await client.post("/api/v1/entities/aliases", json={"alias": "TSLA", "canonical": "Tesla, Inc."})
+    assert response.status_code == 200
+    assert response.json()["entity_key"] == "tesla"
+
+    response = await client.get("/api/v1/entities/aliases")
+    assert response.json()["entities"]["tesla"] == ["tesla", "tesla inc", "tsla"]
+
+@pytest.mark.asyncio
+async def test_resynthesize_requires_snapshot(client):
+    response = await client.post("/api/research/unknown-run/resynthesize")
+    assert response.status_code == 404
+
+    response = await client.get("/api/research/unknown-run/snapshot")
+    assert response.status_code == 404
@@ -28,7 +28,7 @@ async def test_financial_researcher_structure():
 
 @pytest.mark.asyncio
 async def test_news_researcher_structure():
-    with patch("backend.modules.news.get_search_results") as mock_search:
+    with patch("backend.modules.news.get_search_results_async") as mock_search:
         mock_search.return_value = [
             {"title": "Test News 1", "source": "Source A", "link": "http://a.com"},
             {"title": "Test News 2", "source": "Source B", "link": "http://b.com"}
@@ -1,5 +1,11 @@
+import time
 import pytest
-from backend.utils.search import get_search_results
+from unittest.mock import patch
+from backend.utils.search import (
+    PROVIDER_MAP, get_search_results, get_search_results_async, gather_search_results,
+    stream_search_results
+)
+from backend.utils.search_providers.base import BaseSearchProvider
 from backend.utils.search_providers.google import GoogleNewsProvider
 from backend.utils.search_providers.linkedin import LinkedInProvider
 from backend.utils.search_providers.wikipedia import WikipediaProvider
@@ -31,3 +37,74 @@ async def test_search_integration():
     if results:
         assert results[0]["source"] == "Wikipedia"
         assert "Python" in results[0]["title"]
+
+
+class _SleepyProvider(BaseSearchProvider):
+    """Fake provider whose blocking search sleeps before answering."""
+
+    delay = 0.2
+
+    @property
+    def name(self) -> str:
+        return "Sleepy"
+
+    def search(self, query, limit=5):
+        time.sleep(self.delay)
+        return [{"title": f"{query} result", "link": f"http://sleepy/{query}", "source": self.name}]
+
+
+class _StuckProvider(_SleepyProvider):
+    delay = 2.0
+
+    @property
+    def name(self) -> str:
+        return "Stuck"
+
+
+@pytest.mark.asyncio
+async def test_gather_search_results_runs_pairs_concurrently():
+    with patch.dict(PROVIDER_MAP, {"sleepy_a": _SleepyProvider, "sleepy_b": _SleepyProvider}):
+        start = time.perf_counter()
+        results = await gather_search_results(
+            ["q1", "q2", "q3"], providers=["sleepy_a", "sleepy_b"], max_concurrency=6
+        )
+        elapsed = time.perf_counter() - start
+
+    assert len(results) == 6
+    # Six 0.2s searches in sequence would take 1.2s
+    assert elapsed < 0.8
+    # Results keep query order
+    assert [r["title"] for r in results[::2]] == ["q1 result", "q2 result", "q3 result"]
+
+
+@pytest.mark.asyncio
+async def test_gather_search_results_returns_partial_results_on_deadline():
+    with patch.dict(PROVIDER_MAP, {"sleepy": _SleepyProvider, "stuck": _StuckProvider}):
+        start = time.perf_counter()
+        results = await gather_search_results(["q"], providers=["sleepy", "stuck"], deadline=0.5)
+        elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.5
+    assert [r["source"] for r in results] == ["Sleepy"]
+
+
+@pytest.mark.asyncio
+async def test_get_search_results_async_ignores_unknown_providers():
+    with patch.dict(PROVIDER_MAP, {"sleepy": _SleepyProvider}):
+        results = await get_search_results_async("q", providers=["sleepy", "nope"])
+
+    assert len(results) == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_search_results_yields_before_slow_providers_finish():
+    with patch.dict(PROVIDER_MAP, {"sleepy": _SleepyProvider, "stuck": _StuckProvider}):
+        start = time.perf_counter()
+        stream = stream_search_results(["q"], providers=["stuck", "sleepy"])
+        first = await stream.__anext__()
+        elapsed = time.perf_counter() - start
+        # Closing the stream early cancels the remaining search
+        await stream.aclose()
+
+    assert first["source"] == "Sleepy"
+    assert elapsed < 1.0
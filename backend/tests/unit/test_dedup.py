@@ -0,0 +1,110 @@
+"""Unit tests for URL canonicalization and near-duplicate elimination."""
+
+import base64
+
+import pytest
+
+from backend.utils.dedup import (
+    canonicalize_url, simhash, fingerprint_tokens, hamming_distance,
+    DuplicateIndex, dedupe_result_dicts
+)
+
+
+WIRE_STORY = (
+    "Tesla reported quarterly revenue of $25 billion on Wednesday, beating analyst "
+    "estimates as deliveries of its Model Y rose and energy storage sales doubled"
+)
+
+
+class TestCanonicalizeUrl:
+    """Tests for canonicalize_url."""
+
+    @pytest.mark.parametrize("url,expected", [
+        ("https://www.Example.com:443/news/story/?utm_source=x&b=2&a=1#top", "https://example.com/news/story?a=1&b=2"),
+        ("https://example.com/story?fbclid=abc&gclid=def", "https://example.com/story"),
+        ("https://m.example.com/story/amp/", "https://example.com/story"),
+        ("https://www-example-com.cdn.ampproject.org/c/s/www.example.com/story", "https://example.com/story"),
+        ("https://github.com/org/repo?ref=main", "https://github.com/org/repo?ref=main"),
+        ("http://example.com:8080/a", "http://example.com:8080/a"),
+    ])
+    def test_normalizes(self, url, expected):
+        assert canonicalize_url(url) == expected
+
+    def test_unwraps_duckduckgo_redirect(self):
+        url = "//duckduckgo.com/l/?uddg=https%3A%2F%2Fwww.linkedin.com%2Fin%2Fjdoe%2F&rut=abc"
+        assert canonicalize_url(url) == "https://linkedin.com/in/jdoe"
+
+    def test_unwraps_google_redirect(self):
+        url = "https://www.google.com/url?sa=t&url=https%3A%2F%2Fexample.com%2Fa%3Futm_medium%3Dz"
+        assert canonicalize_url(url) == "https://example.com/a"
+
+    def test_decodes_google_news_article_links(self):
+        target = b"https://www.reuters.com/tesla-revenue/"
+        article_id = base64.urlsafe_b64encode(b"\x08\x13\x22" + bytes([len(target)]) + target + b"\xd2\x01\x00")
+        url = f"https://news.google.com/rss/articles/{article_id.decode().rstrip('=')}?oc=5"
+        assert canonicalize_url(url) == "https://reuters.com/tesla-revenue"
+
+    def test_leaves_opaque_google_news_links(self):
+        url = "https://news.google.com/rss/articles/AU_yqLNotDecodable?oc=5"
+        assert canonicalize_url(url) == url
+
+    @pytest.mark.parametrize("url", ["", "not a url", "mailto:someone@example.com"])
+    def test_unparseable_input_unchanged(self, url):
+        assert canonicalize_url(url) == url
+
+
+class TestSimHash:
+    """Tests for the SimHash fingerprint."""
+
+    def test_near_duplicates_are_close(self):
+        syndicated = WIRE_STORY.replace("rose", "rose sharply")
+        distance = hamming_distance(simhash(fingerprint_tokens("", WIRE_STORY)), simhash(fingerprint_tokens("", syndicated)))
+        assert distance <= 6
+
+    def test_unrelated_texts_are_far(self):
+        other = "SpaceX launched another batch of Starlink satellites from Cape Canaveral late on Friday night"
+        distance = hamming_distance(simhash(fingerprint_tokens("", WIRE_STORY)), simhash(fingerprint_tokens("", other)))
+        assert distance > 6
+
+    def test_outlet_suffix_ignored(self):
+        assert fingerprint_tokens("Tesla beats estimates - Reuters") == fingerprint_tokens("Tesla beats estimates | Yahoo Finance")
+
+
+class TestDuplicateIndex:
+    """Tests for DuplicateIndex."""
+
+    def test_same_canonical_url_joins_cluster(self):
+        index = DuplicateIndex()
+        assert index.add("https://example.com/a?utm_source=x", "A", "one") == (0, True)
+        assert index.add("https://www.example.com/a/", "Different title", "two") == (0, False)
+        assert index.clusters[0].urls == ["https://example.com/a?utm_source=x"]
+
+    def test_syndicated_copies_join_cluster(self):
+        index = DuplicateIndex()
+        index.add("https://reuters.com/tesla", "Tesla beats estimates - Reuters", WIRE_STORY)
+        cluster, is_new = index.add("https://yahoo.com/tesla", "Tesla beats estimates - Yahoo Finance", WIRE_STORY + ".")
+
+        assert (cluster, is_new) == (0, False)
+        assert index.clusters[0].urls == ["https://reuters.com/tesla", "https://yahoo.com/tesla"]
+
+    def test_short_texts_need_exact_match(self):
+        index = DuplicateIndex()
+        index.add("https://a.com/1", "Tesla revenue", "")
+        assert index.add("https://b.com/2", "Tesla revenue", "")[1] is False
+        assert index.add("https://c.com/3", "Tesla profit", "")[1] is True
+
+
+def test_dedupe_result_dicts_keeps_first_and_all_links():
+    results = [
+        {"title": "Tesla beats estimates - Reuters", "link": "https://www.reuters.com/tesla?utm_source=rss", "snippet": WIRE_STORY},
+        {"title": "Wikipedia: Tesla, Inc.", "link": "https://en.wikipedia.org/wiki/Tesla,_Inc.", "snippet": "Tesla, Inc. is an American multinational automotive and clean energy company"},
+        {"title": "Tesla beats estimates - Reuters", "link": "https://reuters.com/tesla/amp", "snippet": WIRE_STORY},
+    ]
+    unique = dedupe_result_dicts(results)
+
+    assert [r["title"] for r in unique] == ["Tesla beats estimates - Reuters", "Wikipedia: Tesla, Inc."]
+    # Canonical URLs only key the clusters; results keep the providers' URLs
+    assert unique[0]["link"] == "https://www.reuters.com/tesla?utm_source=rss"
+    assert unique[0]["links"] == ["https://www.reuters.com/tesla?utm_source=rss"]
+    # Input dicts are not modified
+    assert results[0]["link"].endswith("utm_source=rss")
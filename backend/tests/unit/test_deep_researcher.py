@@ -6,12 +6,24 @@ Tests:
 - FR-004: System MUST implement recursion depth limit
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime
 
 from backend.modules.deep_researcher import DeepResearcher, ResearchFinding, execute_research
+from backend.config import settings
 from backend.models import ResearchPlan, SubQuestion, DepthLevel, QuestionStatus
+from backend.utils.provider_yield import get_yield_tracker, DEEP_RESEARCH
+from backend.utils.search_utils import SearchClient, SearchProvider
+
+
+def stream_of(results):
+    """Stand-in for SearchClient.stream_all_providers yielding fixed results."""
+    async def stream(*args, **kwargs):
+        for result in results:
+            yield result
+    return stream
 
 
 class TestDeepResearcherModule:
@@ -76,7 +88,7 @@ class TestDeepResearcherModule:
         mock_search_result.title = "Tesla Revenue 2023"
         mock_search_result.snippet = "Tesla reported $25B revenue"
         
-        researcher.search_client.search_all_providers = AsyncMock(return_value=[mock_search_result])
+        researcher.search_client.stream_all_providers = stream_of([mock_search_result])
         
         # Mock LLM extraction
         researcher.llm_client.complete_json = AsyncMock(return_value={
@@ -130,7 +142,7 @@ class TestDeepResearcherModule:
     @pytest.mark.asyncio
     async def test_no_search_results_returns_empty(self, researcher):
         """Test handling of queries with no search results."""
-        researcher.search_client.search_all_providers = AsyncMock(return_value=[])
+        researcher.search_client.stream_all_providers = stream_of([])
         
         question = SubQuestion(
             id="empty-q",
@@ -143,7 +155,253 @@ class TestDeepResearcherModule:
         findings = await researcher._research_question(question, depth=0)
         
         assert findings == []
+    
+    @pytest.mark.asyncio
+    async def test_extraction_starts_before_search_completes(self, researcher):
+        """Test that the first result is extracted while slower providers are still searching."""
+        slow_provider_done = asyncio.Event()
+        first = MagicMock(url="https://example.com/fast", title="Fast", snippet="Fast result")
+        second = MagicMock(url="https://example.com/slow", title="Slow", snippet="Slow result")
+        extracted_while_searching = []
+        
+        async def stream(*args, **kwargs):
+            yield first
+            await asyncio.sleep(0.05)
+            slow_provider_done.set()
+            yield second
+        
+        async def extract(question, result, page_text=None):
+            extracted_while_searching.append(not slow_provider_done.is_set())
+            return None
+        
+        researcher.search_client.stream_all_providers = stream
+        researcher._extract_from_result = extract
+        
+        question = SubQuestion(id="s-q", text="Streaming question", priority=1, parent_id=None, depth=0)
+        with patch.object(settings, "RELEVANCE_RANKING_ENABLED", False):
+            await researcher._research_question(question, depth=0)
+        
+        assert extracted_while_searching == [True, False]
+    
+    @pytest.mark.asyncio
+    async def test_stops_consuming_stream_at_result_limit(self, researcher):
+        """Test that the search stream is closed once enough results are processed."""
+        closed = asyncio.Event()
+        
+        async def stream(*args, **kwargs):
+            try:
+                for n in range(100):
+                    yield MagicMock(url=f"https://example.com/{n}", title=f"Result {n}", snippet="")
+            finally:
+                closed.set()
+        
+        researcher.search_client.stream_all_providers = stream
+        researcher._extract_from_result = AsyncMock(return_value=None)
+        
+        question = SubQuestion(id="l-q", text="Limited question", priority=1, parent_id=None, depth=0)
+        with patch.object(settings, "MAX_SEARCH_RESULTS_PER_QUERY", 3), \
+                patch.object(settings, "RELEVANCE_RANKING_ENABLED", False):
+            await researcher._research_question(question, depth=0)
+        
+        assert researcher._extract_from_result.await_count == 3
+        assert closed.is_set()
+
+    
+    @pytest.mark.asyncio
+    async def test_duplicate_results_extracted_once(self, researcher):
+        """Test that duplicate copies skip extraction but stay citable."""
+        snippet = "Tesla reported quarterly revenue of $25 billion, beating analyst estimates as deliveries rose"
+        results = [
+            MagicMock(url="https://www.reuters.com/tesla?utm_source=rss", title="Tesla beats - Reuters", snippet=snippet),
+            MagicMock(url="https://reuters.com/tesla/amp", title="Tesla beats - Reuters", snippet=snippet),
+            MagicMock(url="https://finance.yahoo.com/tesla", title="Tesla beats - Yahoo Finance", snippet=snippet),
+        ]
+        researcher.search_client.stream_all_providers = stream_of(results)
+        researcher.llm_client.complete_json = AsyncMock(return_value={
+            "extracted_facts": ["Tesla reported $25 billion in revenue"],
+            "confidence": 0.8,
+            "new_topics_to_research": []
+        })
+        
+        question = SubQuestion(id="d-q", text="Tesla revenue", priority=1, parent_id=None, depth=0)
+        findings = await researcher._research_question(question, depth=0)
+        
+        assert researcher.llm_client.complete_json.await_count == 1
+        assert len(findings) == 1
+        # The providers' URLs are cited and fetched, not their canonical forms
+        assert findings[0].source_urls == ["https://www.reuters.com/tesla?utm_source=rss", "https://finance.yahoo.com/tesla"]
+    
+    @pytest.mark.asyncio
+    async def test_extracts_most_relevant_results_first(self, researcher):
+        """Test that results are ranked against the question and only the top-k extracted."""
+        results = [
+            MagicMock(url=f"https://example.com/{n}", title=title, snippet=snippet)
+            for n, (title, snippet) in enumerate([
+                ("Cooking pasta", "How long to boil spaghetti for dinner"),
+                ("Tesla battery", "Tesla battery factory expands production capacity"),
+                ("Tesla revenue", "Tesla quarterly revenue grew as Tesla deliveries rose"),
+                ("Weather", "Sunny skies expected across the region this weekend"),
+            ])
+        ]
+        researcher.search_client.stream_all_providers = stream_of(results)
+        extracted = []
+        
+        async def extract(question, result, page_text=None):
+            extracted.append(result.title)
+            return None
+        
+        researcher._extract_from_result = extract
+        
+        question = SubQuestion(id="r-q", text="What is Tesla's revenue?", priority=1, parent_id=None, depth=0)
+        with patch.object(settings, "MAX_SEARCH_RESULTS_PER_QUERY", 2):
+            await researcher._research_question(question, depth=0)
+        
+        assert extracted == ["Tesla revenue", "Tesla battery"]
+        assert results[2].relevance_score == 1.0
+    
+    @pytest.mark.asyncio
+    async def test_extracts_from_fetched_page_text(self, researcher):
+        """Test that fetched page text replaces the snippet for the top-ranked results."""
+        results = [
+            MagicMock(url="https://news.example.com/tesla", title="Tesla revenue", snippet=""),
+            MagicMock(url="https://blog.example.com/tesla", title="Tesla revenue grew", snippet="Tesla revenue grew"),
+        ]
+        researcher.search_client.stream_all_providers = stream_of(results)
+        researcher.llm_client.complete_json = AsyncMock(return_value={"extracted_facts": []})
+        fetcher = MagicMock()
+        fetcher.fetch_many = AsyncMock(return_value={
+            "https://news.example.com/tesla": "Tesla revenue rose 20% to $25 billion in the quarter."
+        })
+        
+        question = SubQuestion(id="p-q", text="Tesla revenue", priority=1, parent_id=None, depth=0)
+        with patch("backend.modules.deep_researcher.get_page_fetcher", return_value=fetcher):
+            await researcher._research_question(question, depth=0)
+        
+        fetcher.fetch_many.assert_awaited_once()
+        prompts = {call.kwargs["prompt"] for call in researcher.llm_client.complete_json.await_args_list}
+        assert any("Tesla revenue rose 20% to $25 billion" in prompt for prompt in prompts)
+        # Pages that could not be fetched fall back to the snippet
+        assert any("Content: Tesla revenue grew" in prompt for prompt in prompts)
+
+    @staticmethod
+    def _tesla_results(n):
+        return [
+            MagicMock(url=f"https://example.com/{i}", title=f"Tesla revenue {i}",
+                      snippet=f"Tesla revenue grew in quarter {i}")
+            for i in range(1, n + 1)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batches_ranked_results_into_one_call(self, researcher):
+        """Test that a question's ranked results are extracted with one batch prompt."""
+        researcher.search_client.stream_all_providers = stream_of(self._tesla_results(3))
+        researcher.llm_client.complete_json = AsyncMock(return_value={"results": [
+            {"id": "R3", "extracted_facts": ["Fact from 3"], "confidence": 0.6, "new_topics_to_research": []},
+            {"id": "R1", "extracted_facts": ["Fact from 1"], "confidence": 0.9, "new_topics_to_research": []},
+            {"id": "R2", "extracted_facts": [], "confidence": 0.1, "new_topics_to_research": []},
+        ]})
 
+        question = SubQuestion(id="b-q", text="Tesla revenue", priority=1, parent_id=None, depth=0)
+        findings = await researcher._research_question(question, depth=0)
+
+        assert researcher.llm_client.complete_json.await_count == 1
+        prompt = researcher.llm_client.complete_json.await_args.kwargs["prompt"]
+        assert all(f"[R{i}]\nTitle: Tesla revenue {i}" in prompt for i in range(1, 4))
+        by_url = {f.source_url: f for f in findings}
+        assert by_url["https://example.com/1"].content == "Fact from 1"
+        assert by_url["https://example.com/1"].confidence == 0.9
+        assert by_url["https://example.com/3"].content == "Fact from 3"
+        assert "https://example.com/2" not in by_url
+
+    @pytest.mark.asyncio
+    async def test_malformed_batch_items_fall_back_to_single_calls(self, researcher):
+        """Test that only the items missing or malformed in a batch response are extracted again."""
+        researcher.search_client.stream_all_providers = stream_of(self._tesla_results(3))
+
+        async def complete_json(prompt, **kwargs):
+            if "Search Results:" in prompt:
+                return {"results": [
+                    {"id": "R1", "extracted_facts": ["Batch fact"], "confidence": 0.8},
+                    {"id": "R2", "extracted_facts": "not a list"},
+                ]}
+            return {"extracted_facts": ["Single fact"], "confidence": 0.7, "new_topics_to_research": []}
+
+        researcher.llm_client.complete_json = AsyncMock(side_effect=complete_json)
+
+        question = SubQuestion(id="f-q", text="Tesla revenue", priority=1, parent_id=None, depth=0)
+        findings = await researcher._research_question(question, depth=0)
+
+        assert researcher.llm_client.complete_json.await_count == 3
+        assert {f.source_url: f.content for f in findings} == {
+            "https://example.com/1": "Batch fact",
+            "https://example.com/2": "Single fact",
+            "https://example.com/3": "Single fact",
+        }
+
+    def test_batch_size_limits(self, researcher):
+        """Test that batches hold at most EXTRACTION_BATCH_SIZE results and EXTRACTION_BATCH_MAX_CHARS of content."""
+        with patch.object(settings, "EXTRACTION_BATCH_SIZE", 2), \
+                patch.object(settings, "EXTRACTION_BATCH_MAX_CHARS", 10 ** 6):
+            batches = researcher._extraction_batches(self._tesla_results(3), {})
+        assert [len(batch) for batch in batches] == [2, 1]
+
+        with patch.object(settings, "EXTRACTION_BATCH_MAX_CHARS", 40):
+            batches = researcher._extraction_batches(self._tesla_results(3), {})
+        assert [len(batch) for batch in batches] == [1, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_records_provider_yield(self, researcher):
+        """Test that each provider's share of results with extracted facts is tracked."""
+        results = [
+            MagicMock(url="https://en.wikipedia.org/wiki/Tesla", title="Tesla, Inc.",
+                      snippet="Tesla is an American electric vehicle company", source=SearchProvider.WIKIPEDIA),
+            MagicMock(url="https://example.com/tesla-forum", title="Tesla owners forum",
+                      snippet="Anyone else waiting for their Tesla delivery?", source=SearchProvider.DUCKDUCKGO),
+        ]
+        researcher.search_client.stream_all_providers = stream_of(results)
+        
+        async def extract(question, result, page_text=None):
+            if result.source != SearchProvider.WIKIPEDIA:
+                return None
+            return ResearchFinding(
+                id="f", question_id=question.id, content="Tesla makes EVs", source_url=result.url,
+                source_title=result.title, extraction_timestamp=datetime.now()
+            )
+        
+        researcher._extract_from_result = extract
+        
+        question = SubQuestion(id="y-q", text="What is Tesla?", priority=1, parent_id=None, depth=0)
+        await researcher._research_question(question, depth=0)
+        
+        stats = get_yield_tracker().stats()[DEEP_RESEARCH]
+        assert stats["wikipedia"]["useful"] == 1
+        assert stats["duckduckgo"] == {"results": 1, "useful": 0, "yield": stats["duckduckgo"]["yield"]}
+        assert stats["wikipedia"]["yield"] > stats["duckduckgo"]["yield"]
+
+    @pytest.mark.asyncio
+    async def test_results_dropped_by_ranking_do_not_count_as_served(self, researcher):
+        """Test that only results passed to extraction count toward a provider's yield."""
+        results = [
+            MagicMock(url="https://en.wikipedia.org/wiki/Tesla", title="Tesla, Inc.",
+                      snippet="Tesla is an American electric vehicle company", source=SearchProvider.WIKIPEDIA),
+            MagicMock(url="https://example.com/banana-bread", title="Banana bread",
+                      snippet="Mash three ripe bananas and fold in the flour", source=SearchProvider.DUCKDUCKGO),
+        ]
+        researcher.search_client.stream_all_providers = stream_of(results)
+        extracted = []
+        
+        async def extract(question, result, page_text=None):
+            extracted.append(result.url)
+            return None
+        
+        researcher._extract_from_result = extract
+        
+        question = SubQuestion(id="r-q", text="What is Tesla?", priority=1, parent_id=None, depth=0)
+        with patch.object(settings, "EXTRACTION_BATCH_ENABLED", False):
+            await researcher._research_question(question, depth=0)
+        
+        assert extracted == ["https://en.wikipedia.org/wiki/Tesla"]
+        assert list(get_yield_tracker().stats()[DEEP_RESEARCH]) == ["wikipedia"]
 
 class TestResearchFinding:
     """Tests for the ResearchFinding dataclass."""
@@ -171,6 +429,30 @@ class TestResearchFinding:
         assert "topic1" in result["recursion_topics"]
 
 
+@pytest.mark.asyncio
+async def test_closing_provider_stream_waits_for_cancelled_searches():
+    """Test that searches cancelled by closing the stream have finished when it closes."""
+    finished = []
+
+    async def search(query, provider, limit, use_cache=True):
+        if provider == SearchProvider.WIKIPEDIA:
+            return [MagicMock(url="https://en.wikipedia.org/wiki/Tesla")]
+        try:
+            await asyncio.sleep(10)
+        finally:
+            finished.append(provider)
+        return []
+
+    client = SearchClient()
+    client.search = search
+    stream = client.stream_all_providers("Tesla")
+    assert (await stream.__anext__()).url == "https://en.wikipedia.org/wiki/Tesla"
+    await stream.aclose()
+
+    assert finished == [SearchProvider.DUCKDUCKGO]
+    await client.close()
+
+
 class TestConvenienceFunction:
     """Tests for the module-level convenience function."""
     
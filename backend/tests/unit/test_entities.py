@@ -0,0 +1,97 @@
+"""Tests for entity resolution and query normalization."""
+
+from unittest.mock import patch
+
+import pytest
+
+from backend.config import settings
+from backend.modules import ResearcherManager
+from backend.utils.entities import EntityResolver, get_entity_resolver, normalize_query
+from backend.utils.search_cache import SearchCache
+
+
+@pytest.fixture
+def resolver():
+    return EntityResolver(path="")
+
+
+class TestNormalizeQuery:
+    """Tests for normalize_query."""
+
+    def test_surface_variants_share_a_form(self, resolver):
+        resolver.resolve("Tesla, Inc.")
+        forms = {
+            normalize_query(query, resolver)
+            for query in ("Tesla stock price", "Tesla, Inc. stock price", "TESLA'S  stock price?")
+        }
+        assert forms == {"tesla stock price"}
+
+    def test_word_order_is_kept(self, resolver):
+        for first, second in (
+            ("flights from London to Paris", "flights from Paris to London"),
+            ("Tesla acquires SolarCity", "SolarCity acquires Tesla"),
+        ):
+            assert normalize_query(first, resolver) != normalize_query(second, resolver)
+
+    def test_queries_with_operators_keep_their_order(self, resolver):
+        assert normalize_query('"Tesla Model 3"  Review', resolver) == '"tesla model 3" review'
+        assert normalize_query("site:reddit.com Tesla", resolver) == "site:reddit.com tesla"
+        assert normalize_query("Tesla -Edison", resolver) == "tesla -edison"
+
+    def test_all_stopword_queries_are_kept(self, resolver):
+        assert normalize_query("The Who", resolver) == "the who"
+
+    def test_aliases_are_replaced_by_their_entity(self, resolver):
+        resolver.add_alias("Tesla Motors", "Tesla, Inc.")
+        assert normalize_query("Tesla Motors revenue", resolver) == normalize_query("Tesla revenue", resolver)
+
+    def test_multi_word_entities_stay_together(self, resolver):
+        resolver.resolve("Nikola Tesla")
+        resolver.add_alias("N. Tesla", "Nikola Tesla")
+        assert normalize_query("N Tesla inventions", resolver) == "nikola tesla inventions"
+
+
+class TestEntityResolver:
+    """Tests for EntityResolver."""
+
+    def test_surface_forms_resolve_to_one_entity(self, resolver):
+        entities = [resolver.resolve(name) for name in ("Tesla", "Tesla Inc", "Tesla, Inc.", "tesla inc.")]
+        assert {entity.key for entity in entities} == {"tesla"}
+        assert {entity.name for entity in entities} == {"Tesla"}
+
+    def test_capitalized_name_replaces_lowercase_one(self, resolver):
+        assert resolver.resolve("openai").name == "openai"
+        assert resolver.resolve("OpenAI").name == "OpenAI"
+        assert resolver.resolve("openai").name == "OpenAI"
+
+    def test_alias_maps_onto_existing_entity(self, resolver):
+        entity = resolver.add_alias("TSLA", "Tesla, Inc.")
+        assert resolver.resolve("tsla") == entity
+        assert resolver.lookup("Unknown Corp") is None
+
+    def test_alias_table_persists(self, tmp_path):
+        path = str(tmp_path / "aliases.sqlite3")
+        first = EntityResolver(path=path)
+        first.add_alias("TSLA", "Tesla, Inc.")
+        first.close()
+
+        second = EntityResolver(path=path)
+        assert second.lookup("TSLA").name == "Tesla"
+        assert normalize_query("TSLA news", second) == "tesla news"
+        second.close()
+
+
+def test_search_cache_keys_share_canonical_queries(tmp_path):
+    cache = SearchCache(path="")
+    get_entity_resolver().add_alias("TSLA", "Tesla, Inc.")
+    assert cache.make_key("google_news", "TSLA news", 5) == cache.make_key("google_news", "Tesla news", 5)
+    with patch.object(settings, "QUERY_NORMALIZATION_ENABLED", False):
+        assert cache.make_key("google_news", "TSLA news", 5) != cache.make_key("google_news", "Tesla news", 5)
+
+
+def test_researcher_manager_researches_canonical_entity():
+    assert ResearcherManager("Tesla", "company").research_name == "Tesla"
+    manager = ResearcherManager("Tesla, Inc.", "company")
+    assert manager.entity.key == "tesla"
+    assert manager.research_name == "Tesla"
+    assert manager.entity_name == "Tesla, Inc."
@@ -0,0 +1,153 @@
+"""Tests for conditional GETs of provider feeds, against a local stand-in server."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from backend.config import settings
+from backend.utils.feed_cache import FeedValidatorCache, get_feed_cache
+from backend.utils.http_pool import HTTPClientPool
+from backend.utils.search_providers.google import GoogleNewsProvider
+
+
+FEED = b"""<?xml version="1.0"?><rss><channel>
+<item><title>Tesla opens factory</title><link>https://example.com/a</link><pubDate>Mon</pubDate></item>
+<item><title>Tesla recalls cars</title><link>https://example.com/b</link><pubDate>Tue</pubDate></item>
+</channel></rss>"""
+ETAG = '"feed-v1"'
+LAST_MODIFIED = "Mon, 07 Oct 2024 10:00:00 GMT"
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    requests = []
+    validators = True
+
+    def do_GET(self):
+        cls = _FeedHandler
+        cls.requests.append(dict(self.headers))
+        if cls.validators and self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/xml")
+        self.send_header("Content-Length", str(len(FEED)))
+        if cls.validators:
+            self.send_header("ETag", ETAG)
+            self.send_header("Last-Modified", LAST_MODIFIED)
+        self.end_headers()
+        self.wfile.write(FEED)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def feed_url():
+    _FeedHandler.requests = []
+    _FeedHandler.validators = True
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _FeedHandler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    with patch.object(settings, "GOOGLE_NEWS_RSS_URL", f"http://127.0.0.1:{httpd.server_port}/rss/search"):
+        yield settings.GOOGLE_NEWS_RSS_URL
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestGoogleNewsConditionalGet:
+    """Tests for conditional feed requests made by GoogleNewsProvider."""
+
+    def test_not_modified_feed_reuses_parsed_items(self, feed_url):
+        provider = GoogleNewsProvider()
+        first = provider.search("Tesla", limit=5)
+        second = provider.search("Tesla", limit=5)
+
+        assert [r["title"] for r in first] == ["Tesla opens factory", "Tesla recalls cars"]
+        assert second == first
+        assert "If-None-Match" not in _FeedHandler.requests[0]
+        assert _FeedHandler.requests[1]["If-None-Match"] == ETAG
+        assert _FeedHandler.requests[1]["If-Modified-Since"] == LAST_MODIFIED
+
+        stats = get_feed_cache().stats()
+        assert stats["full_responses"] == 1
+        assert stats["not_modified"] == 1
+        assert stats["bytes_saved"] == len(FEED)
+        assert stats["parse_ms_saved"] > 0 or stats["parse_ms"] == 0
+
+    def test_cached_items_are_not_shared(self, feed_url):
+        provider = GoogleNewsProvider()
+        provider.search("Tesla")[0]["title"] = "changed"
+        assert provider.search("Tesla")[0]["title"] == "Tesla opens factory"
+
+    def test_new_limit_reparses_stored_body(self, feed_url):
+        provider = GoogleNewsProvider()
+        assert len(provider.search("Tesla", limit=1)) == 1
+        assert len(provider.search("Tesla", limit=5)) == 2
+        assert get_feed_cache().stats()["bytes_saved"] == len(FEED)
+
+    @pytest.mark.asyncio
+    async def test_async_path_sends_validators(self, feed_url, monkeypatch):
+        pool = HTTPClientPool()
+        monkeypatch.setattr("backend.utils.search_providers.google.get_http_pool", lambda: pool)
+        provider = GoogleNewsProvider()
+        first = await provider.asearch("Tesla")
+        second = await provider.asearch("Tesla")
+        await pool.aclose()
+
+        assert second == first
+        assert get_feed_cache().stats()["not_modified"] == 1
+
+    @pytest.mark.asyncio
+    async def test_feed_evicted_after_conditional_request_is_refetched(self, feed_url, monkeypatch):
+        pool = HTTPClientPool()
+        monkeypatch.setattr("backend.utils.search_providers.google.get_http_pool", lambda: pool)
+        provider = GoogleNewsProvider()
+        first = provider.search("Tesla")
+        request_headers = provider._request_headers
+
+        def headers_then_evict(url):
+            headers = request_headers(url)
+            get_feed_cache()._entries.clear()  # Evicted by other searches meanwhile
+            return headers
+
+        monkeypatch.setattr(provider, "_request_headers", headers_then_evict)
+        assert provider.search("Tesla") == first
+        assert await provider.asearch("Tesla") == first
+        await pool.aclose()
+
+        sent = [headers.get("If-None-Match") for headers in _FeedHandler.requests]
+        assert sent == [None, ETAG, None, ETAG, None]
+
+    def test_feeds_without_validators_are_not_kept(self, feed_url):
+        _FeedHandler.validators = False
+        provider = GoogleNewsProvider()
+        provider.search("Tesla")
+        provider.search("Tesla")
+
+        assert all("If-None-Match" not in headers for headers in _FeedHandler.requests)
+        assert get_feed_cache().stats()["entries"] == 0
+
+    def test_disabled(self, feed_url):
+        with patch.object(settings, "FEED_CONDITIONAL_GET_ENABLED", False):
+            provider = GoogleNewsProvider()
+            provider.search("Tesla")
+            provider.search("Tesla")
+            assert get_feed_cache() is None
+        assert all("If-None-Match" not in headers for headers in _FeedHandler.requests)
+
+
+def test_least_recently_used_feed_is_evicted():
+    cache = FeedValidatorCache(max_entries=2)
+    parse = lambda content, limit: [{"title": content.decode()}]
+    for url in ("a", "b", "c"):
+        cache.read(url, 200, {"etag": url}, url.encode(), 5, parse)
+
+    assert cache.conditional_headers("a") == {}
+    assert cache.conditional_headers("c") == {"If-None-Match": "c"}
+    with pytest.raises(LookupError):
+        cache.read("a", 304, {}, b"", 5, parse)
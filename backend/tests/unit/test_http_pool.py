@@ -0,0 +1,96 @@
+"""Unit tests for the shared search HTTP connection pool."""
+
+import asyncio
+import pytest
+import httpx
+from unittest.mock import patch
+
+from backend.utils.http_pool import HTTPClientPool
+from backend.utils.search import get_provider
+from backend.utils.search_providers.ddg import DuckDuckGoProvider, get_ddgs
+from backend.utils.search_providers.google import GoogleNewsProvider
+
+
+RSS = b"""<?xml version="1.0"?><rss><channel>
+<item><title>Tesla one</title><link>http://a</link><pubDate>Mon</pubDate></item>
+<item><title>Tesla two</title><link>http://b</link><pubDate>Tue</pubDate></item>
+</channel></rss>"""
+
+
+class TestHTTPClientPool:
+    """Tests for HTTPClientPool."""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_within_loop(self):
+        pool = HTTPClientPool()
+        assert pool.client is pool.client
+        assert pool.stats()["clients_created"] == 1
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_provider_limit_caps_concurrency(self):
+        pool = HTTPClientPool(provider_limits={"slow": 2})
+
+        async def hold():
+            async with pool.slot("slow"):
+                await asyncio.sleep(0.05)
+
+        await asyncio.gather(*(hold() for _ in range(6)))
+
+        stats = pool.stats()["providers"]["slow"]
+        assert stats["requests"] == 6
+        assert stats["peak_in_flight"] == 2
+        assert stats["in_flight"] == 0
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_get_counts_requests(self):
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=b"ok"))
+        pool = HTTPClientPool(transport=transport)
+
+        response = await pool.get("google_news", "http://feed.test/rss")
+
+        assert response.status_code == 200
+        assert pool.stats()["providers"]["google_news"]["requests"] == 1
+        await pool.aclose()
+
+
+class TestProviderSingletons:
+    """Tests for long-lived provider instances."""
+
+    def test_get_provider_returns_same_instance(self):
+        assert get_provider("google_news") is get_provider("google_news")
+
+    def test_get_provider_unknown_raises(self):
+        with pytest.raises(KeyError):
+            get_provider("nope")
+
+    @pytest.mark.asyncio
+    async def test_google_asearch_uses_shared_pool(self):
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=RSS))
+        pool = HTTPClientPool(transport=transport)
+
+        with patch("backend.utils.search_providers.google.get_http_pool", return_value=pool):
+            results = await GoogleNewsProvider().asearch("Tesla", limit=1)
+
+        assert results == [{
+            "title": "Tesla one", "link": "http://a", "published_date": "Mon", "source": "Google News"
+        }]
+        await pool.aclose()
+
+
+class TestSharedDDGS:
+    """Tests for the shared DuckDuckGo session."""
+
+    def test_session_is_shared(self, ddg_upstream):
+        assert get_ddgs() is get_ddgs()
+
+    def test_failed_call_does_not_poison_later_calls(self, ddg_upstream):
+        provider = DuckDuckGoProvider()
+        ddg_upstream.down = True
+        with pytest.raises(Exception):
+            provider.search("Tesla", limit=1)
+
+        ddg_upstream.down = False
+        results = provider.search("Tesla", limit=1)
+        assert [r["link"] for r in results] == ["https://example.com/tesla"]
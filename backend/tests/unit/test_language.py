@@ -0,0 +1,60 @@
+"""Unit tests for batch English language identification (NFR-008)."""
+
+from datetime import datetime
+
+import pytest
+from unittest.mock import patch
+
+from backend.config import settings
+from backend.utils.language import detect_english, is_english
+from backend.utils.search_utils import SearchClient, SearchResult, SearchProvider
+
+
+class TestDetectEnglish:
+    """Tests for detect_english."""
+
+    def test_batch_keeps_order(self):
+        scores = detect_english([
+            "The company said that revenue was higher than expected.",
+            "El fabricante presentó resultados por encima de lo esperado.",
+            "",
+        ])
+        assert [s.is_english for s in scores] == [True, False, False]
+        assert scores[0].confidence > 0.9
+        assert scores[1].confidence < 0.1
+
+    @pytest.mark.parametrize("text", [
+        "特斯拉公布了第三季度财报，营收超出分析师预期。",
+        "Компания сообщила о росте выручки в третьем квартале.",
+    ])
+    def test_non_latin_scripts_rejected(self, text):
+        score = detect_english([text])[0]
+        assert not score.is_english
+        assert score.confidence < 0.5
+
+    def test_short_texts_pass_as_undetermined(self):
+        assert detect_english(["Tesla earnings"])[0].is_english
+        assert detect_english(["Tesla earnings"])[0].confidence == 0.5
+
+    def test_thresholds_configurable(self):
+        text = "Tesla quarterly earnings report beats estimates and guidance"
+        assert detect_english([text])[0].is_english
+        assert not detect_english([text], min_ratio=0.5)[0].is_english
+        with patch.object(settings, "ENGLISH_MIN_INDICATOR_RATIO", 0.5):
+            assert not is_english(text)
+
+
+@pytest.mark.asyncio
+async def test_search_filter_can_be_disabled():
+    client = SearchClient()
+    results = [
+        SearchResult(url="https://a.com", title="A", snippet="The results were strong and margins have improved.",
+                     source=SearchProvider.DUCKDUCKGO, timestamp=datetime.now()),
+        SearchResult(url="https://b.com", title="B", snippet="Les résultats étaient solides selon les analystes du secteur.",
+                     source=SearchProvider.DUCKDUCKGO, timestamp=datetime.now()),
+    ]
+    with patch.object(client, "_fetch_cached", return_value=results):
+        assert [r.url for r in await client.search("q")] == ["https://a.com"]
+        with patch.object(settings, "FILTER_NON_ENGLISH", False):
+            assert len(await client.search("q")) == 2
+    await client.close()
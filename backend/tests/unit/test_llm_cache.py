@@ -0,0 +1,157 @@
+"""Unit tests for the LLMClient response cache."""
+
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from structlog.testing import capture_logs
+
+from backend.config import settings
+from backend.models import AgenticResearchRequest, DepthLevel
+from backend.modules.planner import Planner, PlanningError
+from backend.utils.llm_cache import LLMResponseCache, make_key
+from backend.utils.llm_utils import LLMClient, LLMProvider, TaskType
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = LLMResponseCache(path=str(tmp_path / "llm.sqlite3"), max_entries=2)
+    yield c
+    c.close()
+
+
+class TestLLMResponseCache:
+    """Tests for LLMResponseCache tiers, TTL and size limits."""
+
+    def test_key_covers_every_request_field(self):
+        base = ("openai", "gpt-4", "system", "prompt", 0.3, 2000)
+        keys = {make_key(*base)}
+        for i, changed in enumerate(["google", "gpt-3.5-turbo", "other", "prompt ", 0.7, 1500]):
+            keys.add(make_key(*base[:i], changed, *base[i + 1:]))
+        assert len(keys) == 7
+        assert make_key("openai", "gpt-4", None, "p", 0.3, 10) == make_key("openai", "gpt-4", "", "p", 0.3, 10)
+
+    def test_disk_tier_survives_restart(self, tmp_path, cache):
+        cache.set("k1", "response one")
+        cache.close()
+
+        restarted = LLMResponseCache(path=str(tmp_path / "llm.sqlite3"))
+        assert restarted.lookup("k1") == ("response one", "disk")
+        assert restarted.lookup("k1") == ("response one", "memory")
+        restarted.close()
+
+    def test_expired_entries_are_dropped(self, tmp_path):
+        c = LLMResponseCache(path=str(tmp_path / "llm.sqlite3"), ttl=60)
+        c.set("k1", "response")
+        with patch("backend.utils.llm_cache.time.time", return_value=time.time() + 61):
+            assert c.get("k1") is None
+        assert c.stats()["disk_entries"] == 0
+        c.close()
+
+    def test_size_eviction(self, tmp_path):
+        c = LLMResponseCache(path=str(tmp_path / "llm.sqlite3"), max_memory_bytes=25, max_disk_bytes=25)
+        c.set("k1", "a" * 10)
+        c.set("k2", "b" * 10)
+        c.get("k1")  # k2 is now least recently used in memory; disk order is by write
+        c.set("k3", "c" * 10)
+
+        stats = c.stats()
+        assert stats["memory_entries"] == 2 and stats["memory_bytes"] == 20
+        assert stats["disk_entries"] == 2 and stats["disk_bytes"] == 20
+        assert c.lookup("k1") == ("a" * 10, "memory")
+        assert c.lookup("k2") == ("b" * 10, "disk")
+        c.close()
+
+    def test_memory_only_when_path_empty(self):
+        c = LLMResponseCache(path="")
+        c.set("k1", "response")
+        c.set("k2", "")  # Empty responses are not cached
+        assert c.get("k1") == "response"
+        assert c.get("k2") is None
+        assert c.stats()["disk_path"] is None
+
+
+class TestLLMClientCaching:
+    """Tests for the cache in LLMClient.complete / complete_json."""
+
+    @pytest.fixture
+    def llm(self):
+        client = LLMClient(provider=LLMProvider.OPENAI)
+        client.openai_client = MagicMock()
+        create = AsyncMock(return_value=MagicMock(
+            choices=[MagicMock(message=MagicMock(content='{"extracted_facts": ["fact"]}'))]
+        ))
+        client.openai_client.chat.completions.create = create
+        return client, create
+
+    @pytest.mark.asyncio
+    async def test_identical_extraction_prompt_is_served_from_cache(self, llm):
+        client, create = llm
+        with capture_logs() as logs:
+            first = await client.complete_json(prompt="Extract facts", task_type=TaskType.EXTRACTION, temperature=0.3)
+            second = await client.complete_json(prompt="Extract facts", task_type=TaskType.EXTRACTION, temperature=0.3)
+            await client.complete_json(prompt="Extract facts", task_type=TaskType.EXTRACTION, temperature=0.5)
+
+        assert first == second == {"extracted_facts": ["fact"]}
+        assert create.await_count == 2
+        statuses = [(e["status"], e.get("tier")) for e in logs if e["event"] == "llm_cache"]
+        assert statuses == [("miss", None), ("hit", "memory"), ("miss", None)]
+        assert logs[0]["model"] == settings.EXTRACTION_MODEL
+
+    @pytest.mark.asyncio
+    async def test_task_type_opt_in_and_per_call_override(self, llm):
+        client, create = llm
+        with capture_logs() as logs:
+            await client.complete(prompt="Write", task_type=TaskType.SYNTHESIS)
+            await client.complete(prompt="Write", task_type=TaskType.SYNTHESIS)
+        assert create.await_count == 2
+        assert [e["status"] for e in logs if e["event"] == "llm_cache"] == ["bypass", "bypass"]
+
+        await client.complete(prompt="Write", task_type=TaskType.SYNTHESIS, use_cache=True)
+        await client.complete(prompt="Write", task_type=TaskType.SYNTHESIS, use_cache=True)
+        await client.complete(prompt="Plan", task_type=TaskType.PLANNING, use_cache=False)
+        await client.complete(prompt="Plan", task_type=TaskType.PLANNING, use_cache=False)
+        assert create.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_is_not_served_again(self, llm):
+        client, create = llm
+        create.return_value.choices[0].message.content = "not json"
+        with pytest.raises(ValueError):
+            await client.complete_json(prompt="Extract facts")
+
+        create.return_value.choices[0].message.content = '{"ok": true}'
+        assert await client.complete_json(prompt="Extract facts") == {"ok": True}
+        assert create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rejected_plan_is_not_served_again(self, llm):
+        client, create = llm
+        create.return_value.choices[0].message.content = json.dumps(
+            {"sub_questions": [{"text": "What is Tesla?"}, {"text": "Who runs Tesla?"}]}
+        )
+        planner = Planner()
+        planner.llm_client = client
+        request = AgenticResearchRequest(id="run-1", query="Research Tesla", depth_level=DepthLevel.QUICK)
+
+        for _ in range(3):
+            with pytest.raises(PlanningError):
+                await planner.create_plan(request)
+        assert create.await_count == 3
+
+        create.return_value.choices[0].message.content = json.dumps(
+            {"sub_questions": [{"text": f"Question {n}?"} for n in range(4)]}
+        )
+        plan = await planner.create_plan(request)
+        assert len(plan.sub_questions) == 4
+        await planner.create_plan(request)
+        assert create.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_calls_provider(self, llm, monkeypatch):
+        client, create = llm
+        monkeypatch.setattr(settings, "LLM_CACHE_ENABLED", False)
+        await client.complete(prompt="Plan", task_type=TaskType.PLANNING)
+        await client.complete(prompt="Plan", task_type=TaskType.PLANNING)
+        assert create.await_count == 2
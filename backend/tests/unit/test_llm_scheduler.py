@@ -0,0 +1,125 @@
+"""Unit tests for the shared LLM scheduler."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.config import settings
+from backend.utils.llm_scheduler import LLMScheduler, ModelScheduler, get_llm_scheduler, llm_request_id
+from backend.utils.llm_utils import LLMClient, LLMProvider, TaskType
+
+
+async def _run_in_order(scheduler: LLMScheduler, calls):
+    """Queue `calls` ((task_type, request_id) pairs) behind a held slot; return the order they ran in."""
+    order = []
+    release = asyncio.Event()
+
+    async def blocker():
+        async with scheduler.acquire("gpt-4", "synthesis", 1, request_id="blocker"):
+            await release.wait()
+
+    async def call(task_type, request_id):
+        async with scheduler.acquire("gpt-4", task_type, 1, request_id=request_id):
+            order.append((task_type, request_id))
+
+    blocking = asyncio.create_task(blocker())
+    await asyncio.sleep(0)
+    tasks = [asyncio.create_task(call(*c)) for c in calls]
+    await asyncio.sleep(0.01)
+    assert scheduler.stats()["gpt-4"]["queue_depth"] == len(calls)
+    release.set()
+    await asyncio.gather(blocking, *tasks)
+    return order
+
+
+class TestLLMScheduler:
+    """Tests for priorities, fair share and RPM/TPM budgets."""
+
+    @pytest.fixture
+    def scheduler(self):
+        return LLMScheduler(limits={"gpt-4": {"rpm": 6000, "tpm": 10 ** 6, "concurrency": 1}})
+
+    @pytest.mark.asyncio
+    async def test_synthesis_and_planning_run_before_extraction(self, scheduler):
+        order = await _run_in_order(scheduler, [
+            ("extraction", "run-1"), ("extraction", "run-1"), ("planning", "run-2"), ("synthesis", "run-1")
+        ])
+        assert [task for task, _ in order] == ["planning", "synthesis", "extraction", "extraction"]
+
+    @pytest.mark.asyncio
+    async def test_capacity_is_shared_across_runs(self, scheduler):
+        order = await _run_in_order(scheduler, [("extraction", "run-1")] * 4 + [("extraction", "run-2")] * 2)
+        assert [run for _, run in order] == ["run-1", "run-2", "run-1", "run-2", "run-1", "run-1"]
+
+    @pytest.mark.asyncio
+    async def test_rpm_budget_paces_calls(self):
+        model = ModelScheduler("gpt-4", rpm=1200, tpm=10 ** 6, max_concurrency=10, burst_seconds=0.05)
+        start = time.monotonic()
+
+        async def call():
+            async with model.acquire(0, "run-1", "extraction", 1):
+                pass
+
+        await asyncio.gather(*(call() for _ in range(3)))
+        # 20 requests/second with a burst of one: the second and third wait 50ms each
+        assert time.monotonic() - start >= 0.09
+        stats = model.stats()
+        assert stats["acquired"] == 3
+        assert stats["delayed"] == 2
+        assert stats["max_wait_seconds"] >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_tpm_budget_and_settlement(self):
+        model = ModelScheduler("gpt-4", rpm=6000, tpm=60000, max_concurrency=10, burst_seconds=1)
+        # The bucket holds 1000 tokens; a 2000-token call is capped to what it can ever hold
+        async with model.acquire(0, "run-1", "extraction", 2000) as grant:
+            assert grant.tokens == 1000
+            grant.settle(100)
+        assert model.tpm_bucket.wait_time(900) == 0
+        assert model.stats()["tokens_refunded"] == 900
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_the_queue(self, scheduler):
+        release = asyncio.Event()
+
+        async def hold():
+            async with scheduler.acquire("gpt-4", "synthesis", 1, request_id="run-1"):
+                await release.wait()
+
+        async def queued():
+            async with scheduler.acquire("gpt-4", "extraction", 1, request_id="run-2"):
+                pass
+
+        holder = asyncio.create_task(hold())
+        waiter = asyncio.create_task(queued())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        await holder
+        stats = scheduler.stats()["gpt-4"]
+        assert stats["queue_depth"] == 0
+        assert stats["in_flight"] == 0
+        assert stats["acquired"] == 1
+
+
+@pytest.mark.asyncio
+async def test_llm_client_calls_go_through_scheduler():
+    client = LLMClient(provider=LLMProvider.OPENAI)
+    client.openai_client = MagicMock()
+    client.openai_client.chat.completions.create = AsyncMock(return_value=MagicMock(
+        choices=[MagicMock(message=MagicMock(content="A short answer."))]
+    ))
+
+    async def run():
+        llm_request_id.set("run-1")
+        return await client.complete(prompt="Write", task_type=TaskType.SYNTHESIS, max_tokens=500)
+
+    assert await asyncio.create_task(run()) == "A short answer."
+    stats = get_llm_scheduler().stats()[settings.SYNTHESIS_MODEL]
+    assert stats["acquired"] == 1
+    assert stats["in_flight"] == 0
+    # max_tokens was reserved up front and mostly refunded
+    assert stats["tokens_refunded"] > 450
@@ -0,0 +1,115 @@
+"""Tests for the async LLMService used by the research modules."""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from backend.config import settings
+from backend.utils.http_pool import HTTPClientPool
+from backend.utils.llm import LLMService
+
+
+LLM_DELAY = 0.3
+
+
+class _StandInOpenAI:
+    """Async stand-in for the OpenAI chat completions endpoint."""
+
+    def __init__(self, delay: float = LLM_DELAY):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        prompt = json.loads(request.content)["messages"][-1]["content"]
+        content = {"queries": ["q"]} if "search queries" in prompt else {"narrative_summary": "ok", "confidence_score": 0.5}
+        return httpx.Response(200, json={
+            "id": "chatcmpl-1",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-3.5-turbo-1106",
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": json.dumps(content)}
+            }]
+        })
+
+
+@pytest.fixture
+def openai_server(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    return _StandInOpenAI()
+
+
+@pytest.fixture
+def service(openai_server):
+    return LLMService(pool=HTTPClientPool(transport=httpx.MockTransport(openai_server)))
+
+
+class TestLLMService:
+    """Tests for LLMService."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_overlap(self, service, openai_server):
+        await service.generate_json("Warm up", "ctx")  # Client setup is not part of the wait
+        openai_server.peak = 0
+        start = time.perf_counter()
+        results = await asyncio.gather(*(service.generate_json("Summarize", "ctx") for _ in range(3)))
+        elapsed = time.perf_counter() - start
+
+        assert all(r["narrative_summary"] == "ok" for r in results)
+        assert openai_server.peak == 3
+        assert elapsed < 2 * LLM_DELAY
+        assert service.stats()["providers"]["openai"]["requests"] == 4
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_call_timeout(self, service, openai_server):
+        openai_server.delay = 5
+        service.timeout = 0.1
+        start = time.perf_counter()
+        assert await service.generate_json("Summarize", "ctx") == {}
+        assert time.perf_counter() - start < 1
+        await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_research_requests_overlap_llm_waits(client, openai_server, monkeypatch):
+    """Two /api/v1/research calls wait on their LLM calls at the same time."""
+    service = LLMService(pool=HTTPClientPool(transport=httpx.MockTransport(openai_server)))
+    monkeypatch.setattr(settings, "PROVIDER_YIELD_ENABLED", False)
+    body = {"entity_name": "Tesla", "entity_type": "company", "research_types": ["financial"]}
+
+    await service.generate_json("Warm up", "ctx")  # Client setup is not part of the wait
+    openai_server.calls = openai_server.peak = 0
+
+    with patch("backend.modules.base.llm_service", service), \
+            patch("backend.modules.base.gather_attributed_results", AsyncMock(return_value=[])), \
+            patch("backend.main.report_generator.generate_pdf_report", return_value=None):
+        start = time.perf_counter()
+        responses = await asyncio.gather(
+            client.post("/api/v1/research", json=body),
+            client.post("/api/v1/research", json=body)
+        )
+        elapsed = time.perf_counter() - start
+
+    assert [r.status_code for r in responses] == [200, 200]
+    # Each request makes two sequential LLM calls (plan, synthesize)
+    assert openai_server.calls == 4
+    assert openai_server.peak == 2
+    assert elapsed < 4 * LLM_DELAY
+    await service.aclose()
@@ -0,0 +1,223 @@
+"""Unit tests for the page fetcher, against a local stand-in server."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from backend.config import settings
+from backend.utils.http_pool import HTTPClientPool
+from backend.utils.page_fetcher import PageFetcher, extract_main_text
+
+
+ARTICLE = b"""<html><head><title>Tesla</title><script>var tracking = 1;</script></head>
+<body>
+<nav><a href="/">Home</a> <a href="/news">News</a> <a href="/markets">Markets</a></nav>
+<div class="cookie-banner">We use cookies to improve your experience on this website.</div>
+<article>
+  <h1>Tesla reports record deliveries</h1>
+  <p>Tesla delivered more vehicles in the quarter than in any previous quarter, the company said.</p>
+  <p>Read more: <a href="/a">one</a> <a href="/b">two other related stories here</a></p>
+  <p>Short line.</p>
+  <p>Analysts had expected slightly lower numbers because of price cuts across its lineup.</p>
+</article>
+<footer>Copyright 2024 Example News. All rights reserved by the publisher.</footer>
+</body></html>"""
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    hits = []
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+    delay = 0.0
+
+    def do_GET(self):
+        cls = _StandInHandler
+        with cls.lock:
+            cls.hits.append(self.path)
+            cls.in_flight += 1
+            cls.peak = max(cls.peak, cls.in_flight)
+        try:
+            time.sleep(cls.delay)
+            if self.path.startswith("/big"):
+                body, content_type = b"<html><body><p>" + b"word " * 400_000 + b"</p></body></html>", "text/html"
+            elif self.path.startswith("/report.pdf"):
+                body, content_type = b"%PDF-1.4", "application/pdf"
+            elif self.path.startswith("/moved"):
+                target = "http://10.0.0.1/admin" if self.path.startswith("/moved-inside") else "/article"
+                self.send_response(302)
+                self.send_header("Location", target)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            elif self.path.startswith("/missing"):
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            else:
+                body, content_type = ARTICLE, "text/html; charset=utf-8"
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            try:
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # Client stopped reading at its byte cap
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _StandInHandler.hits = []
+    _StandInHandler.peak = 0
+    _StandInHandler.delay = 0.0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def pool(monkeypatch):
+    p = HTTPClientPool()
+    monkeypatch.setattr("backend.utils.page_fetcher.get_http_pool", lambda: p)
+    monkeypatch.setattr(settings, "PAGE_FETCH_DOMAIN_QPS", 1000)
+    monkeypatch.setattr(settings, "PAGE_FETCH_DOMAIN_BURST", 1000)
+    monkeypatch.setattr(settings, "PAGE_FETCH_ALLOW_PRIVATE_HOSTS", True)  # The stand-in server is on loopback
+    return p
+
+
+def test_extract_main_text_drops_boilerplate():
+    text = extract_main_text(ARTICLE)
+    assert text.splitlines() == [
+        "Tesla reports record deliveries",
+        "Tesla delivered more vehicles in the quarter than in any previous quarter, the company said.",
+        "Analysts had expected slightly lower numbers because of price cuts across its lineup.",
+    ]
+    assert len(extract_main_text(ARTICLE, max_chars=40)) == 40
+
+
+class TestPageFetcher:
+    """Tests for PageFetcher."""
+
+    @pytest.mark.asyncio
+    async def test_pages_are_fetched_once_and_cached_on_disk(self, server, tmp_path):
+        path = str(tmp_path / "pages.sqlite3")
+        fetcher = PageFetcher(cache_path=path)
+        text = await fetcher.fetch(f"{server}/article?utm_source=feed")
+        assert text.startswith("Tesla reports record deliveries")
+
+        # Same canonical URL: served from the cache
+        assert await fetcher.fetch(f"{server}/article") == text
+        assert fetcher.stats()["cache_hits"] == 1
+
+        # Same content at another URL is stored once
+        await fetcher.fetch(f"{server}/copy")
+        assert fetcher.cache.counts() == {"urls": 2, "texts": 1}
+        fetcher.close()
+
+        restarted = PageFetcher(cache_path=path)
+        assert await restarted.fetch(f"{server}/article") == text
+        assert len(_StandInHandler.hits) == 2
+        restarted.close()
+
+    @pytest.mark.asyncio
+    async def test_cache_and_extraction_run_off_the_event_loop(self, server, tmp_path):
+        fetcher = PageFetcher(cache_path=str(tmp_path / "pages.sqlite3"))
+        loop_thread = threading.current_thread()
+        threads = []
+
+        def record_thread(fn):
+            def wrapper(*args, **kwargs):
+                threads.append(threading.current_thread())
+                return fn(*args, **kwargs)
+            return wrapper
+
+        with patch("backend.utils.page_fetcher.extract_main_text", record_thread(extract_main_text)), \
+                patch.object(fetcher.cache, "get", record_thread(fetcher.cache.get)), \
+                patch.object(fetcher.cache, "set_text", record_thread(fetcher.cache.set_text)):
+            assert await fetcher.fetch(f"{server}/article")
+
+        assert len(threads) == 3
+        assert loop_thread not in threads
+        fetcher.close()
+
+    @pytest.mark.asyncio
+    async def test_download_stops_at_byte_cap(self, server):
+        fetcher = PageFetcher(cache_path="")
+        with patch.object(settings, "PAGE_FETCH_MAX_BYTES", 50_000):
+            text = await fetcher.fetch(f"{server}/big")
+
+        stats = fetcher.stats()
+        assert stats["truncated"] == 1
+        assert stats["bytes_downloaded"] == 50_000
+        assert len(text) <= settings.PAGE_TEXT_MAX_CHARS
+
+    @pytest.mark.asyncio
+    async def test_unusable_pages_are_remembered(self, server, tmp_path):
+        fetcher = PageFetcher(cache_path=str(tmp_path / "pages.sqlite3"))
+        pages = await fetcher.fetch_many([f"{server}/report.pdf", f"{server}/missing", f"{server}/article"])
+        assert list(pages) == [f"{server}/article"]
+        assert fetcher.stats()["failures"] == 2
+
+        assert await fetcher.fetch(f"{server}/missing") is None
+        assert len(_StandInHandler.hits) == 3
+        fetcher.close()
+
+    @pytest.mark.asyncio
+    async def test_per_domain_concurrency_limit(self, server):
+        _StandInHandler.delay = 0.1
+        fetcher = PageFetcher(cache_path="")
+        with patch.object(settings, "PAGE_FETCH_DOMAIN_CONCURRENCY", 2):
+            pages = await fetcher.fetch_many([f"{server}/article/{i}" for i in range(6)])
+
+        assert len(pages) == 6
+        assert _StandInHandler.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_redirects_are_followed(self, server):
+        fetcher = PageFetcher(cache_path="")
+        assert (await fetcher.fetch(f"{server}/moved")).startswith("Tesla reports record deliveries")
+        assert _StandInHandler.hits == ["/moved", "/article"]
+
+    @pytest.mark.asyncio
+    async def test_non_public_hosts_are_refused(self, server, monkeypatch, tmp_path):
+        monkeypatch.setattr(settings, "PAGE_FETCH_ALLOW_PRIVATE_HOSTS", False)
+        fetcher = PageFetcher(cache_path=str(tmp_path / "pages.sqlite3"))
+        assert await fetcher.fetch(f"{server}/article") is None
+        assert await fetcher.fetch("file:///etc/passwd") is None
+        assert _StandInHandler.hits == []
+
+        # A redirect to a private address is refused before it is followed
+        with patch("backend.utils.page_fetcher._is_public", lambda address: address != "10.0.0.1"):
+            assert await fetcher.fetch(f"{server}/moved-inside") is None
+        assert _StandInHandler.hits == ["/moved-inside"]
+        assert "non-public address 10.0.0.1" in fetcher.cache.get(f"{server}/moved-inside")["error"]
+        fetcher.close()
+
+    def test_domain_limiters_are_bounded(self, monkeypatch):
+        monkeypatch.setattr(settings, "PAGE_FETCH_DOMAIN_LIMITERS", 2)
+        fetcher = PageFetcher(cache_path="")
+        first = fetcher._domain_limiter("a.com")
+        fetcher._domain_limiter("b.com")
+        first.in_flight = 1  # Busy limiters are kept
+        fetcher._domain_limiter("c.com")
+        assert list(fetcher._domains) == ["a.com", "c.com"]
+
+        first.in_flight = 0
+        assert fetcher._domain_limiter("a.com") is first
+        fetcher._domain_limiter("d.com")
+        assert list(fetcher._domains) == ["a.com", "d.com"]
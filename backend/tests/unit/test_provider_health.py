@@ -0,0 +1,123 @@
+"""Unit tests for the provider health scoreboard and circuit breaker."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from backend.config import settings
+from backend.utils.provider_health import ProviderHealth, CircuitState, get_health_board
+from backend.utils.search import gather_search_results
+
+
+def _health(**kwargs):
+    options = dict(window_size=10, min_calls=3, failure_threshold=0.6, cooldown_seconds=30)
+    options.update(kwargs)
+    return ProviderHealth("duckduckgo", **options)
+
+
+class TestProviderHealth:
+    """Tests for the rolling tracker and state transitions."""
+
+    def test_tracks_success_rate_and_latency(self):
+        health = _health()
+        health.record(True, 100)
+        health.record(True, 300)
+        health.record(False, 200, "403")
+
+        snapshot = health.snapshot()
+        assert snapshot["success_rate"] == pytest.approx(0.667, abs=0.001)
+        assert snapshot["latency_p50_ms"] == 200
+        assert snapshot["last_error"] == "403"
+        assert snapshot["state"] == "closed"
+
+    def test_opens_after_repeated_failures(self):
+        health = _health()
+        for _ in range(3):
+            assert health.allow()
+            health.record(False, 10000, "timeout")
+
+        assert health.state == CircuitState.OPEN
+        assert not health.allow()
+        assert health.snapshot()["skipped_calls"] == 1
+
+    def test_half_open_allows_single_probe_then_closes(self):
+        health = _health()
+        for _ in range(3):
+            health.record(False, 10, "403")
+
+        with patch("backend.utils.provider_health.time.monotonic", return_value=health.opened_at + 31):
+            assert health.allow()
+            assert health.state == CircuitState.HALF_OPEN
+            # Only one probe at a time
+            assert not health.allow()
+            health.record(True, 50)
+
+        assert health.state == CircuitState.CLOSED
+        assert health.allow()
+
+    def test_failed_probe_reopens(self):
+        health = _health()
+        for _ in range(3):
+            health.record(False, 10, "403")
+
+        with patch("backend.utils.provider_health.time.monotonic", return_value=health.opened_at + 31):
+            assert health.allow()
+            health.record(False, 10, "403")
+
+        assert health.state == CircuitState.OPEN
+        assert health.times_opened == 2
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_skips_provider_calls():
+    board = get_health_board()
+    for _ in range(board.get("wikipedia").min_calls):
+        board.record_failure("wikipedia", 10000, "timeout")
+
+    asearch = AsyncMock(return_value=[{"title": "t"}])
+    with patch("backend.utils.search.get_provider") as get_provider:
+        get_provider.return_value.asearch = asearch
+        results = await gather_search_results(["Tesla"], providers=["wikipedia"])
+
+    assert results == []
+    asearch.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_provider_errors_are_recorded():
+    asearch = AsyncMock(side_effect=RuntimeError("403 Forbidden"))
+    with patch("backend.utils.search.get_provider") as get_provider:
+        get_provider.return_value.asearch = asearch
+        results = await gather_search_results(["Tesla"], providers=["linkedin"])
+
+    assert results == []
+    snapshot = get_health_board().get("linkedin").snapshot()
+    assert snapshot["total_failures"] == 1
+    assert snapshot["last_error"] == "403 Forbidden"
+
+
+@pytest.mark.asyncio
+async def test_duckduckgo_circuit_closes_once_upstream_recovers(monkeypatch, ddg_upstream):
+    monkeypatch.setattr(settings, "CIRCUIT_MIN_CALLS", 2)
+    health = get_health_board().get("duckduckgo")
+
+    ddg_upstream.down = True
+    for _ in range(2):
+        assert await gather_search_results(["Tesla"], providers=["duckduckgo"]) == []
+    assert health.state == CircuitState.OPEN
+
+    ddg_upstream.down = False
+    health.opened_at -= health.cooldown_seconds + 1
+    results = await gather_search_results(["Tesla"], providers=["duckduckgo"])
+
+    assert [r["link"] for r in results] == ["https://example.com/tesla"]
+    assert health.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_health_endpoint_lists_every_provider(client):
+    response = await client.get("/api/v1/providers/health")
+
+    assert response.status_code == 200
+    states = {p["provider"]: p["state"] for p in response.json()}
+    assert "google_news" in states
+    assert set(states.values()) == {"closed"}
@@ -0,0 +1,128 @@
+"""Tests for the lazy search provider registry."""
+
+import json
+import os
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from backend.config import Settings
+from backend.utils.provider_registry import BUILTIN_PROVIDERS, ProviderRegistry, load_provider_class
+from backend.utils.search import PROVIDER_MAP, _group_providers
+from backend.utils.search_providers.wikipedia import WikipediaProvider
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+WIKIPEDIA_PATH = "backend.utils.search_providers.wikipedia:WikipediaProvider"
+
+
+def entry_point(name, value):
+    return EntryPoint(name=name, value=value, group="researcher_agent.search_providers")
+
+
+class TestProviderRegistry:
+    """Tests for ProviderRegistry."""
+
+    def test_path_is_loaded_on_first_lookup(self):
+        registry = ProviderRegistry({"wikipedia": WIKIPEDIA_PATH}, entry_point_group=None)
+        assert not registry.is_loaded("wikipedia")
+
+        assert registry["wikipedia"] is WikipediaProvider
+        assert registry.is_loaded("wikipedia")
+
+    def test_unknown_name_raises_key_error(self):
+        registry = ProviderRegistry({}, entry_point_group=None)
+        assert "missing" not in registry
+        with pytest.raises(KeyError):
+            registry["missing"]
+
+    def test_bad_paths(self):
+        with pytest.raises(ImportError):
+            load_provider_class("backend.utils.search_providers.wikipedia")
+        with pytest.raises(ImportError):
+            load_provider_class("backend.utils.search_providers.wikipedia:Missing")
+        with pytest.raises(TypeError):
+            load_provider_class("backend.utils.search_providers.wikipedia:WikipediaAPI")
+
+    def test_entry_points_are_discovered(self):
+        advertised = [entry_point("wiki_mirror", WIKIPEDIA_PATH)]
+        with patch("backend.utils.provider_registry.entry_points", return_value=advertised) as read:
+            registry = ProviderRegistry({"wikipedia": WIKIPEDIA_PATH})
+            assert "wikipedia" in registry
+            read.assert_not_called()  # Built-in hits never read entry point metadata
+
+            assert list(registry) == ["wikipedia", "wiki_mirror"]
+            assert not registry.is_loaded("wiki_mirror")
+            assert registry["wiki_mirror"] is WikipediaProvider
+            read.assert_called_once()
+
+    def test_entry_points_cannot_override_builtins(self):
+        advertised = [entry_point("wikipedia", "some_plugin:Provider")]
+        with patch("backend.utils.provider_registry.entry_points", return_value=advertised):
+            registry = ProviderRegistry({"wikipedia": WIKIPEDIA_PATH})
+            assert len(registry) == 1
+            assert registry["wikipedia"] is WikipediaProvider
+
+    def test_patch_dict_does_not_import_providers(self):
+        registry = ProviderRegistry(BUILTIN_PROVIDERS, entry_point_group=None)
+        with patch.dict(registry, {"wikipedia": WikipediaProvider}):
+            assert registry["wikipedia"] is WikipediaProvider
+        assert not any(registry.is_loaded(name) for name in BUILTIN_PROVIDERS)
+        assert list(registry) == list(BUILTIN_PROVIDERS)
+
+
+def test_group_providers_skips_unimportable_providers():
+    with patch.dict(PROVIDER_MAP, {"broken": "backend.utils.no_such_module:Provider"}):
+        assert _group_providers(["broken", "wikipedia"]) == [["wikipedia"]]
+
+
+_COLD_IMPORT = """
+import json, sys, time
+start = time.perf_counter()
+import backend.main
+import_ms = (time.perf_counter() - start) * 1000
+imported = sorted(sys.modules)
+from backend.config import settings
+from backend.utils.search import get_provider
+start = time.perf_counter()
+for name in settings.SEARCH_PROVIDERS:
+    get_provider(name)
+providers_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({"import_ms": import_ms, "providers_ms": providers_ms,
+                  "imported": imported, "modules": sorted(sys.modules)}))
+"""
+
+
+def _cold_import(search_providers: str) -> dict:
+    """Import backend.main in a fresh interpreter and load the configured providers."""
+    env = dict(os.environ, SEARCH_PROVIDERS=search_providers, PYTHONDONTWRITEBYTECODE="1")
+    completed = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", _COLD_IMPORT],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, timeout=120, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def test_cold_import_time_default_vs_minimal_providers():
+    default = _cold_import(",".join(Settings.model_fields["SEARCH_PROVIDERS"].default))
+    minimal = _cold_import("wikipedia")
+    print(
+        f"\ncold import of backend.main: default providers {default['import_ms']:.0f} ms "
+        f"+ {default['providers_ms']:.0f} ms loading, "
+        f"minimal {minimal['import_ms']:.0f} ms + {minimal['providers_ms']:.0f} ms loading"
+    )
+
+    # Importing the app loads no provider at all; providers load on first use
+    for run in (default, minimal):
+        assert not any(m.startswith(("duckduckgo_search", "bs4")) for m in run["imported"])
+        assert not any(m.startswith("backend.utils.search_providers.") for m in run["imported"]
+                       if m != "backend.utils.search_providers.base")
+    for heavy in ("bs4", "backend.utils.search_providers.google", "backend.utils.search_providers.linkedin"):
+        assert heavy in default["modules"]
+        assert heavy not in minimal["modules"]
+    # Loading one provider costs less than loading the default three
+    assert minimal["providers_ms"] < default["providers_ms"]
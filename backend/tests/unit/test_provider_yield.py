@@ -0,0 +1,102 @@
+"""Unit tests for per-provider limits learned from extraction and citation yield."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.config import settings
+from backend.modules.social_media import SocialMediaResearcher
+from backend.utils.provider_yield import ProviderYieldTracker, cited_results, get_yield_tracker
+from backend.utils.search import gather_search_results
+
+
+class TestProviderYieldTracker:
+    """Tests for ProviderYieldTracker."""
+
+    def test_no_history_keeps_order_and_limit(self):
+        tracker = ProviderYieldTracker(path="")
+        assert tracker.plan("career", ["linkedin", "wikipedia"], 3) == [("linkedin", 3), ("wikipedia", 3)]
+
+    def test_low_yield_provider_moves_last_with_fewer_results(self):
+        tracker = ProviderYieldTracker(path="")
+        for _ in range(5):
+            tracker.record("social_media", {"instagram": 6, "wikipedia": 6}, {"instagram": 0, "wikipedia": 5})
+
+        plan = tracker.plan("social_media", ["instagram", "linkedin", "wikipedia"], 3)
+        assert [name for name, _ in plan] == ["wikipedia", "linkedin", "instagram"]
+        limits = dict(plan)
+        assert limits["wikipedia"] > 3 > limits["instagram"] >= settings.PROVIDER_YIELD_MIN_LIMIT
+        assert limits["wikipedia"] <= 3 * settings.PROVIDER_YIELD_MAX_FACTOR
+
+    def test_other_research_types_inform_the_prior(self):
+        tracker = ProviderYieldTracker(path="")
+        for _ in range(5):
+            tracker.record("career", {"instagram": 6}, {"instagram": 0})
+
+        assert tracker.yield_rate("hobbies", "instagram") < settings.PROVIDER_YIELD_PRIOR
+        # The type's own history outweighs the pooled yield
+        tracker.record("hobbies", {"instagram": 20}, {"instagram": 20})
+        assert tracker.yield_rate("hobbies", "instagram") > tracker.yield_rate("career", "instagram")
+
+    def test_counts_persist_across_restarts(self, tmp_path):
+        path = str(tmp_path / "yield.sqlite3")
+        tracker = ProviderYieldTracker(path=path)
+        tracker.record("financial", {"google_news": 4, "linkedin": 4}, {"google_news": 3})
+        plan = tracker.plan("financial", ["linkedin", "google_news"], 3)
+        tracker.close()
+
+        restarted = ProviderYieldTracker(path=path)
+        assert restarted.plan("financial", ["linkedin", "google_news"], 3) == plan
+        assert restarted.stats()["financial"]["google_news"]["useful"] == 3
+        restarted.close()
+
+
+def test_cited_results_match_urls_and_titles():
+    results = [
+        {"link": "https://www.reuters.com/tesla-earnings", "title": "Tesla earnings beat estimates"},
+        {"link": "https://en.wikipedia.org/wiki/Tesla,_Inc.", "title": "Tesla, Inc."},
+        {"link": "https://instagram.com/teslamotors", "title": "Tesla (@teslamotors)"},
+        {"link": "https://example.com/x", "title": "Tesla", "links": ["https://example.com/x", "https://copy.com/y"]},
+    ]
+    sources = [
+        "Reuters (https://reuters.com/tesla-earnings?utm_source=feed).",
+        "Wikipedia",
+        "Tesla earnings beat estimates",
+        "https://copy.com/y",
+    ]
+    assert cited_results(results, sources) == [True, False, False, True]
+
+
+@pytest.mark.asyncio
+async def test_gather_applies_per_provider_limits():
+    results = [{"title": f"r{i}", "link": f"https://example.com/{i}"} for i in range(5)]
+    with patch("backend.utils.search.get_provider") as get_provider:
+        get_provider.return_value.asearch = AsyncMock(return_value=results)
+        gathered = await gather_search_results(["Tesla"], limit=3, providers=["wikipedia"], limits={"wikipedia": 2})
+
+    assert [r["title"] for r in gathered] == ["r0", "r1"]
+    get_provider.return_value.asearch.assert_awaited_once_with("Tesla", limit=2)
+
+
+@pytest.mark.asyncio
+async def test_research_module_learns_from_citations():
+    pairs = [
+        ("instagram", {"title": "Tesla (@teslamotors)", "link": "https://instagram.com/teslamotors"}),
+        ("wikipedia", {"title": "Tesla, Inc. - Wikipedia", "link": "https://en.wikipedia.org/wiki/Tesla,_Inc."}),
+    ]
+    researcher = SocialMediaResearcher("Tesla", "company")
+    researcher.research_type = "social_media"
+    researcher.selected_providers = ["instagram", "wikipedia"]
+
+    with patch("backend.modules.base.gather_attributed_results", AsyncMock(return_value=pairs)) as gather, \
+            patch("backend.modules.base.llm_service.generate_json", AsyncMock(side_effect=[
+                {"queries": ["Tesla social media"]},
+                {"key_sources": ["https://en.wikipedia.org/wiki/Tesla,_Inc."], "narrative_summary": "..."}
+            ])):
+        data = await researcher.research()
+
+    assert gather.await_args.kwargs["limits"] == {"instagram": 3, "wikipedia": 3}
+    assert [r["provider"] for r in data["_raw_search_results"]] == ["instagram", "wikipedia"]
+    stats = get_yield_tracker().stats()["social_media"]
+    assert stats["wikipedia"]["useful"] == 1
+    assert stats["instagram"]["useful"] == 0
@@ -0,0 +1,119 @@
+"""Unit tests for the per-upstream search rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import patch
+
+from backend.utils.rate_limit import TokenBucket, ProviderRateLimiter, SearchRateLimiter, get_search_limiter
+from backend.utils.search import gather_search_results
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_is_free_then_waits(self):
+        bucket = TokenBucket(rate=10, burst=2)
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.02)
+        # Each queued caller waits for its own token
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.02)
+        assert bucket.wait_time() == pytest.approx(0.3, abs=0.02)
+
+    def test_refund_restores_capacity(self):
+        bucket = TokenBucket(rate=10, burst=1)
+        bucket.reserve()
+        bucket.reserve()
+        bucket.refund()
+        assert bucket.wait_time() == pytest.approx(0.1, abs=0.02)
+
+    @pytest.mark.asyncio
+    async def test_acquire_paces_callers(self):
+        bucket = TokenBucket(rate=20, burst=1)
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+        # First token is free, the other two wait 50ms each
+        assert time.monotonic() - start >= 0.09
+
+
+class TestProviderRateLimiter:
+    """Tests for ProviderRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_and_queue_depth(self):
+        limiter = ProviderRateLimiter("test", qps=1000, burst=1000, max_concurrency=2)
+        release = asyncio.Event()
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            async with limiter.acquire():
+                peak = max(peak, limiter.in_flight)
+                await release.wait()
+
+        tasks = [asyncio.create_task(call()) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        stats = limiter.stats()
+        assert stats["in_flight"] == 2
+        assert stats["queue_depth"] == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert peak == 2
+        assert limiter.stats()["queue_depth"] == 0
+        assert limiter.stats()["acquired"] == 5
+
+    @pytest.mark.asyncio
+    async def test_callers_queue_instead_of_failing(self):
+        limiter = ProviderRateLimiter("test", qps=20, burst=1, max_concurrency=5)
+
+        async def call():
+            async with limiter.acquire():
+                return True
+
+        assert await asyncio.gather(*(call() for _ in range(3))) == [True, True, True]
+        stats = limiter.stats()
+        assert stats["delayed"] == 2
+        assert stats["max_wait_seconds"] >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_frees_its_place(self):
+        limiter = ProviderRateLimiter("test", qps=1, burst=1, max_concurrency=5)
+        async with limiter.acquire():
+            pass
+
+        waiter = asyncio.create_task(limiter.acquire().__aenter__())
+        await asyncio.sleep(0.01)
+        assert limiter.queue_depth == 1
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.queue_depth == 0
+        assert limiter.bucket.wait_time() < 1.0
+
+
+def test_limits_come_from_config():
+    limiter = SearchRateLimiter({"duckduckgo": {"qps": 1, "burst": 3, "concurrency": 2}})
+    ddg = limiter.get("duckduckgo")
+    assert (ddg.qps, ddg.burst, ddg.max_concurrency) == (1, 3, 2)
+    # Unlisted upstreams fall back to the defaults
+    other = limiter.get("other")
+    assert other.max_concurrency > 0 and other.qps > 0
+
+
+class FakeDDGS:
+    def text(self, query, max_results=None):
+        return [{"title": "t", "href": "https://reddit.com/1", "body": "b"}]
+
+
+@pytest.mark.asyncio
+async def test_site_providers_share_duckduckgo_budget():
+    with patch("backend.utils.search_providers.ddg.get_ddgs", return_value=FakeDDGS()):
+        await gather_search_results(["Tesla"], limit=1, providers=["reddit"])
+        await gather_search_results(["SpaceX"], limit=1, providers=["reddit", "github"])
+
+    stats = get_search_limiter().stats()
+    assert list(stats) == ["duckduckgo"]
+    assert stats["duckduckgo"]["acquired"] == 2
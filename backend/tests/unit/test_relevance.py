@@ -0,0 +1,74 @@
+"""Unit tests for BM25 relevance ranking."""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from backend.utils.relevance import tokenize, bm25_scores, rank_results
+from backend.utils.search_utils import SearchResult, SearchProvider
+
+
+def make_result(title, snippet):
+    return SearchResult(
+        url=f"https://example.com/{title.replace(' ', '-')}",
+        title=title,
+        snippet=snippet,
+        source=SearchProvider.DUCKDUCKGO,
+        timestamp=datetime.now()
+    )
+
+
+class TestBM25:
+    """Tests for bm25_scores."""
+
+    def test_tokenize_drops_stopwords(self):
+        assert tokenize("What is the revenue of Tesla?") == ["revenue", "tesla"]
+
+    def test_matches_reference_formula(self):
+        docs = ["tesla revenue grew", "tesla cars", "weather today sunny"]
+        scores = bm25_scores("tesla revenue", docs, k1=1.5, b=0.75)
+
+        # Hand-computed Okapi BM25 with the same IDF smoothing
+        n, avg = 3, 8 / 3
+        idf = lambda df: np.log1p((n - df + 0.5) / (df + 0.5))
+        term = lambda tf, length, df: idf(df) * tf * 2.5 / (tf + 1.5 * (0.25 + 0.75 * length / avg))
+        expected = [term(1, 3, 2) + term(1, 3, 1), term(1, 2, 2), 0.0]
+        assert scores == pytest.approx(expected)
+
+    def test_rare_terms_weigh_more(self):
+        docs = ["tesla news", "tesla news", "tesla revenue"]
+        scores = bm25_scores("tesla revenue", docs)
+        assert scores[2] > scores[0]
+
+    def test_empty_inputs(self):
+        assert bm25_scores("tesla", []).shape == (0,)
+        assert list(bm25_scores("the of", ["tesla"])) == [0.0]
+
+
+class TestRankResults:
+    """Tests for rank_results."""
+
+    def test_orders_and_fills_relevance_score(self):
+        results = [
+            make_result("Weather", "Sunny skies this weekend"),
+            make_result("Tesla revenue", "Tesla quarterly revenue grew"),
+            make_result("Tesla cars", "New Tesla models announced"),
+        ]
+        ranked = rank_results("Tesla revenue", results, top_k=5, min_score=0.0)
+
+        assert [r.title for r in ranked] == ["Tesla revenue", "Tesla cars", "Weather"]
+        assert ranked[0].relevance_score == 1.0
+        assert 0 < ranked[1].relevance_score < 1
+        assert results[0].relevance_score == 0.0
+
+    def test_threshold_and_top_k(self):
+        results = [make_result(f"Tesla revenue {n}", "Tesla revenue report") for n in range(4)]
+        results.append(make_result("Weather", "Sunny skies this weekend"))
+
+        assert len(rank_results("Tesla revenue", results, top_k=3, min_score=0.2)) == 3
+        assert len(rank_results("Tesla revenue", results, top_k=10, min_score=0.2)) == 4
+
+    def test_no_matches_keeps_provider_order(self):
+        results = [make_result("Alpha", "one"), make_result("Beta", "two")]
+        assert rank_results("Tesla", results, top_k=1) == results[:1]
@@ -0,0 +1,129 @@
+"""Tests for the record/replay stand-in server used by the search benchmarks."""
+
+import json
+import time
+
+import pytest
+import requests
+
+from backend.benchmarks.replay import (
+    DEFAULT_FIXTURES, DDGS_HOST, Exchange, Recorder, RecordingDDGS, RecordingTransport,
+    ReplayServer, load_exchanges, point_providers_at, save_exchanges
+)
+from backend.benchmarks.search_layer import run
+from backend.config import settings
+from backend.utils.http_pool import HTTPClientPool
+from backend.utils.search import get_search_results
+
+
+FEED = b"""<?xml version="1.0"?><rss><channel>
+<item><title>Tesla opens factory</title><link>https://example.com/a</link><pubDate>Mon</pubDate></item>
+</channel></rss>"""
+
+
+@pytest.fixture
+def exchanges():
+    return [
+        Exchange.from_url(
+            "https://news.google.com/rss/search?q=Tesla&hl=en-US",
+            content_type="application/xml", body=FEED
+        ),
+        Exchange.from_url("https://news.google.com/old", status=301,
+                          headers={"Location": "https://news.google.com/rss/search?q=Tesla&hl=en-US"}),
+    ]
+
+
+class TestReplayServer:
+    """Tests for ReplayServer."""
+
+    def test_serves_recorded_exchange(self, exchanges):
+        with ReplayServer(exchanges) as server:
+            response = requests.get(f"{server.url}/news.google.com/rss/search?hl=en-US&q=Tesla")
+
+        assert response.status_code == 200
+        assert response.content == FEED
+        assert response.headers["Content-Type"] == "application/xml"
+        assert server.stats.hits == 1
+
+    def test_fallback_and_exact_matching(self, exchanges):
+        url = "/news.google.com/rss/search?q=Other"
+        with ReplayServer(exchanges) as server:
+            assert requests.get(server.url + url).content == FEED
+            assert server.stats.fallbacks == 1
+        with ReplayServer(exchanges, fallback=False) as server:
+            assert requests.get(server.url + url).status_code == 404
+            assert server.stats.misses == 1
+
+    def test_redirects_stay_on_server(self, exchanges):
+        with ReplayServer(exchanges) as server:
+            response = requests.get(f"{server.url}/news.google.com/old")
+        assert response.status_code == 200
+        assert response.content == FEED
+
+    def test_latency_and_error_injection(self, exchanges):
+        with ReplayServer(exchanges, latency_ms=100) as server:
+            start = time.perf_counter()
+            requests.get(f"{server.url}/news.google.com/rss/search?q=Tesla&hl=en-US")
+            assert time.perf_counter() - start >= 0.1
+
+        with ReplayServer(exchanges, error_rate=1.0, error_status=429) as server:
+            response = requests.get(f"{server.url}/news.google.com/rss/search?q=Tesla&hl=en-US")
+        assert response.status_code == 429
+        assert server.stats.injected_errors == 1
+
+    def test_providers_are_pointed_at_server(self, exchanges):
+        original_url = settings.GOOGLE_NEWS_RSS_URL
+        with ReplayServer(exchanges) as server, point_providers_at(server):
+            results = get_search_results("Tesla", providers=["google_news"], use_cache=False)
+        assert settings.GOOGLE_NEWS_RSS_URL == original_url
+        assert [r["title"] for r in results] == ["Tesla opens factory"]
+
+
+class TestRecording:
+    """Tests for the recording transport and DDGS wrapper."""
+
+    @pytest.mark.asyncio
+    async def test_transport_records_exchanges(self, tmp_path, exchanges):
+        recorder = Recorder()
+        pool = HTTPClientPool(transport=RecordingTransport(recorder))
+        with ReplayServer(exchanges) as server:
+            response = await pool.get("google_news", f"{server.url}/news.google.com/rss/search?q=Tesla&hl=en-US")
+            await pool.aclose()
+
+        assert response.content == FEED
+        [exchange] = recorder.exchanges
+        assert exchange.path == "/news.google.com/rss/search"
+        assert exchange.body == FEED
+
+        save_exchanges(tmp_path / "exchanges.json", recorder.exchanges)
+        assert load_exchanges(tmp_path / "exchanges.json")[0].key == exchange.key
+
+    def test_ddgs_results_are_recorded_and_replayed(self):
+        class FakeDDGS:
+            def text(self, keywords, max_results=None):
+                return [{"title": keywords, "href": "https://example.com", "body": "text"}]
+
+        recorder = Recorder()
+        RecordingDDGS(recorder, FakeDDGS()).text("Tesla", max_results=2)
+        [exchange] = recorder.exchanges
+        assert exchange.host == DDGS_HOST
+
+        with ReplayServer(recorder.exchanges, fallback=False) as server, point_providers_at(server):
+            from backend.utils.search_providers.ddg import get_ddgs
+            assert get_ddgs().text("Tesla", max_results=2) == json.loads(exchange.body)
+
+
+def test_benchmark_runs_against_bundled_fixtures(monkeypatch):
+    for name in ("SEARCH_RATE_LIMITS", "SEARCH_RATE_LIMIT_DEFAULT_QPS",
+                 "SEARCH_RATE_LIMIT_DEFAULT_BURST", "MAX_CONCURRENT_SEARCHES"):
+        monkeypatch.setattr(settings, name, getattr(settings, name))
+    monkeypatch.setattr(settings, "SEARCH_PROVIDERS", ["google_news", "wikipedia", "linkedin"])
+
+    with ReplayServer(load_exchanges(DEFAULT_FIXTURES)) as server:
+        levels = run(server, [1, 4], calls=4, report=lambda line: None)
+
+    assert [(level.target, level.concurrency) for level in levels] == [
+        ("get_search_results", 1), ("SearchClient", 1), ("get_search_results", 4), ("SearchClient", 4)
+    ]
+    assert all(level.failed == 0 and len(level.latencies_ms) == 4 for level in levels)
+    assert server.stats.misses == 0
@@ -0,0 +1,76 @@
+"""Unit tests for the lxml fast-path result parsers."""
+
+from pathlib import Path
+
+import pytest
+from unittest.mock import patch
+
+from backend.utils import result_parsers
+from backend.utils.result_parsers import parse_rss_items, parse_result_links
+from backend.utils.search_providers.google import GoogleNewsProvider
+from backend.utils.search_providers.linkedin import LinkedInProvider
+
+
+CORPUS_DIR = Path(__file__).resolve().parents[2] / "benchmarks" / "corpus"
+
+
+@pytest.fixture
+def rss_feed():
+    return (CORPUS_DIR / "google_news_rss.xml").read_bytes()
+
+
+@pytest.fixture
+def ddg_page():
+    return (CORPUS_DIR / "ddg_linkedin.html").read_bytes()
+
+
+class TestParseRssItems:
+    """Tests for parse_rss_items."""
+
+    @pytest.mark.parametrize("limit", [1, 5, 100])
+    def test_matches_beautifulsoup(self, rss_feed, limit):
+        assert parse_rss_items(rss_feed, limit) == result_parsers._parse_rss_items_bs4(rss_feed, limit)
+
+    def test_stops_after_limit(self):
+        # Garbage after the second item is never reached
+        feed = b"<rss><channel><item><title>A</title></item><item><title>B</title></item><broken"
+        with patch.object(result_parsers, "_parse_rss_items_bs4") as fallback:
+            items = parse_rss_items(feed, 2)
+
+        fallback.assert_not_called()
+        assert [item["title"] for item in items] == ["A", "B"]
+
+    def test_falls_back_on_malformed_feed(self):
+        feed = b"<rss><channel><item><title>A &amp; B</title><link>http://a</link></item><item><title>C</b></item>"
+        items = parse_rss_items(feed, 5)
+
+        assert items[0] == {"title": "A & B", "link": "http://a", "pub_date": None}
+        assert items[1]["title"] == "C"
+
+    def test_empty_document(self):
+        assert parse_rss_items(b"", 5) == []
+
+
+class TestParseResultLinks:
+    """Tests for parse_result_links."""
+
+    @pytest.mark.parametrize("limit", [1, 5, 100])
+    def test_matches_beautifulsoup(self, ddg_page, limit):
+        assert parse_result_links(ddg_page, limit) == result_parsers._parse_result_links_bs4(ddg_page, limit)
+
+    def test_only_result_links(self):
+        page = b'<a class="result__url" href="/x">url</a><a class="result__a big" href="/y">Hi <b>there</b></a>'
+        assert parse_result_links(page, 5) == [{"title": "Hi there", "href": "/y"}]
+
+
+def test_google_news_defaults_for_missing_fields():
+    feed = b"<rss><channel><item><description>d</description></item></channel></rss>"
+    assert GoogleNewsProvider()._parse_feed(feed, 5) == [{
+        "title": "No Title", "link": "#", "published_date": "", "source": "Google News"
+    }]
+
+
+def test_linkedin_parses_corpus_page(ddg_page):
+    results = LinkedInProvider()._parse_results(200, ddg_page, 3)
+    assert len(results) == 3
+    assert all(r["title"].endswith("| LinkedIn") and r["source"] == "LinkedIn" for r in results)
@@ -0,0 +1,143 @@
+"""Unit tests for the two-tier search result cache."""
+
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+from backend.config import settings
+from backend.utils.search_cache import SearchCache
+from backend.utils.search import gather_search_results, get_search_results
+from backend.utils.search_utils import SearchClient, SearchResult, SearchProvider
+
+
+RESULTS = [{"title": "Tesla", "link": "http://a", "source": "Wikipedia"}]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = SearchCache(max_entries=2, path=str(tmp_path / "cache.sqlite3"), ttls={"google_news": 60})
+    yield c
+    c.close()
+
+
+class TestSearchCache:
+    """Tests for SearchCache tiers, TTLs and counters."""
+
+    def test_miss_then_memory_hit(self, cache):
+        assert cache.get("wikipedia", "Tesla", 5) is None
+        cache.set("wikipedia", "Tesla", 5, RESULTS)
+
+        assert cache.get("wikipedia", "Tesla", 5) == RESULTS
+        stats = cache.stats()
+        assert stats["misses"] == 1
+        assert stats["memory_hits"] == 1
+
+    def test_key_normalizes_case_and_whitespace(self, cache):
+        cache.set("wikipedia", "Tesla  Inc", 5, RESULTS)
+        assert cache.get("wikipedia", " tesla inc ", 5) == RESULTS
+        # Limit is part of the key
+        assert cache.get("wikipedia", "tesla inc", 3) is None
+
+    def test_lru_eviction_falls_back_to_disk(self, cache):
+        cache.set("wikipedia", "a", 5, RESULTS)
+        cache.set("wikipedia", "b", 5, RESULTS)
+        cache.set("wikipedia", "c", 5, RESULTS)
+
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["memory_entries"] == 2
+        assert cache.get("wikipedia", "a", 5) == RESULTS
+        assert cache.stats()["disk_hits"] == 1
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        first = SearchCache(path=path)
+        first.set("wikipedia", "Tesla", 5, RESULTS)
+        first.close()
+
+        second = SearchCache(path=path)
+        assert second.get("wikipedia", "Tesla", 5) == RESULTS
+        second.close()
+
+    def test_per_provider_ttl_expiry(self, cache):
+        assert cache.ttl_for("google_news") == 60
+        assert cache.ttl_for("wikipedia") == cache.default_ttl
+
+        with patch("backend.utils.search_cache.time.time", return_value=1000.0):
+            cache.set("google_news", "Tesla", 5, RESULTS)
+        with patch("backend.utils.search_cache.time.time", return_value=1061.0):
+            assert cache.get("google_news", "Tesla", 5) is None
+        assert cache.stats()["expirations"] >= 1
+
+    def test_empty_results_cached_briefly(self, cache):
+        assert cache.ttl_for("wikipedia", empty=True) == cache.empty_ttl
+        with patch("backend.utils.search_cache.time.time", return_value=1000.0):
+            cache.set("wikipedia", "nothing", 5, [])
+            assert cache.get("wikipedia", "nothing", 5) == []
+        with patch("backend.utils.search_cache.time.time", return_value=1001.0 + cache.empty_ttl):
+            assert cache.get("wikipedia", "nothing", 5) is None
+
+    def test_empty_ttl_zero_disables_empty_caching(self):
+        cache = SearchCache(path="", empty_ttl=0)
+        cache.set("wikipedia", "nothing", 5, [])
+        assert cache.stats()["writes"] == 0
+
+
+class TestCacheIntegration:
+    """Tests for the cache in front of both search layers."""
+
+    @pytest.fixture(autouse=True)
+    def enabled_cache(self, monkeypatch, cache):
+        monkeypatch.setattr(settings, "SEARCH_CACHE_ENABLED", True)
+        with patch("backend.utils.search.get_search_cache", return_value=cache), \
+                patch("backend.utils.search_utils.get_search_cache", return_value=cache):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_gather_serves_repeat_queries_from_cache(self):
+        provider = AsyncMock(return_value=RESULTS)
+        with patch("backend.utils.search.get_provider") as get_provider:
+            get_provider.return_value.asearch = provider
+            await gather_search_results(["Tesla"], providers=["wikipedia"])
+            results = await gather_search_results(["tesla"], providers=["wikipedia"])
+
+        assert results == RESULTS
+        assert provider.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_bypass_flag_skips_cache(self, cache):
+        provider = AsyncMock(return_value=RESULTS)
+        with patch("backend.utils.search.get_provider") as get_provider:
+            get_provider.return_value.asearch = provider
+            await gather_search_results(["Tesla"], providers=["wikipedia"])
+            await gather_search_results(["Tesla"], providers=["wikipedia"], use_cache=False)
+
+        assert provider.await_count == 2
+        assert cache.stats()["bypasses"] == 1
+
+    def test_sync_search_uses_cache(self):
+        with patch("backend.utils.search.get_provider") as get_provider:
+            get_provider.return_value.search.return_value = RESULTS
+            get_search_results("Tesla", providers=["wikipedia"])
+            get_search_results("Tesla", providers=["wikipedia"])
+
+        assert get_provider.return_value.search.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_search_client_round_trips_search_results(self):
+        result = SearchResult(
+            url="https://en.wikipedia.org/wiki/Tesla",
+            title="Tesla",
+            snippet="Tesla is an American company and it was founded in 2003",
+            source=SearchProvider.WIKIPEDIA,
+            timestamp=datetime.now()
+        )
+        client = SearchClient()
+        client._search_wikipedia = AsyncMock(return_value=[result])
+
+        await client.search("Tesla", SearchProvider.WIKIPEDIA, 5)
+        cached = await client.search("Tesla", SearchProvider.WIKIPEDIA, 5)
+
+        assert client._search_wikipedia.await_count == 1
+        assert cached[0].url == result.url
+        assert cached[0].source == SearchProvider.WIKIPEDIA
+        await client.close()
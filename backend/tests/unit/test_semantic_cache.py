@@ -0,0 +1,189 @@
+"""Unit tests for the semantic LLM cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from structlog.testing import capture_logs
+
+from backend.config import settings
+from backend.utils.llm_utils import LLMClient, LLMProvider, TaskType
+from backend.utils.semantic_cache import SemanticCache, embed, get_semantic_cache
+
+
+SNIPPET = (
+    "Tesla delivered 1.81 million vehicles in 2023, up 38% from a year earlier, the company said "
+    "on Tuesday, meeting its annual target. Model Y was the best-selling car worldwide."
+)
+OTHER_SNIPPET = (
+    "Rivian produced 57,232 vehicles in 2023 and delivered 50,122, the electric truck maker said, "
+    "beating its production guidance. Shares rose in premarket trading."
+)
+
+
+class TestSemanticCache:
+    """Tests for the hashed n-gram index."""
+
+    def test_embedding_is_normalized_and_deterministic(self):
+        vector = embed(SNIPPET)
+        assert vector.shape == (settings.SEMANTIC_CACHE_DIM,)
+        assert abs(float(vector @ vector) - 1.0) < 1e-5
+        assert (embed(SNIPPET) == vector).all()
+        assert not embed("the of and").any()
+
+    def test_rephrased_question_matches(self):
+        cache = SemanticCache(max_entries=8)
+        cache.add(1, "What is Tesla's revenue?", "revenue")
+
+        response, similarity = cache.lookup(1, "What was Tesla's revenue?")
+        assert response == "revenue"
+        assert similarity >= cache.threshold
+
+        # Another partition, another question or different numbers never match
+        assert cache.lookup(2, "What is Tesla's revenue?")[0] is None
+        assert cache.lookup(1, "What is Tesla's market cap?")[0] is None
+        cache.add(1, "What was Tesla's revenue in 2023?", "2023")
+        assert cache.lookup(1, "What was Tesla's revenue in 2022?")[0] is None
+
+    def test_question_words_are_kept(self):
+        cache = SemanticCache(max_entries=8)
+        cache.add(1, "Who founded Tesla?", "founders")
+        assert cache.lookup(1, "When was Tesla founded?")[0] is None
+
+    def test_index_is_bounded(self):
+        cache = SemanticCache(max_entries=2)
+        for text in ["Tesla deliveries", "Rivian production", "Lucid earnings"]:
+            cache.add(1, text, text)
+        cache.add(1, "Lucid earnings", "refreshed")  # Same text reuses its slot
+
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
+        assert cache.lookup(1, "Tesla deliveries")[0] is None
+        assert cache.lookup(1, "Lucid earnings")[0] == "refreshed"
+
+
+class TestLLMClientSemanticCaching:
+    """Tests for the semantic cache in LLMClient.complete_json."""
+
+    @pytest.fixture
+    def llm(self):
+        client = LLMClient(provider=LLMProvider.OPENAI)
+        client.openai_client = MagicMock()
+        create = AsyncMock(return_value=MagicMock(
+            choices=[MagicMock(message=MagicMock(content='{"extracted_facts": ["1.81 million"]}'))]
+        ))
+        client.openai_client.chat.completions.create = create
+        return client, create
+
+    async def _extract(self, client, question, content=SNIPPET):
+        return await client.complete_json(
+            prompt=f"Question: {question}\nContent: {content}",
+            task_type=TaskType.EXTRACTION,
+            temperature=0.3,
+            semantic_text=question,
+            semantic_scope=content
+        )
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_prompt_is_served(self, llm):
+        client, create = llm
+        with capture_logs() as logs:
+            first = await self._extract(client, "How many vehicles did Tesla deliver?")
+            second = await self._extract(client, "How many vehicles does Tesla deliver?")
+
+        assert first == second
+        assert create.await_count == 1
+        assert [e["status"] for e in logs if e["event"] == "llm_semantic_cache"] == ["miss", "hit"]
+        assert get_semantic_cache().stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_audit_mode_logs_without_serving(self, llm, monkeypatch):
+        client, create = llm
+        monkeypatch.setattr(settings, "SEMANTIC_CACHE_AUDIT", True)
+        with capture_logs() as logs:
+            await self._extract(client, "How many vehicles did Tesla deliver?")
+            await self._extract(client, "How many vehicles does Tesla deliver?")
+
+        assert create.await_count == 2
+        audit = [e for e in logs if e["event"] == "llm_semantic_cache"][-1]
+        assert audit["status"] == "would_hit"
+        assert audit["same_response"] is True
+        assert audit["similarity"] >= settings.SEMANTIC_CACHE_THRESHOLD
+
+    @pytest.mark.asyncio
+    async def test_different_questions_over_same_content_miss(self, llm):
+        client, create = llm
+        wiki = (
+            "Tesla, Inc. is an American electric vehicle and clean energy company headquartered in Austin, "
+            "Texas. It was founded in 2003 by Martin Eberhard and Marc Tarpenning; Elon Musk is its CEO. "
+            "Tesla designs and makes electric cars, stationary batteries and solar panels."
+        )
+        for question in (
+            "Who founded Tesla?", "Who is the CEO of Tesla?",
+            "Where is Tesla headquartered?", "What products does Tesla make?"
+        ):
+            await self._extract(client, question, content=wiki)
+
+        assert create.await_count == 4
+        assert get_semantic_cache().stats()["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_same_question_over_other_content_misses(self, llm):
+        client, create = llm
+        await self._extract(client, "How many vehicles were delivered?")
+        await self._extract(client, "How many vehicles were delivered?", content=OTHER_SNIPPET)
+        assert create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rejected_response_is_not_indexed(self, llm):
+        client, create = llm
+
+        def reject(response):
+            raise ValueError("no facts wanted")
+
+        with pytest.raises(ValueError):
+            await client.complete_json(
+                prompt=f"Question: How many vehicles did Tesla deliver?\nContent: {SNIPPET}",
+                task_type=TaskType.EXTRACTION,
+                temperature=0.3,
+                semantic_text="How many vehicles did Tesla deliver?",
+                semantic_scope=SNIPPET,
+                validate=reject
+            )
+        assert get_semantic_cache().stats()["writes"] == 0
+
+        await self._extract(client, "How many vehicles does Tesla deliver?")
+        assert create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_match_the_caller_rejects_is_not_served(self, llm):
+        client, create = llm
+        await self._extract(client, "How many vehicles did Tesla deliver?")
+
+        def reject(response):
+            raise ValueError("stale")
+
+        with pytest.raises(ValueError):
+            await client.complete_json(
+                prompt=f"Question: How many vehicles does Tesla deliver?\nContent: {SNIPPET}",
+                task_type=TaskType.EXTRACTION,
+                temperature=0.3,
+                semantic_text="How many vehicles does Tesla deliver?",
+                semantic_scope=SNIPPET,
+                validate=reject
+            )
+        assert create.await_count == 2
+        assert get_semantic_cache().stats()["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_only_configured_task_types(self, llm):
+        client, create = llm
+        for _ in range(2):
+            await client.complete_json(
+                prompt=f"Verify: {SNIPPET}",
+                task_type=TaskType.VERIFICATION,
+                use_cache=False,
+                semantic_text=SNIPPET
+            )
+        assert create.await_count == 2
+        assert get_semantic_cache().stats()["writes"] == 0
@@ -0,0 +1,93 @@
+"""Unit tests for single-flight coalescing of identical searches."""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from backend.utils.single_flight import SingleFlight
+from backend.utils.search import gather_search_results
+
+
+class TestSingleFlight:
+    """Tests for the SingleFlight group."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return ["result"]
+
+        results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(5)))
+
+        assert calls == 1
+        assert results == [["result"]] * 5
+        assert flight.stats()["coalesced"] == 4
+        assert flight.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return 1
+
+        await asyncio.gather(flight.do("a", fetch), flight.do("b", fetch))
+
+        assert flight.stats()["executions"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.ensure_future(flight.do("key", fetch))
+        follower = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "done"
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_coalesced(self):
+        flight = SingleFlight()
+
+        async def fetch():
+            return 1
+
+        await flight.do("key", fetch)
+        await flight.do("key", fetch)
+
+        assert flight.stats()["executions"] == 2
+
+
+@pytest.mark.asyncio
+async def test_overlapping_fanouts_coalesce_provider_calls():
+    calls = 0
+
+    async def asearch(query, limit=5):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return [{"title": query, "link": "http://a", "source": "Fake"}]
+
+    flight = SingleFlight()
+    with patch("backend.utils.search.get_provider") as get_provider, \
+            patch("backend.utils.search.get_search_flight", return_value=flight):
+        get_provider.return_value.asearch = asearch
+        first, second = await asyncio.gather(
+            gather_search_results(["Tesla", "SpaceX"], providers=["wikipedia"]),
+            gather_search_results(["tesla"], providers=["wikipedia"])
+        )
+
+    assert calls == 2
+    assert second == [first[0]]
+    assert flight.stats()["coalesced"] == 1
@@ -0,0 +1,100 @@
+"""Unit tests for multiplexing site-scoped DuckDuckGo providers."""
+
+import pytest
+from unittest.mock import patch
+
+from backend.utils.rate_limit import get_search_limiter
+from backend.utils.search import gather_search_results, _group_providers
+from backend.utils.search_providers.ddg import search_sites
+from backend.utils.search_providers.reddit import RedditProvider
+from backend.utils.search_providers.github import GitHubProvider
+from backend.utils.search_providers.medium import MediumProvider
+
+
+def _item(url):
+    return {"title": url, "href": url, "body": f"snippet for {url}"}
+
+
+class FakeDDGS:
+    """Records queries and answers from a per-round script."""
+
+    def __init__(self, rounds):
+        self.rounds = list(rounds)
+        self.queries = []
+
+    def text(self, query, max_results=None):
+        self.queries.append((query, max_results))
+        return self.rounds.pop(0) if self.rounds else []
+
+
+class TestSearchSites:
+    """Tests for search_sites."""
+
+    def test_one_query_split_by_domain(self):
+        ddgs = FakeDDGS([[
+            _item("https://www.reddit.com/r/tesla/1"),
+            _item("https://github.com/tesla/repo"),
+            _item("https://old.reddit.com/r/tesla/2"),
+            _item("https://unrelated.com/page"),
+        ]])
+        with patch("backend.utils.search_providers.ddg.get_ddgs", return_value=ddgs):
+            reddit, github = search_sites([RedditProvider(), GitHubProvider()], "Tesla", limit=2)
+
+        assert ddgs.queries[0] == ("site:reddit.com OR site:github.com Tesla", 8)
+        assert [r["link"] for r in reddit] == [
+            "https://www.reddit.com/r/tesla/1", "https://old.reddit.com/r/tesla/2"
+        ]
+        assert reddit[0]["source"] == "Reddit"
+        assert [r["link"] for r in github] == ["https://github.com/tesla/repo"]
+        # Only the provider still short of its limit is searched again
+        assert ddgs.queries[1] == ("site:github.com Tesla", 2)
+
+    def test_crowded_out_site_is_retried(self):
+        busy_round = [_item(f"https://reddit.com/{n}") for n in range(4)]
+        busy_round += [_item("https://github.com/1"), _item("https://github.com/2")]
+        ddgs = FakeDDGS([busy_round, [_item("https://medium.com/1")]])
+        providers = [RedditProvider(), GitHubProvider(), MediumProvider()]
+        with patch("backend.utils.search_providers.ddg.get_ddgs", return_value=ddgs):
+            reddit, github, medium = search_sites(providers, "Tesla", limit=1)
+
+        assert len(ddgs.queries) == 2
+        assert ddgs.queries[1][0] == "site:medium.com Tesla"
+        assert (len(reddit), len(github), len(medium)) == (1, 1, 1)
+
+    def test_exhausted_sites_stop(self):
+        ddgs = FakeDDGS([[_item("https://reddit.com/1")]])
+        with patch("backend.utils.search_providers.ddg.get_ddgs", return_value=ddgs):
+            reddit, github = search_sites([RedditProvider(), GitHubProvider()], "Tesla", limit=1)
+
+        # A short round with nothing for GitHub means it has no more results
+        assert len(ddgs.queries) == 1
+        assert len(reddit) == 1 and github == []
+
+
+def test_group_providers_merges_site_scoped_ones():
+    groups = _group_providers(["google_news", "reddit", "github", "youtube", "wikipedia"])
+    assert groups == [["google_news"], ["wikipedia"], ["reddit", "github", "youtube"]]
+    # A single site-scoped provider is searched on its own
+    assert _group_providers(["reddit", "wikipedia"]) == [["reddit"], ["wikipedia"]]
+
+
+@pytest.mark.asyncio
+async def test_gather_multiplexes_and_keeps_provider_order():
+    ddgs = FakeDDGS([[_item("https://github.com/1"), _item("https://reddit.com/1")]])
+    with patch("backend.utils.search_providers.ddg.get_ddgs", return_value=ddgs):
+        results = await gather_search_results(["Tesla"], limit=1, providers=["reddit", "github"])
+
+    assert len(ddgs.queries) == 1
+    assert [r["source"] for r in results] == ["Reddit", "GitHub"]
+
+
+@pytest.mark.asyncio
+async def test_each_multiplexed_round_takes_a_rate_token():
+    busy_round = [_item(f"https://reddit.com/{n}") for n in range(8)]
+    ddgs = FakeDDGS([busy_round, [_item("https://github.com/1")], [_item("https://github.com/2")]])
+    with patch("backend.utils.search_providers.ddg.get_ddgs", return_value=ddgs):
+        await gather_search_results(["Tesla"], limit=2, providers=["reddit", "github"])
+
+    assert len(ddgs.queries) == 3
+    limiter = get_search_limiter().get("duckduckgo")
+    assert limiter.bucket.tokens == pytest.approx(limiter.burst - 3, abs=0.1)
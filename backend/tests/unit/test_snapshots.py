@@ -0,0 +1,232 @@
+"""Unit tests for raw search snapshots and re-synthesis from them (FR-020)."""
+
+import asyncio
+import threading
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.config import settings
+from backend.models import AgenticResearchRequest, ResearchPlan, SubQuestion
+from backend.modules.agentic_workflow import AgenticWorkflow
+from backend.modules.deep_researcher import DeepResearcher
+from backend.utils.provider_yield import get_yield_tracker
+from backend.utils.search_utils import SearchProvider, SearchResult
+from backend.utils.snapshots import SnapshotStore, get_snapshot_store
+
+
+def _result(n: int, source: SearchProvider = SearchProvider.DUCKDUCKGO) -> SearchResult:
+    return SearchResult(
+        url=f"https://example.com/tesla/{n}",
+        title=f"Tesla story {n}",
+        snippet=f"Tesla delivered {n} hundred thousand vehicles in the quarter, the company said",
+        source=source,
+        timestamp=datetime(2024, 1, 2, 3, 4, 5)
+    )
+
+
+@pytest.fixture
+def request_and_plan():
+    request = AgenticResearchRequest(id="run-1", query="Research Tesla deliveries in 2023")
+    plan = ResearchPlan(
+        id="plan-1",
+        request_id="run-1",
+        sub_questions=[
+            SubQuestion(id="q1", text="How many cars did Tesla deliver?", priority=1),
+            SubQuestion(id="q2", text="Who are Tesla's competitors?", priority=2),
+        ]
+    )
+    return request, plan
+
+
+class TestSnapshotStore:
+    """Tests for SnapshotStore."""
+
+    def test_round_trip_and_content_addressing(self, tmp_path, request_and_plan):
+        request, plan = request_and_plan
+        store = SnapshotStore(path=str(tmp_path / "snapshots.sqlite3"))
+        results = [_result(1).to_dict(), _result(1).to_dict(), _result(2).to_dict()]
+        page = "Tesla delivered 1.8 million vehicles in 2023. " * 50
+
+        store.save_run(request, plan)
+        store.save_question("run-1", plan.sub_questions[0], results, {"https://example.com/tesla/1": page})
+        store.save_question("run-1", plan.sub_questions[1], results, {"https://example.com/tesla/2": page})
+        store.close()
+
+        snapshot = SnapshotStore(path=str(tmp_path / "snapshots.sqlite3")).load_run("run-1")
+        assert snapshot.request == request
+        assert [q.text for q in snapshot.plan.sub_questions] == [q.text for q in plan.sub_questions]
+        question = snapshot.question("  how many cars did Tesla deliver?")
+        assert [r.url for r in question.search_results()] == [r["url"] for r in results]
+        assert snapshot.pages == {"https://example.com/tesla/1": page, "https://example.com/tesla/2": page}
+
+    def test_identical_payloads_are_stored_once_compressed(self, tmp_path, request_and_plan):
+        request, plan = request_and_plan
+        store = SnapshotStore(path=str(tmp_path / "snapshots.sqlite3"))
+        results = [_result(n).to_dict() for n in range(20)]
+        store.save_run(request, plan)
+        store.save_question("run-1", plan.sub_questions[0], results)
+        store.save_question("run-2", plan.sub_questions[0], results)
+
+        stats = store.stats()
+        assert stats["questions"] == 2
+        assert stats["blobs"] == 3  # Request, plan and one shared result list
+        assert stats["stored_bytes"] < stats["raw_bytes"] / 3
+        assert store.load_run("missing") is None
+
+
+class TestResynthesis:
+    """Tests for recording a run and replaying it without searching."""
+
+    @pytest.fixture(autouse=True)
+    def snapshots(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "SNAPSHOT_PATH", str(tmp_path / "snapshots.sqlite3"))
+        monkeypatch.setattr(settings, "PROVIDER_YIELD_ENABLED", False)
+        yield
+        get_snapshot_store().close()
+
+    @pytest.fixture
+    def llm(self):
+        client = MagicMock()
+        client.complete_json = AsyncMock(return_value={
+            "extracted_facts": ["Tesla delivered 1.8 million vehicles"],
+            "confidence": 0.9,
+            "new_topics_to_research": []
+        })
+        with patch("backend.modules.deep_researcher.get_llm_client", return_value=client):
+            yield client
+
+    @pytest.fixture
+    def workflow(self, llm, request_and_plan):
+        _, plan = request_and_plan
+        w = AgenticWorkflow()
+        w.planner = MagicMock()
+        w.planner.create_plan = AsyncMock(return_value=plan)
+        w.verifier = MagicMock()
+        w.verifier.verify_findings = AsyncMock(return_value=([], []))
+        w.synthesizer = MagicMock()
+        w.synthesizer.generate_report = AsyncMock(return_value=MagicMock(sections=[], total_word_count=0))
+        return w
+
+    @pytest.mark.asyncio
+    async def test_replay_reruns_extraction_without_search_calls(self, workflow, llm, request_and_plan):
+        request, _ = request_and_plan
+        searched = []
+
+        async def stream(query, **kwargs):
+            searched.append(query)
+            for result in [_result(1), _result(1), _result(2, SearchProvider.WIKIPEDIA)]:
+                yield result
+
+        workflow.researcher.search_client = MagicMock()
+        workflow.researcher.search_client.stream_all_providers = stream
+        await workflow.execute(request)
+        first_findings = workflow.verifier.verify_findings.await_args.args[0]
+        assert len(searched) == 2
+
+        summary = get_snapshot_store().load_run("run-1").summary()
+        assert [q["results"] for q in summary["questions"]] == [3, 3]
+
+        first_calls = llm.complete_json.await_count
+        llm.complete_json.reset_mock()
+        with patch("backend.utils.search_utils.SearchClient.search", side_effect=AssertionError("searched")), \
+                patch("backend.modules.deep_researcher.get_page_fetcher", side_effect=AssertionError("fetched")):
+            await workflow.resynthesize("run-1", request_id="run-2")
+
+        assert len(searched) == 2
+        replayed_findings = workflow.verifier.verify_findings.await_args.args[0]
+        assert workflow.verifier.verify_findings.await_args.args[1] == "run-2"
+        assert [f.source_url for f in replayed_findings] == [f.source_url for f in first_findings]
+        assert llm.complete_json.await_count == first_calls
+        assert workflow.synthesizer.generate_report.await_args.kwargs["request_id"] == "run-2"
+
+    @pytest.mark.asyncio
+    async def test_replay_uses_stored_page_text(self, llm):
+        question = SubQuestion(id="q1", text="How many cars did Tesla deliver?", priority=1)
+        store = get_snapshot_store()
+        store.save_run(
+            AgenticResearchRequest(id="run-1", query="Research Tesla deliveries in 2023"),
+            ResearchPlan(id="plan-1", request_id="run-1", sub_questions=[question])
+        )
+        store.save_question("run-1", question, [_result(1).to_dict()], {
+            "https://example.com/tesla/1": "Tesla delivered 1,808,581 vehicles in 2023."
+        })
+
+        researcher = DeepResearcher(replay=store.load_run("run-1"))
+        await researcher._research_question(question, depth=0)
+
+        assert "1,808,581" in llm.complete_json.await_args.kwargs["prompt"]
+
+    @pytest.mark.asyncio
+    async def test_replay_does_not_record_provider_yield(self, llm, monkeypatch):
+        monkeypatch.setattr(settings, "PROVIDER_YIELD_ENABLED", True)
+        question = SubQuestion(id="q1", text="How many cars did Tesla deliver?", priority=1)
+        store = get_snapshot_store()
+        store.save_run(
+            AgenticResearchRequest(id="run-1", query="Research Tesla deliveries in 2023"),
+            ResearchPlan(id="plan-1", request_id="run-1", sub_questions=[question])
+        )
+        store.save_question("run-1", question, [_result(1).to_dict(), _result(2).to_dict()])
+
+        researcher = DeepResearcher(replay=store.load_run("run-1"))
+        await researcher._research_question(question, depth=0)
+
+        assert llm.complete_json.await_count > 0
+        assert get_yield_tracker().stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_snapshot_under_their_own_request(self, llm):
+        researcher = DeepResearcher()
+        plans = {}
+        for run in ("run-a", "run-b"):
+            question = SubQuestion(id=f"{run}-q", text=f"What did Tesla announce in {run}?", priority=1)
+            plans[run] = ResearchPlan(id=f"plan-{run}", request_id=run, sub_questions=[question])
+            get_snapshot_store().save_run(AgenticResearchRequest(id=run, query=f"Research Tesla {run}"), plans[run])
+
+        async def stream(query, **kwargs):
+            for n in range(3):
+                await asyncio.sleep(0)  # Let the other run interleave
+                yield _result(n)
+
+        researcher.search_client = MagicMock()
+        researcher.search_client.stream_all_providers = stream
+        await asyncio.gather(*(researcher.execute_research(plan) for plan in plans.values()))
+
+        for run, plan in plans.items():
+            other = plans["run-b" if run == "run-a" else "run-a"]
+            snapshot = get_snapshot_store().load_run(run)
+            assert snapshot.question(plan.sub_questions[0].text) is not None
+            assert snapshot.question(other.sub_questions[0].text) is None
+
+    @pytest.mark.asyncio
+    async def test_store_io_runs_off_the_event_loop(self, workflow, request_and_plan):
+        request, _ = request_and_plan
+        store = get_snapshot_store()
+        loop_thread = threading.current_thread()
+        threads = []
+
+        def record_thread(fn):
+            def wrapper(*args, **kwargs):
+                threads.append(threading.current_thread())
+                return fn(*args, **kwargs)
+            return wrapper
+
+        async def stream(query, **kwargs):
+            yield _result(1)
+
+        workflow.researcher.search_client = MagicMock()
+        workflow.researcher.search_client.stream_all_providers = stream
+        with patch.object(store, "save_run", record_thread(store.save_run)), \
+                patch.object(store, "save_question", record_thread(store.save_question)), \
+                patch.object(store, "load_run", record_thread(store.load_run)):
+            await workflow.execute(request)
+            await workflow.resynthesize("run-1", request_id="run-2")
+
+        assert len(threads) == 4  # The run, its two questions and the replay's load
+        assert loop_thread not in threads
+
+    @pytest.mark.asyncio
+    async def test_missing_snapshot(self, workflow):
+        with pytest.raises(KeyError):
+            await workflow.resynthesize("unknown")
@@ -0,0 +1,127 @@
+"""Unit tests for the batched MediaWiki client, against a local stand-in server."""
+
+import json
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from backend.utils.http_pool import HTTPClientPool
+from backend.utils.wikipedia_api import WikipediaAPI
+from backend.utils.search_providers.wikipedia import WikipediaProvider
+from backend.utils.search_utils import SearchClient, SearchProvider
+
+
+API_RESPONSE = {
+    "batchcomplete": True,
+    "query": {
+        "pages": [
+            {
+                "pageid": 2, "title": "Tesla (disambiguation)", "index": 2,
+                "fullurl": "https://en.wikipedia.org/wiki/Tesla_(disambiguation)",
+                "extract": "Tesla may refer to:", "pageprops": {"disambiguation": ""}
+            },
+            {
+                "pageid": 3, "title": "Nikola Tesla", "index": 3,
+                "fullurl": "https://en.wikipedia.org/wiki/Nikola_Tesla",
+                "extract": "Nikola Tesla was an inventor. " * 30
+            },
+            {
+                "pageid": 1, "title": "Tesla, Inc.", "index": 1,
+                "fullurl": "https://en.wikipedia.org/wiki/Tesla,_Inc.",
+                "extract": "Tesla, Inc. is an American electric vehicle company."
+            }
+        ]
+    }
+}
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    requests = []
+
+    def do_GET(self):
+        _StandInHandler.requests.append(parse_qs(urlparse(self.path).query))
+        body = json.dumps(API_RESPONSE).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stand_in_server():
+    _StandInHandler.requests = []
+    server = HTTPServer(("127.0.0.1", 0), _StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/w/api.php"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    p = HTTPClientPool()
+    monkeypatch.setattr("backend.utils.wikipedia_api.get_http_pool", lambda: p)
+    return p
+
+
+class TestWikipediaAPI:
+    """Tests for WikipediaAPI."""
+
+    @pytest.mark.asyncio
+    async def test_search_is_one_round_trip(self, stand_in_server, pool):
+        pages = await WikipediaAPI(stand_in_server).search("Tesla", limit=3, sentences=2)
+
+        assert len(_StandInHandler.requests) == 1
+        params = _StandInHandler.requests[0]
+        assert params["generator"] == ["search"]
+        assert params["gsrsearch"] == ["Tesla"]
+        assert params["exsentences"] == ["2"]
+        # Rank order kept, disambiguation page skipped
+        assert [p.title for p in pages] == ["Tesla, Inc.", "Nikola Tesla"]
+        assert pages[0].url == "https://en.wikipedia.org/wiki/Tesla,_Inc."
+        await pool.aclose()
+
+    def test_search_sync(self, stand_in_server):
+        pages = WikipediaAPI(stand_in_server).search_sync("Tesla", limit=3)
+
+        assert len(_StandInHandler.requests) == 1
+        assert len(pages) == 2
+
+    def test_limit_capped_to_batch_size(self):
+        params = WikipediaAPI("http://unused").build_params("Tesla", limit=50)
+        assert params["gsrlimit"] == 20
+
+
+class TestWikipediaSearchLayers:
+    """Both Wikipedia search paths use the batched client."""
+
+    @pytest.mark.asyncio
+    async def test_provider_asearch(self, stand_in_server, pool):
+        provider = WikipediaProvider()
+        provider.api = WikipediaAPI(stand_in_server)
+
+        results = await provider.asearch("Tesla", limit=3)
+
+        assert len(_StandInHandler.requests) == 1
+        assert results[0]["title"] == "Wikipedia: Tesla, Inc."
+        assert results[0]["source"] == "Wikipedia"
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_search_client_truncates_summary(self, stand_in_server, pool):
+        client = SearchClient()
+        client.wikipedia = WikipediaAPI(stand_in_server)
+
+        results = await client._search_wikipedia("Tesla", 3)
+
+        assert len(_StandInHandler.requests) == 1
+        assert results[0].source == SearchProvider.WIKIPEDIA
+        assert len(results[1].snippet) == 503
+        await client.close()
+        await pool.aclose()
@@ -0,0 +1,279 @@
+"""URL canonicalization and near-duplicate detection for search results.
+
+Syndicated copies of one wire story, Google News redirect links, AMP pages
+and tracking-parameter variants would otherwise each cost a separate LLM
+extraction call. Results are first keyed by canonical URL, then compared
+by a 64-bit SimHash of their title and snippet. Only one representative
+per cluster goes to extraction; the cluster keeps every original URL so
+citations can still list all of them.
+"""
+
+import base64
+import binascii
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from backend.config import settings
+
+
+# Query parameters that only track the click, never select content
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "_hsenc", "_hsmi", "ref_src", "ref_url", "cmpid", "smid", "smtyp", "si", "feature",
+    "amp", "outputtype", "guccounter", "guce_referrer", "guce_referrer_sig",
+}
+TRACKING_PREFIXES = ("utm_", "ga_", "pk_", "mtm_")
+
+# Redirect endpoints and the query parameters that may hold the real target
+REDIRECTORS = {
+    ("duckduckgo.com", "/l/"): ("uddg",),
+    ("google.com", "/url"): ("q", "url"),
+    ("l.facebook.com", "/l.php"): ("u",),
+    ("out.reddit.com", "/"): ("url",),
+}
+
+HOST_PREFIXES = ("www.", "m.", "mobile.", "amp.")
+
+_TOKEN = re.compile(r"\w+")
+_OUTLET_SUFFIX = re.compile(r"\s+[-|–—]\s+[^-|–—]{1,60}$")
+
+
+def _normalize_host(host: str) -> str:
+    host = host.lower().rstrip(".")
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    return host
+
+
+def _unwrap_redirect(parts) -> Optional[str]:
+    """Target URL of a known redirector link, if it is one."""
+    host = _normalize_host(parts.hostname or "")
+    for (redirect_host, path_prefix), params in REDIRECTORS.items():
+        if host == redirect_host and parts.path.startswith(path_prefix):
+            query = dict(parse_qsl(parts.query))
+            for param in params:
+                target = query.get(param, "")
+                if target.startswith(("http://", "https://", "//")):
+                    return target
+    return None
+
+
+def _decode_google_news(parts) -> Optional[str]:
+    """Article URL embedded in a Google News article id.
+
+    Older ids are base64 protobuf with the URL as a length-prefixed string.
+    Newer opaque ids cannot be decoded offline and are left alone.
+    """
+    if _normalize_host(parts.hostname or "") != "news.google.com":
+        return None
+    segments = parts.path.rstrip("/").split("/")
+    if len(segments) < 2 or segments[-2] != "articles":
+        return None
+    article_id = segments[-1]
+    try:
+        data = base64.urlsafe_b64decode(article_id + "=" * (-len(article_id) % 4))
+    except (binascii.Error, ValueError):
+        return None
+
+    start = data.find(b"http")
+    if start < 1:
+        return None
+    # Protobuf varint length before the string: one byte, or two when >= 128
+    length = data[start - 1]
+    if start >= 2 and data[start - 2] & 0x80:
+        length = (data[start - 2] & 0x7F) | (data[start - 1] << 7)
+    url = data[start:start + length]
+    try:
+        decoded = url.decode("ascii")
+    except UnicodeDecodeError:
+        return None
+    return decoded if re.fullmatch(r"https?://[\x21-\x7e]+", decoded) else None
+
+
+def _strip_amp(host: str, path: str) -> Tuple[str, str]:
+    if host.endswith(".cdn.ampproject.org"):
+        # /c/s/www.example.com/article -> www.example.com/article
+        segments = path.split("/")[2:]
+        if segments and segments[0] == "s":
+            segments = segments[1:]
+        if segments:
+            host = _normalize_host(segments[0])
+            path = "/" + "/".join(segments[1:])
+    if path.startswith("/amp/"):
+        path = path[4:]
+    for suffix in ("/amp/", "/amp", ".amp"):
+        if path.endswith(suffix):
+            path = path[:-len(suffix)] or "/"
+            break
+    return host, path
+
+
+def canonicalize_url(url: str) -> str:
+    """Canonical form of a result URL for deduplication and citations.
+
+    Unwraps known redirectors and Google News article links, drops tracking
+    parameters, AMP variants, fragments and default ports, normalizes the
+    host and sorts the remaining query parameters. Unparseable input is
+    returned unchanged.
+    """
+    if not url:
+        return url
+    candidate = url.strip()
+    if candidate.startswith("//"):
+        candidate = "https:" + candidate
+
+    try:
+        for _ in range(3):  # Redirectors can be nested
+            parts = urlsplit(candidate)
+            target = _unwrap_redirect(parts) or _decode_google_news(parts)
+            if target is None:
+                break
+            candidate = "https:" + target if target.startswith("//") else target
+        else:
+            parts = urlsplit(candidate)
+    except ValueError:
+        return url
+
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        return url
+
+    host, path = _strip_amp(_normalize_host(parts.hostname), parts.path or "/")
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and not (parts.scheme == "http" and port == 80 or parts.scheme == "https" and port == 443):
+        host = f"{host}:{port}"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit((parts.scheme.lower(), host, path, urlencode(query), ""))
+
+
+def fingerprint_tokens(title: str, snippet: str = "") -> List[str]:
+    """Lowercased word tokens of a result, without a trailing " - Outlet" in the title."""
+    title = _OUTLET_SUFFIX.sub("", title or "")
+    return _TOKEN.findall(f"{title} {snippet or ''}".lower())
+
+
+def _hash64(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def simhash(tokens: List[str]) -> int:
+    """64-bit SimHash with one feature per word.
+
+    Word features (rather than shingles) keep the fingerprint stable under
+    the small edits syndicated copies make to short snippets.
+    """
+    weights = [0] * 64
+    for feature in tokens:
+        h = _hash64(feature)
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+
+    value = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            value |= 1 << bit
+    return value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+@dataclass
+class DuplicateCluster:
+    """Results judged to be the same document; the first one is the representative.
+
+    `urls` holds the providers' original URLs, one per canonical URL.
+    """
+    urls: List[str]
+    fingerprint: int
+    text: str
+    long_text: bool
+
+
+class DuplicateIndex:
+    """Incremental near-duplicate detector.
+
+    Results are added one at a time, so it also works on streamed results.
+    Texts with fewer than `min_tokens` tokens are too short for SimHash to
+    be reliable and only match on identical text.
+    """
+
+    def __init__(self, max_distance: Optional[int] = None, min_tokens: Optional[int] = None):
+        self.max_distance = settings.DEDUP_SIMHASH_MAX_DISTANCE if max_distance is None else max_distance
+        self.min_tokens = settings.DEDUP_MIN_TOKENS if min_tokens is None else min_tokens
+        self.clusters: List[DuplicateCluster] = []
+        self._by_url: Dict[str, int] = {}
+
+    def add(self, url: str, title: str, snippet: str = "") -> Tuple[int, bool]:
+        """Add a result and find its cluster.
+
+        Returns:
+            (cluster index, whether the result started a new cluster)
+        """
+        canonical = canonicalize_url(url)
+        tokens = fingerprint_tokens(title, snippet)
+        text = " ".join(tokens)
+        long_text = len(tokens) >= self.min_tokens
+        fingerprint = simhash(tokens) if long_text else 0
+
+        index = self._by_url.get(canonical) if canonical else None
+        if index is None:
+            index = self._find_similar(text, long_text, fingerprint)
+
+        if index is None:
+            index = len(self.clusters)
+            self.clusters.append(DuplicateCluster([url] if canonical else [], fingerprint, text, long_text))
+            is_new = True
+        else:
+            # The canonical URL is only the key; citations keep the URL the provider gave
+            if canonical and canonical not in self._by_url:
+                self.clusters[index].urls.append(url)
+            is_new = False
+
+        if canonical:
+            self._by_url[canonical] = index
+        return index, is_new
+
+    def _find_similar(self, text: str, long_text: bool, fingerprint: int) -> Optional[int]:
+        if not text:
+            return None
+        for index, cluster in enumerate(self.clusters):
+            if long_text and cluster.long_text:
+                if hamming_distance(fingerprint, cluster.fingerprint) <= self.max_distance:
+                    return index
+            elif text == cluster.text:
+                return index
+        return None
+
+
+def dedupe_result_dicts(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Collapse duplicate provider results, keeping the first of each cluster.
+
+    The representative keeps its own 'link', and 'links' lists the
+    original URL of every distinct copy for citations.
+    """
+    index = DuplicateIndex()
+    representatives: List[Dict[str, Any]] = []
+    for result in results:
+        link = result.get("link") or result.get("url") or ""
+        cluster_index, is_new = index.add(link, result.get("title", ""), result.get("snippet", ""))
+        if is_new:
+            representatives.append(dict(result))
+
+    for representative, cluster in zip(representatives, index.clusters):
+        representative["links"] = list(cluster.urls)
+    return representatives
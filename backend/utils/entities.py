@@ -0,0 +1,232 @@
+"""Entity resolution and query normalization for cache keying.
+
+"Tesla", "Tesla Inc" and "Tesla, Inc." name the same entity, so
+"Tesla stock price" and "Tesla, Inc. stock price" ask the same question.
+Mapping both to one canonical form lets the search, LLM and result
+caches share entries across users and phrasings. Word order and function
+words are kept: "flights from London to Paris" and "flights from Paris
+to London" are different searches.
+
+Entity names are reduced to a canonical key (lowercase, no punctuation,
+no trailing legal suffix) and looked up in an alias table, kept in memory
+and persisted to SQLite, so names such as "TSLA" or "Tesla Motors" can be
+mapped onto an existing entity. Every resolved name is added to the
+table, so it grows with use.
+
+Query normalization is only used for keys; the query sent to providers is
+left as the user wrote it.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from backend.config import settings
+
+
+# Legal-form words dropped from entity names
+LEGAL_SUFFIXES = frozenset("""
+inc incorporated corp corporation co company ltd limited llc llp plc gmbh ag sa nv bv
+""".split())
+
+# Queries with phrases or operators keep their punctuation
+_OPERATOR = re.compile(r'"|\b(?:site|intitle|inurl|filetype):|\bOR\b|\bAND\b|\bNOT\b|(?:^|\s)-\w')
+_TOKEN = re.compile(r"\w[\w&+#.'’-]*")
+
+
+def _tokens(text: str) -> List[str]:
+    """Lowercased word tokens with inner dots and apostrophes removed."""
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    tokens = []
+    for token in _TOKEN.findall(text):
+        token = re.sub(r"['’](s)?$", "", token)  # Possessive
+        token = re.sub(r"[.'’]", "", token).strip("-")
+        if token:
+            tokens.append(token)
+    return tokens
+
+
+def _strip_legal_suffix(tokens: List[str]) -> List[str]:
+    while len(tokens) > 1 and tokens[-1] in LEGAL_SUFFIXES:
+        tokens = tokens[:-1]
+    return tokens
+
+
+def _display_name(name: str) -> str:
+    """Entity name as written, without a trailing legal suffix ("Tesla, Inc." -> "Tesla")."""
+    words = name.split()
+    while len(words) > 1 and words[-1].lower().strip(".,") in LEGAL_SUFFIXES:
+        words.pop()
+    return " ".join(words).rstrip(",") or name.strip()
+
+
+@dataclass
+class Entity:
+    """A resolved entity."""
+    key: str  # Canonical key used in cache keys
+    name: str  # Display name shared by every alias, used in prompts and queries
+
+
+class EntityResolver:
+    """Alias table from entity surface forms to canonical entities.
+
+    Aliases are held in memory and persisted to SQLite when a path is set.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """Initialize the resolver.
+
+        Args:
+            path: SQLite file for the alias table; empty string keeps it in memory only
+        """
+        self.path = settings.ENTITY_ALIAS_PATH if path is None else path
+        self._aliases: Dict[str, str] = {}  # Alias key -> entity key
+        self._names: Dict[str, str] = {}  # Entity key -> display name
+        self._max_alias_words = 1
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+        if self.path:
+            self._open_db()
+
+    def _open_db(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entity_aliases ("
+            "alias TEXT PRIMARY KEY, entity_key TEXT NOT NULL, display_name TEXT NOT NULL)"
+        )
+        self._db.commit()
+        for alias, key, name in self._db.execute("SELECT alias, entity_key, display_name FROM entity_aliases"):
+            self._remember(alias, key, name)
+
+    def _remember(self, alias: str, key: str, name: str):
+        self._aliases[alias] = key
+        self._names.setdefault(key, name)
+        self._max_alias_words = max(self._max_alias_words, alias.count(" ") + 1)
+
+    def _set_name(self, key: str, name: str):
+        """Set an entity's display name; a capitalized form replaces an all-lowercase one."""
+        current = self._names.get(key)
+        if current is not None and not (current == current.lower() and name != name.lower()):
+            return
+        self._names[key] = name
+        if current is not None and self._db is not None:
+            self._db.execute("UPDATE entity_aliases SET display_name = ? WHERE entity_key = ?", (name, key))
+            self._db.commit()
+
+    def _store(self, alias: str, key: str):
+        """Add an alias (caller holds the lock)."""
+        if self._aliases.get(alias) == key:
+            return
+        self._remember(alias, key, self._names.get(key, key))
+        if self._db is not None:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entity_aliases (alias, entity_key, display_name) VALUES (?, ?, ?)",
+                (alias, key, self._names[key])
+            )
+            self._db.commit()
+
+    def lookup(self, name: str) -> Optional[Entity]:
+        """Resolve a name through the alias table only, without learning it."""
+        tokens = _tokens(name)
+        with self._lock:
+            for alias in (" ".join(tokens), " ".join(_strip_legal_suffix(tokens))):
+                key = self._aliases.get(alias)
+                if key is not None:
+                    return Entity(key, self._names[key])
+        return None
+
+    def resolve(self, name: str) -> Entity:
+        """Resolve an entity name, adding it to the alias table."""
+        tokens = _tokens(name)
+        surface, stripped = " ".join(tokens), " ".join(_strip_legal_suffix(tokens))
+        if not stripped:
+            return Entity("", name.strip())
+        with self._lock:
+            key = self._aliases.get(surface) or self._aliases.get(stripped) or stripped
+            self._set_name(key, _display_name(name))
+            self._store(stripped, key)
+            self._store(surface, key)
+            return Entity(key, self._names[key])
+
+    def add_alias(self, alias: str, canonical: str) -> Entity:
+        """Map `alias` onto the entity `canonical` resolves to."""
+        entity = self.resolve(canonical)
+        tokens = _tokens(alias)
+        with self._lock:
+            for alias_key in {" ".join(tokens), " ".join(_strip_legal_suffix(tokens))} - {""}:
+                self._store(alias_key, entity.key)
+        return entity
+
+    def aliases(self) -> Dict[str, List[str]]:
+        """Aliases grouped by entity key."""
+        with self._lock:
+            grouped: Dict[str, List[str]] = {}
+            for alias, key in sorted(self._aliases.items()):
+                grouped.setdefault(key, []).append(alias)
+            return grouped
+
+    def canonical_tokens(self, tokens: List[str]) -> List[str]:
+        """Replace the longest known alias at each position with its entity key."""
+        with self._lock:
+            out = []
+            i = 0
+            while i < len(tokens):
+                for size in range(min(self._max_alias_words, len(tokens) - i), 0, -1):
+                    key = self._aliases.get(" ".join(tokens[i:i + size]))
+                    if key is not None:
+                        out.append(key)
+                        i += size
+                        break
+                else:
+                    out.append(tokens[i])
+                    i += 1
+            return out
+
+    def close(self):
+        """Close the SQLite connection."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+def normalize_query(query: str, resolver: Optional["EntityResolver"] = None) -> str:
+    """Canonical form of a search query for cache keys.
+
+    Case, whitespace and punctuation around words are normalized and known
+    entity aliases replaced by their key. Word order and every word are
+    kept, since either can change what a query asks. Queries with quoted
+    phrases or search operators only get case and whitespace normalized.
+    """
+    if _OPERATOR.search(query or ""):
+        return " ".join(query.lower().split())
+
+    resolver = resolver or get_entity_resolver()
+    tokens = _tokens(query)
+    if resolver is not None:
+        tokens = resolver.canonical_tokens(tokens)
+    return " ".join(tokens)
+
+
+# Global resolver instance
+_entity_resolver: Optional[EntityResolver] = None
+_resolver_lock = threading.Lock()
+
+
+def get_entity_resolver() -> Optional[EntityResolver]:
+    """Get the global entity resolver, or None when query normalization is disabled."""
+    global _entity_resolver
+    if not settings.QUERY_NORMALIZATION_ENABLED:
+        return None
+    if _entity_resolver is None:
+        with _resolver_lock:
+            if _entity_resolver is None:
+                _entity_resolver = EntityResolver()
+    return _entity_resolver
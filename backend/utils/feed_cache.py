@@ -0,0 +1,157 @@
+"""Conditional GET support for feed-based providers.
+
+Entities we research repeatedly hit the same feed URLs (e.g. the Google
+News RSS search for a company). For each feed URL the last response's
+validators (ETag, Last-Modified), body and parsed items are kept, so
+the next request can be conditional. On 304 Not Modified the feed is
+neither downloaded nor parsed again.
+
+This sits below the search result cache: it only sees requests whose
+results have expired from (or bypassed) that cache.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from backend.config import settings
+
+
+Parser = Callable[[bytes, int], List[Dict[str, Any]]]
+
+
+@dataclass
+class FeedEntry:
+    """Validators, body and parsed items of a feed's last full response."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+    parsed: Dict[int, List[Dict[str, Any]]] = field(default_factory=dict)  # Items by parse limit
+    parse_ms: Dict[int, float] = field(default_factory=dict)
+
+
+class FeedValidatorCache:
+    """Bounded LRU of feed validators and parsed items, keyed by feed URL."""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries or settings.FEED_CACHE_ENTRIES
+        self._entries: "OrderedDict[str, FeedEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {
+            "requests": 0,
+            "conditional_requests": 0,
+            "not_modified": 0,
+            "full_responses": 0,
+            "bytes_downloaded": 0,
+            "bytes_saved": 0,
+            "parse_ms": 0.0,
+            "parse_ms_saved": 0.0
+        }
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Request headers making a GET of `url` conditional, if validators are known."""
+        with self._lock:
+            self._counters["requests"] += 1
+            entry = self._entries.get(url)
+            headers = {}
+            if entry is not None:
+                if entry.etag:
+                    headers["If-None-Match"] = entry.etag
+                if entry.last_modified:
+                    headers["If-Modified-Since"] = entry.last_modified
+            if headers:
+                self._counters["conditional_requests"] += 1
+            return headers
+
+    def read(
+        self,
+        url: str,
+        status_code: int,
+        headers: Mapping[str, str],
+        content: bytes,
+        limit: int,
+        parse: Parser
+    ) -> List[Dict[str, Any]]:
+        """Parsed items for a feed response, reusing cached ones on 304.
+
+        Args:
+            url: Feed URL the request was sent to
+            status_code: Response status (200 or 304)
+            headers: Response headers
+            content: Response body (empty on 304)
+            limit: Max items to parse
+            parse: Parser for a full body, called as parse(content, limit)
+
+        Raises:
+            LookupError: On 304 for a feed whose entry was evicted meanwhile.
+        """
+        if status_code == 304:
+            with self._lock:
+                entry = self._entries.get(url)
+                if entry is None:
+                    raise LookupError(f"304 Not Modified for uncached feed {url}")
+                self._entries.move_to_end(url)
+                self._counters["not_modified"] += 1
+                self._counters["bytes_saved"] += len(entry.body)
+                items = entry.parsed.get(limit)
+                if items is not None:
+                    self._counters["parse_ms_saved"] += entry.parse_ms[limit]
+                    return [dict(item) for item in items]
+                body = entry.body
+            # Same feed, new limit: parse the stored body instead of downloading it
+            items = self._parse(entry, body, limit, parse)
+            return [dict(item) for item in items]
+
+        entry = FeedEntry(headers.get("etag"), headers.get("last-modified"), content)
+        with self._lock:
+            self._counters["full_responses"] += 1
+            self._counters["bytes_downloaded"] += len(content)
+        items = self._parse(entry, content, limit, parse)
+        if entry.etag or entry.last_modified:
+            with self._lock:
+                self._entries[url] = entry
+                self._entries.move_to_end(url)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return [dict(item) for item in items]
+
+    def _parse(self, entry: FeedEntry, content: bytes, limit: int, parse: Parser) -> List[Dict[str, Any]]:
+        start = time.perf_counter()
+        items = parse(content, limit)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self._counters["parse_ms"] += elapsed_ms
+            entry.parsed[limit] = items
+            entry.parse_ms[limit] = elapsed_ms
+        return items
+
+    def stats(self) -> Dict[str, Any]:
+        """Conditional request counters, bytes and parse time saved."""
+        with self._lock:
+            counters = dict(self._counters)
+            entries = len(self._entries)
+        requests = counters["requests"]
+        return {
+            **counters,
+            "parse_ms": round(counters["parse_ms"], 2),
+            "parse_ms_saved": round(counters["parse_ms_saved"], 2),
+            "not_modified_rate": round(counters["not_modified"] / requests, 3) if requests else 0.0,
+            "entries": entries,
+            "max_entries": self.max_entries
+        }
+
+
+# Global cache instance
+_feed_cache: Optional[FeedValidatorCache] = None
+
+
+def get_feed_cache() -> Optional[FeedValidatorCache]:
+    """Get the global feed validator cache, or None when conditional GETs are disabled."""
+    global _feed_cache
+    if not settings.FEED_CONDITIONAL_GET_ENABLED:
+        return None
+    if _feed_cache is None:
+        _feed_cache = FeedValidatorCache()
+    return _feed_cache
@@ -0,0 +1,205 @@
+"""Shared HTTP connection pool for search providers.
+
+Every HTTP-based search provider sends its requests through one long-lived
+`httpx.AsyncClient`, so TCP/TLS connections are kept alive and reused across
+searches instead of being set up on every call. HTTP/2 is negotiated when the
+optional `h2` package is installed and the upstream supports it.
+
+Each provider also gets its own cap on concurrent requests so one busy
+provider cannot take the whole pool.
+"""
+
+import asyncio
+import importlib.util
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+from backend.config import settings
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+
+def http2_available() -> bool:
+    """Check whether the optional `h2` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class ProviderPoolStats:
+    """Request counters for a single provider."""
+    limit: int
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    waiting: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "waiting": self.waiting
+        }
+
+
+class HTTPClientPool:
+    """One pooled async HTTP client shared by all search providers.
+
+    The underlying client is bound to the event loop it was created on.
+    If it is used from a different loop (e.g. a blocking wrapper running
+    its own loop), a fresh client is created for that loop.
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        timeout: Optional[float] = None,
+        http2: Optional[bool] = None,
+        provider_limits: Optional[Dict[str, int]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.max_connections = max_connections or settings.SEARCH_POOL_MAX_CONNECTIONS
+        self.max_keepalive_connections = max_keepalive_connections or settings.SEARCH_POOL_MAX_KEEPALIVE
+        self.keepalive_expiry = keepalive_expiry or settings.SEARCH_POOL_KEEPALIVE_SECONDS
+        self.timeout = timeout or settings.SEARCH_PROVIDER_TIMEOUT_SECONDS
+        self.http2 = (settings.SEARCH_HTTP2 if http2 is None else http2) and http2_available()
+        self.provider_limits = dict(
+            provider_limits if provider_limits is not None else settings.SEARCH_PROVIDER_CONNECTION_LIMITS
+        )
+
+        self.transport = transport  # Override for tests
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._stats: Dict[str, ProviderPoolStats] = {}
+        self._clients_created = 0
+
+    def _limit_for(self, provider: str) -> int:
+        return self.provider_limits.get(provider, settings.SEARCH_PROVIDER_DEFAULT_CONNECTIONS)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                timeout=self.timeout,
+                headers=DEFAULT_HEADERS,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry
+                ),
+                transport=self.transport
+            )
+            self._client_loop = loop
+            # Semaphores are loop-bound too
+            self._semaphores = {}
+            self._clients_created += 1
+        return self._client
+
+    def _provider_stats(self, provider: str) -> ProviderPoolStats:
+        if provider not in self._stats:
+            self._stats[provider] = ProviderPoolStats(limit=self._limit_for(provider))
+        return self._stats[provider]
+
+    @asynccontextmanager
+    async def slot(self, provider: str) -> AsyncIterator[None]:
+        """Hold one of the provider's concurrent request slots.
+
+        Also used by providers whose transport is not httpx (e.g. the
+        DuckDuckGo library) so their concurrency is capped and counted the same way.
+        """
+        self.client  # Bind semaphores to the running loop
+        if provider not in self._semaphores:
+            self._semaphores[provider] = asyncio.Semaphore(self._limit_for(provider))
+        semaphore = self._semaphores[provider]
+        stats = self._provider_stats(provider)
+
+        stats.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            stats.waiting -= 1
+
+        stats.requests += 1
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        try:
+            yield
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.in_flight -= 1
+            semaphore.release()
+
+    async def request(self, provider: str, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request on behalf of `provider` through the shared pool."""
+        async with self.slot(provider):
+            return await self.client.request(method, url, **kwargs)
+
+    async def get(self, provider: str, url: str, **kwargs) -> httpx.Response:
+        """Send a GET request on behalf of `provider` through the shared pool."""
+        return await self.request(provider, "GET", url, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of pool configuration, open connections and per-provider counters."""
+        connections = []
+        if self._client is not None and not self._client.is_closed:
+            pool = getattr(self._client._transport, "_pool", None)
+            connections = list(getattr(pool, "connections", []))
+
+        return {
+            "http2": self.http2,
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "keepalive_expiry": self.keepalive_expiry,
+            "clients_created": self._clients_created,
+            "connections_open": len(connections),
+            "connections_idle": sum(1 for c in connections if c.is_idle()),
+            "providers": {name: s.to_dict() for name, s in sorted(self._stats.items())}
+        }
+
+    async def aclose(self):
+        """Close the pooled client."""
+        if self._client is not None and not self._client.is_closed:
+            try:
+                await self._client.aclose()
+            except RuntimeError:
+                # Created on a loop that has since closed
+                pass
+        self._client = None
+        self._client_loop = None
+
+
+# Global pool instance
+_http_pool: Optional[HTTPClientPool] = None
+
+
+def get_http_pool() -> HTTPClientPool:
+    """Get or create the global HTTP connection pool."""
+    global _http_pool
+    if _http_pool is None:
+        _http_pool = HTTPClientPool()
+    return _http_pool
+
+
+async def close_http_pool():
+    """Close the global HTTP connection pool if it was created."""
+    if _http_pool is not None:
+        await _http_pool.aclose()
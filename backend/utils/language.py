@@ -0,0 +1,80 @@
+"""Batch English language identification for search results.
+
+Per NFR-008: Non-English search results MUST be filtered out.
+
+Each text is split once and its words are checked against a frozenset of
+common English function words. Texts written mostly in non-Latin scripts
+are rejected up front (checked only for non-ASCII text), so unsegmented
+CJK text, which has no spaces to split on, is no longer mistaken for a
+short English snippet.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+from backend.config import settings
+
+
+# Function words that are frequent in English and rare as words elsewhere
+ENGLISH_INDICATORS = frozenset("""
+the is are was were been being have has had do does did will would could should may might
+and but or because if when while of to that this with which from they their it
+""".split())
+
+# Indicator share at which a text counts as fully confident English
+_FULL_CONFIDENCE_RATIO = 0.15
+
+
+@dataclass
+class LanguageScore:
+    """English classification of one text."""
+    is_english: bool
+    confidence: float  # 0-1 likelihood the text is English
+
+
+def _score(text: str, min_ratio: float, min_words: int) -> LanguageScore:
+    if not text:
+        return LanguageScore(False, 0.0)
+
+    latin_share = 1.0
+    if not text.isascii():
+        # Characters outside Latin-1, counted in C by dropping them on encode
+        non_latin = len(text) - len(text.encode("latin-1", "ignore"))
+        chars = len(text) - text.count(" ")
+        latin_share = 1 - non_latin / chars if chars else 0.0
+        if latin_share < 0.5:
+            # Mostly non-Latin script (CJK, Cyrillic, Arabic, ...)
+            return LanguageScore(False, round(latin_share, 3))
+
+    words = text.lower().split()
+    if len(words) < min_words:
+        return LanguageScore(True, 0.5)  # Too short to determine
+
+    ratio = sum(map(ENGLISH_INDICATORS.__contains__, words)) / len(words)
+    confidence = min(1.0, ratio / _FULL_CONFIDENCE_RATIO) * latin_share
+    return LanguageScore(ratio > min_ratio, round(confidence, 3))
+
+
+def detect_english(
+    texts: Sequence[str],
+    min_ratio: Optional[float] = None,
+    min_words: Optional[int] = None
+) -> List[LanguageScore]:
+    """Classify a batch of texts as English or not.
+
+    Args:
+        texts: Texts to classify (e.g. result snippets)
+        min_ratio: Share of English indicator words needed to count as English
+        min_words: Texts with fewer words pass as undetermined
+
+    Returns:
+        One LanguageScore per text, in order
+    """
+    min_ratio = settings.ENGLISH_MIN_INDICATOR_RATIO if min_ratio is None else min_ratio
+    min_words = settings.ENGLISH_MIN_WORDS if min_words is None else min_words
+    return [_score(text, min_ratio, min_words) for text in texts]
+
+
+def is_english(text: str) -> bool:
+    """Check if a single text is likely English."""
+    return detect_english([text])[0].is_english
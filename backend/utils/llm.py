@@ -1,27 +1,58 @@
-"""LLM Service for interacting with Gemini and OpenAI."""
+"""LLM Service for interacting with Gemini and OpenAI.
+
+Both providers are called through their async clients, so a module
+waiting on synthesis does not block the event loop for other requests.
+OpenAI requests share one pooled HTTP client (connections are kept alive
+across calls), concurrent calls per provider are capped, and every call
+is bounded by LLM_TIMEOUT_SECONDS.
+"""
 import os
 import json
+import asyncio
 import logging
 import google.generativeai as genai
-from openai import OpenAI
+from openai import AsyncOpenAI
 from typing import Dict, Any, Optional
 
+from backend.config import settings
+from backend.utils.http_pool import HTTPClientPool
+
 logger = logging.getLogger(__name__)
 
 class LLMService:
-    def __init__(self):
+    def __init__(self, pool: Optional[HTTPClientPool] = None):
         self.google_api_key = os.getenv("GOOGLE_API_KEY")
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
+        self.timeout = settings.LLM_TIMEOUT_SECONDS
+
+        # Separate from the search pool: LLM calls are few, long and go to two hosts
+        self.pool = pool or HTTPClientPool(
+            max_connections=settings.LLM_POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.LLM_POOL_MAX_CONNECTIONS,
+            timeout=settings.LLM_TIMEOUT_SECONDS,
+            provider_limits={"openai": settings.LLM_MAX_CONCURRENCY, "gemini": settings.LLM_MAX_CONCURRENCY}
+        )
 
         self.gemini_client = None
-        self.openai_client = None
+        self._openai_client: Optional[AsyncOpenAI] = None
+        self._openai_http = None
 
         if self.google_api_key:
             genai.configure(api_key=self.google_api_key)
             self.gemini_client = genai.GenerativeModel('gemini-pro')
 
-        if self.openai_api_key:
-            self.openai_client = OpenAI(api_key=self.openai_api_key)
+    @property
+    def openai_client(self) -> Optional[AsyncOpenAI]:
+        """Async OpenAI client on the pooled HTTP client of the running event loop."""
+        if not self.openai_api_key:
+            return None
+        http_client = self.pool.client
+        if self._openai_client is None or self._openai_http is not http_client:
+            self._openai_client = AsyncOpenAI(
+                api_key=self.openai_api_key, http_client=http_client, timeout=self.timeout
+            )
+            self._openai_http = http_client
+        return self._openai_client
 
     async def generate_json(self, prompt: str, context: str, schema: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -50,25 +81,36 @@ class LLMService:
         # Try Gemini
         if self.gemini_client:
             try:
-                response = self.gemini_client.generate_content(full_prompt)
+                async with self.pool.slot("gemini"):
+                    response = await asyncio.wait_for(
+                        self.gemini_client.generate_content_async(full_prompt), timeout=self.timeout
+                    )
                 text = response.text
                 return self._parse_json(text)
+            except asyncio.TimeoutError:
+                logger.error(f"Gemini generation timed out after {self.timeout}s")
             except Exception as e:
                 logger.error(f"Gemini generation failed: {e}")
 
         # Try OpenAI
-        if self.openai_client:
+        if self.openai_api_key:
             try:
-                response = self.openai_client.chat.completions.create(
-                    model="gpt-3.5-turbo-1106",  # Cost effective, supports JSON mode
-                    messages=[
-                        {"role": "system", "content": "You are a helpful researcher who extracts structured data from text. Return only JSON."},
-                        {"role": "user", "content": full_prompt}
-                    ],
-                    response_format={"type": "json_object"}
-                )
+                async with self.pool.slot("openai"):
+                    response = await asyncio.wait_for(
+                        self.openai_client.chat.completions.create(
+                            model="gpt-3.5-turbo-1106",  # Cost effective, supports JSON mode
+                            messages=[
+                                {"role": "system", "content": "You are a helpful researcher who extracts structured data from text. Return only JSON."},
+                                {"role": "user", "content": full_prompt}
+                            ],
+                            response_format={"type": "json_object"}
+                        ),
+                        timeout=self.timeout
+                    )
                 text = response.choices[0].message.content
                 return self._parse_json(text)
+            except asyncio.TimeoutError:
+                logger.error(f"OpenAI generation timed out after {self.timeout}s")
             except Exception as e:
                 logger.error(f"OpenAI generation failed: {e}")
 
@@ -93,4 +135,14 @@ class LLMService:
             logger.error(f"Failed to parse JSON: {e}. Text: {text}")
             return {}
 
+    def stats(self) -> Dict[str, Any]:
+        """Connection pool and per-provider call counters."""
+        return self.pool.stats()
+
+    async def aclose(self):
+        """Close pooled LLM connections."""
+        await self.pool.aclose()
+        self._openai_client = None
+        self._openai_http = None
+
 llm_service = LLMService()
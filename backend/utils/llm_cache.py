@@ -0,0 +1,311 @@
+"""Content-addressed cache for LLMClient responses.
+
+Extraction prompts are often byte-identical across runs (same page, same
+sub-question), and re-synthesis replays whole runs. Responses are keyed
+by the SHA-256 of (provider, model, system prompt, prompt, temperature,
+max_tokens) and stored in:
+- a bounded in-memory LRU tier (entry count and total bytes)
+- a persistent SQLite tier, shared across restarts and trimmed to a
+  byte budget, least recently used first
+
+Every entry expires after LLM_CACHE_TTL_SECONDS. Which task types are
+cached is configured by LLM_CACHE_TASK_TYPES; callers can override it
+per call (see `LLMClient.complete(use_cache=...)`).
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from backend.config import settings
+
+
+def make_key(
+    provider: str,
+    model: str,
+    system_prompt: Optional[str],
+    prompt: str,
+    temperature: float,
+    max_tokens: int
+) -> str:
+    """Content address of an LLM request."""
+    raw = json.dumps(
+        [provider, model, system_prompt or "", prompt, float(temperature), int(max_tokens)],
+        ensure_ascii=False,
+        separators=(",", ":")
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """In-memory LRU in front of an on-disk SQLite store of LLM responses."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        max_memory_bytes: Optional[int] = None,
+        max_disk_bytes: Optional[int] = None
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite file for the disk tier; empty string disables it
+            ttl: Seconds a response stays valid
+            max_entries: Max entries in the memory tier
+            max_memory_bytes: Max total response size in the memory tier
+            max_disk_bytes: Max total response size in the disk tier
+        """
+        self.path = settings.LLM_CACHE_PATH if path is None else path
+        self.ttl = settings.LLM_CACHE_TTL_SECONDS if ttl is None else ttl
+        self.max_entries = max_entries or settings.LLM_CACHE_MEMORY_ENTRIES
+        self.max_memory_bytes = max_memory_bytes or settings.LLM_CACHE_MEMORY_MAX_BYTES
+        self.max_disk_bytes = max_disk_bytes or settings.LLM_CACHE_DISK_MAX_BYTES
+
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+            "bypasses": 0
+        }
+
+        if self.path:
+            self._open_db()
+
+    def _open_db(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, task_type TEXT, model TEXT, expires_at REAL, "
+            "accessed_at REAL, size INTEGER, response TEXT)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_expiry ON llm_cache(expires_at)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_access ON llm_cache(accessed_at)")
+        self._db.commit()
+
+    @staticmethod
+    def _size(response: str) -> int:
+        return len(response.encode("utf-8"))
+
+    def _forget(self, key: str):
+        """Drop a memory-tier entry (caller holds the lock)."""
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= self._size(entry[1])
+
+    def _remember(self, key: str, expires_at: float, response: str):
+        """Insert into the memory tier, evicting least recently used entries (caller holds the lock)."""
+        self._forget(key)
+        self._memory[key] = (expires_at, response)
+        self._memory_bytes += self._size(response)
+        while self._memory and (
+            len(self._memory) > self.max_entries or self._memory_bytes > self.max_memory_bytes
+        ):
+            oldest = next(iter(self._memory))
+            self._forget(oldest)
+            self._counters["evictions"] += 1
+
+    def _get_memory(self, key: str, now: float) -> Optional[str]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at <= now:
+                self._forget(key)
+                self._counters["expirations"] += 1
+                return None
+            self._memory.move_to_end(key)
+            self._counters["memory_hits"] += 1
+            return response
+
+    def _get_disk(self, key: str, now: float) -> Optional[str]:
+        if self._db is None:
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT expires_at, response FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            expires_at, response = row
+            if expires_at <= now:
+                self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._db.commit()
+                self._counters["expirations"] += 1
+                return None
+            self._db.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            self._counters["disk_hits"] += 1
+            self._remember(key, expires_at, response)
+            return response
+
+    def lookup(self, key: str) -> Tuple[Optional[str], str]:
+        """Look up a response, checking memory then disk.
+
+        Returns:
+            (response or None, tier) where tier is "memory", "disk" or "miss"
+        """
+        now = time.time()
+        response = self._get_memory(key, now)
+        if response is not None:
+            return response, "memory"
+        response = self._get_disk(key, now)
+        if response is not None:
+            return response, "disk"
+        with self._lock:
+            self._counters["misses"] += 1
+        return None, "miss"
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached response for `key`, or None on a miss."""
+        return self.lookup(key)[0]
+
+    def set(self, key: str, response: str, task_type: str = "", model: str = ""):
+        """Store a response in both tiers. Empty responses are not cached."""
+        if not response:
+            return
+        now = time.time()
+        expires_at = now + self.ttl
+        with self._lock:
+            self._remember(key, expires_at, response)
+            self._counters["writes"] += 1
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO llm_cache "
+                    "(key, task_type, model, expires_at, accessed_at, size, response) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, task_type, model, expires_at, now, self._size(response), response)
+                )
+                self._trim_disk()
+                self._db.commit()
+
+    def _trim_disk(self):
+        """Delete least recently used rows until the disk tier fits its byte budget (caller holds the lock)."""
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+        if total <= self.max_disk_bytes:
+            return
+        for key, size in self._db.execute(
+            "SELECT key, size FROM llm_cache ORDER BY accessed_at"
+        ).fetchall():
+            if total <= self.max_disk_bytes:
+                break
+            self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            total -= size
+            self._counters["evictions"] += 1
+
+    async def alookup(self, key: str) -> Tuple[Optional[str], str]:
+        """Async `lookup`; disk lookups run off the event loop."""
+        response = self._get_memory(key, time.time())
+        if response is not None:
+            return response, "memory"
+        return await asyncio.to_thread(self.lookup, key)
+
+    async def aset(self, key: str, response: str, task_type: str = "", model: str = ""):
+        """Async `set`; the disk write runs off the event loop."""
+        await asyncio.to_thread(self.set, key, response, task_type, model)
+
+    def invalidate(self, key: str):
+        """Drop one entry from both tiers (e.g. a response that failed to parse)."""
+        with self._lock:
+            self._forget(key)
+            if self._db is not None:
+                self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._db.commit()
+            self._counters["invalidations"] += 1
+
+    def record_bypass(self):
+        """Count a call that skipped the cache for its task type."""
+        with self._lock:
+            self._counters["bypasses"] += 1
+
+    def purge_expired(self) -> int:
+        """Drop expired entries from both tiers.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        removed = 0
+        with self._lock:
+            for key in [k for k, (expires_at, _) in self._memory.items() if expires_at <= now]:
+                self._forget(key)
+                removed += 1
+            if self._db is not None:
+                cursor = self._db.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+                self._db.commit()
+                removed += cursor.rowcount
+            self._counters["expirations"] += removed
+        return removed
+
+    def clear(self):
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM llm_cache")
+                self._db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and tier sizes."""
+        with self._lock:
+            counters = dict(self._counters)
+            disk_entries, disk_bytes = 0, 0
+            if self._db is not None:
+                disk_entries, disk_bytes = self._db.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+                ).fetchone()
+            memory_entries = len(self._memory)
+            memory_bytes = self._memory_bytes
+
+        lookups = counters["memory_hits"] + counters["disk_hits"] + counters["misses"]
+        hits = counters["memory_hits"] + counters["disk_hits"]
+        return {
+            **counters,
+            "hits": hits,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "memory_entries": memory_entries,
+            "memory_bytes": memory_bytes,
+            "disk_entries": disk_entries,
+            "disk_bytes": disk_bytes,
+            "disk_path": self.path or None,
+            "task_types": list(settings.LLM_CACHE_TASK_TYPES)
+        }
+
+    def close(self):
+        """Close the SQLite connection."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+# Global cache instance
+_llm_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Get the global LLM response cache, or None when caching is disabled."""
+    global _llm_cache
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+    if _llm_cache is None:
+        _llm_cache = LLMResponseCache()
+    return _llm_cache
@@ -0,0 +1,272 @@
+"""Shared scheduler for LLMClient calls.
+
+Concurrent agentic runs used to send unbounded parallel LLM calls, hit
+provider 429s and then rely on tenacity backoff. Every provider call now
+queues here first. Each model has:
+- a requests-per-minute token bucket (LLM_RATE_LIMIT_RPM)
+- a tokens-per-minute token bucket (LLM_RATE_LIMIT_TPM), charged with
+  the estimated prompt tokens plus max_tokens and settled against the
+  actual response length afterwards
+- a cap on concurrent calls
+
+Waiting calls are served by task priority (LLM_TASK_PRIORITIES: synthesis
+and planning ahead of bulk extraction) and, within a priority, fairly
+across research runs: the run with the fewest calls in flight, then the
+fewest calls served, goes first. The run a call belongs to is taken from
+the `llm_request_id` context variable set by the agentic workflow.
+"""
+
+import asyncio
+import itertools
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from backend.config import settings
+from backend.utils.rate_limit import TokenBucket
+
+
+# Research run the current task's LLM calls are attributed to
+llm_request_id: ContextVar[str] = ContextVar("llm_request_id", default="")
+
+# Rough characters per token for budget estimates
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Approximate token count of `text`."""
+    return len(text or "") // CHARS_PER_TOKEN + 1
+
+
+@dataclass
+class _Waiter:
+    priority: int
+    request_id: str
+    task_type: str
+    tokens: float
+    future: asyncio.Future
+    seq: int
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class Grant:
+    """Capacity held by one call; `settle` corrects the token charge."""
+    model: "ModelScheduler"
+    tokens: float
+
+    def settle(self, actual_tokens: float):
+        """Refund the part of the estimate the call did not use."""
+        unused = self.tokens - actual_tokens
+        if unused > 0:
+            self.model.tpm_bucket.refund(unused)
+            self.model.tokens_refunded += unused
+            self.tokens = actual_tokens
+
+
+class ModelScheduler:
+    """Priority queue in front of one model's RPM, TPM and concurrency limits."""
+
+    def __init__(
+        self,
+        model: str,
+        rpm: Optional[float] = None,
+        tpm: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        burst_seconds: Optional[float] = None
+    ):
+        self.model = model
+        self.rpm = rpm or settings.LLM_RATE_LIMIT_RPM
+        self.tpm = tpm or settings.LLM_RATE_LIMIT_TPM
+        self.max_concurrency = max_concurrency or settings.LLM_SCHEDULER_MAX_CONCURRENCY
+        burst_seconds = burst_seconds or settings.LLM_RATE_LIMIT_BURST_SECONDS
+
+        # A burst of a few seconds' budget, so a minute never sees much more than the limit
+        self.rpm_bucket = TokenBucket(self.rpm / 60, self.rpm / 60 * burst_seconds)
+        self.tpm_bucket = TokenBucket(self.tpm / 60, self.tpm / 60 * burst_seconds)
+
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._in_flight_by_request: Dict[str, int] = {}
+        self._served_by_request: Dict[str, int] = {}
+
+        self.in_flight = 0
+        self.acquired = 0
+        self.delayed = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.tokens_reserved = 0.0
+        self.tokens_refunded = 0.0
+
+    def _clamp(self, tokens: float) -> float:
+        # A call larger than the bucket could never be served
+        return min(max(1.0, tokens), self.tpm_bucket.burst)
+
+    def _next_waiter(self) -> _Waiter:
+        """Highest priority first, then the least served run, then arrival order."""
+        return min(
+            self._waiters,
+            key=lambda w: (
+                w.priority,
+                self._in_flight_by_request.get(w.request_id, 0),
+                self._served_by_request.get(w.request_id, 0),
+                w.seq
+            )
+        )
+
+    def _dispatch(self):
+        """Grant capacity to queued calls while the limits allow."""
+        self._timer = None
+        self._waiters = [w for w in self._waiters if not w.future.done()]
+        while self._waiters and self.in_flight < self.max_concurrency:
+            waiter = self._next_waiter()
+            wait = max(self.rpm_bucket.wait_time(1), self.tpm_bucket.wait_time(waiter.tokens))
+            if wait > 0:
+                # Head of the queue keeps its place; lower priorities do not jump it
+                self._timer = asyncio.get_running_loop().call_later(wait, self._dispatch)
+                return
+            self.rpm_bucket.reserve(1)
+            self.tpm_bucket.reserve(waiter.tokens)
+            self._waiters.remove(waiter)
+            self._grant(waiter)
+
+    def _grant(self, waiter: _Waiter):
+        self.in_flight += 1
+        self._in_flight_by_request[waiter.request_id] = self._in_flight_by_request.get(waiter.request_id, 0) + 1
+        self._served_by_request[waiter.request_id] = self._served_by_request.get(waiter.request_id, 0) + 1
+        self.tokens_reserved += waiter.tokens
+
+        waited = time.monotonic() - waiter.enqueued_at
+        self.acquired += 1
+        if waited > 0.001:
+            self.delayed += 1
+        self.total_wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        waiter.future.set_result(None)
+
+    def _release(self, request_id: str):
+        self.in_flight -= 1
+        remaining = self._in_flight_by_request.get(request_id, 1) - 1
+        if remaining > 0:
+            self._in_flight_by_request[request_id] = remaining
+        else:
+            self._in_flight_by_request.pop(request_id, None)
+            if not any(w.request_id == request_id for w in self._waiters):
+                self._served_by_request.pop(request_id, None)
+        if self._timer is None:
+            self._dispatch()
+
+    def _enqueue(self, priority: int, request_id: str, task_type: str, tokens: float) -> _Waiter:
+        if request_id not in self._served_by_request:
+            # A run that just arrived starts level with the others instead of owing them its share
+            self._served_by_request[request_id] = min(self._served_by_request.values(), default=0)
+        waiter = _Waiter(
+            priority=priority,
+            request_id=request_id,
+            task_type=task_type,
+            tokens=tokens,
+            future=asyncio.get_running_loop().create_future(),
+            seq=next(self._seq)
+        )
+        self._waiters.append(waiter)
+        if self._timer is None:
+            self._dispatch()
+        return waiter
+
+    @asynccontextmanager
+    async def acquire(self, priority: int, request_id: str, task_type: str, tokens: float) -> AsyncIterator[Grant]:
+        """Queue for a concurrency slot, one request and `tokens` of TPM budget, then hold the slot."""
+        tokens = self._clamp(tokens)
+        waiter = self._enqueue(priority, request_id, task_type, tokens)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted just as the caller gave up
+                self.tpm_bucket.refund(tokens)
+                self._release(request_id)
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+        try:
+            yield Grant(self, tokens)
+        finally:
+            self._release(request_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Configured limits, queue depth by task type, and wait counters."""
+        queued: Dict[str, int] = {}
+        for waiter in self._waiters:
+            if not waiter.future.done():
+                queued[waiter.task_type] = queued.get(waiter.task_type, 0) + 1
+        return {
+            "rpm": self.rpm,
+            "tpm": self.tpm,
+            "max_concurrency": self.max_concurrency,
+            "current_wait_seconds": round(self.rpm_bucket.wait_time(), 3),
+            "queue_depth": sum(queued.values()),
+            "queued_by_task": queued,
+            "in_flight": self.in_flight,
+            "in_flight_by_request": dict(self._in_flight_by_request),
+            "acquired": self.acquired,
+            "delayed": self.delayed,
+            "avg_wait_seconds": round(self.total_wait_seconds / self.acquired, 3) if self.acquired else 0.0,
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+            "tokens_reserved": round(self.tokens_reserved),
+            "tokens_refunded": round(self.tokens_refunded)
+        }
+
+
+class LLMScheduler:
+    """Registry of ModelScheduler entries keyed by model name."""
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Dict[str, float]]] = None,
+        priorities: Optional[Dict[str, int]] = None
+    ):
+        self.limits = dict(limits if limits is not None else settings.LLM_MODEL_RATE_LIMITS)
+        self.priorities = dict(priorities if priorities is not None else settings.LLM_TASK_PRIORITIES)
+        self._models: Dict[str, ModelScheduler] = {}
+
+    def get(self, model: str) -> ModelScheduler:
+        if model not in self._models:
+            config = self.limits.get(model, {})
+            self._models[model] = ModelScheduler(
+                model,
+                rpm=config.get("rpm"),
+                tpm=config.get("tpm"),
+                max_concurrency=config.get("concurrency")
+            )
+        return self._models[model]
+
+    def priority_for(self, task_type: str) -> int:
+        """Lower runs first; unknown task types go last."""
+        return self.priorities.get(task_type, max(self.priorities.values(), default=0) + 1)
+
+    def acquire(self, model: str, task_type: str, tokens: float, request_id: Optional[str] = None):
+        """Async context manager holding capacity on `model`; yields a Grant."""
+        request_id = llm_request_id.get() if request_id is None else request_id
+        return self.get(model).acquire(self.priority_for(task_type), request_id, task_type, tokens)
+
+    def stats(self) -> Dict[str, Any]:
+        """Scheduler state for every model used so far."""
+        return {model: scheduler.stats() for model, scheduler in sorted(self._models.items())}
+
+
+# Global scheduler instance
+_llm_scheduler: Optional[LLMScheduler] = None
+
+
+def get_llm_scheduler() -> Optional[LLMScheduler]:
+    """Get the global LLM scheduler, or None when scheduling is disabled."""
+    global _llm_scheduler
+    if not settings.LLM_SCHEDULER_ENABLED:
+        return None
+    if _llm_scheduler is None:
+        _llm_scheduler = LLMScheduler()
+    return _llm_scheduler
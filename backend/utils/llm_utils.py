@@ -9,16 +9,25 @@ Features:
 - Retry with exponential backoff (tenacity)
 - Model selection based on task type
 - Cost optimization through model routing
+- Response cache for repeated prompts (see backend/utils/llm_cache.py)
+- Semantic cache for near-duplicate JSON prompts (see backend/utils/semantic_cache.py)
+- Shared RPM/TPM scheduler with task priorities (see backend/utils/llm_scheduler.py)
 """
 
 import os
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Callable
 from enum import Enum
 
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 import httpx
 
 from backend.config import settings
+from backend.utils.llm_cache import LLMResponseCache, get_llm_cache, make_key
+from backend.utils.semantic_cache import get_semantic_cache, partition_key
+from backend.utils.llm_scheduler import estimate_tokens, get_llm_scheduler
+from backend.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
 
 
 class LLMProvider(str, Enum):
@@ -102,7 +111,39 @@ class LLMClient:
             except ImportError:
                 pass
     
-    @retry(**RETRY_CONFIG)
+    def _route(self, task_type: TaskType) -> Tuple[LLMProvider, str]:
+        """Provider and model a call for `task_type` goes to."""
+        if self.provider == LLMProvider.OPENAI and self.openai_client:
+            return LLMProvider.OPENAI, get_model_for_task(task_type)
+        elif self.provider == LLMProvider.GOOGLE and self.google_client:
+            return LLMProvider.GOOGLE, self._gemini_model_for_task(task_type)
+        # Fallback: try OpenAI first, then Google
+        elif self.openai_client:
+            return LLMProvider.OPENAI, get_model_for_task(task_type)
+        elif self.google_client:
+            return LLMProvider.GOOGLE, self._gemini_model_for_task(task_type)
+        raise RuntimeError("No LLM provider configured. Set OPENAI_API_KEY or GOOGLE_API_KEY.")
+
+    @staticmethod
+    def _gemini_model_for_task(task_type: TaskType) -> str:
+        """Select Gemini model based on task complexity."""
+        if task_type in [TaskType.PLANNING, TaskType.VERIFICATION, TaskType.SYNTHESIS]:
+            return "gemini-pro"
+        return "gemini-pro"  # Gemini Flash when available
+
+    @staticmethod
+    def _cache_for(task_type: TaskType, use_cache: Optional[bool]) -> Tuple[Optional[LLMResponseCache], bool]:
+        """The response cache and whether this call may use it.
+
+        `use_cache` overrides LLM_CACHE_TASK_TYPES for a single call.
+        """
+        cache = get_llm_cache()
+        if cache is None:
+            return None, False
+        if use_cache is None:
+            use_cache = task_type.value in settings.LLM_CACHE_TASK_TYPES
+        return cache, use_cache
+
     async def complete(
         self,
         prompt: str,
@@ -110,6 +151,7 @@ class LLMClient:
         system_prompt: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 2000,
+        use_cache: Optional[bool] = None,
         **kwargs
     ) -> str:
         """Generate a completion for the given prompt.
@@ -120,33 +162,83 @@ class LLMClient:
             system_prompt: Optional system message
             temperature: Sampling temperature (0-1)
             max_tokens: Maximum response tokens
+            use_cache: Serve/store the response from the response cache;
+                None uses settings.LLM_CACHE_TASK_TYPES
             **kwargs: Additional provider-specific parameters
             
         Returns:
             Generated text response
         """
-        model = get_model_for_task(task_type)
-        
-        if self.provider == LLMProvider.OPENAI and self.openai_client:
+        provider, model = self._route(task_type)
+        cache, cacheable = self._cache_for(task_type, use_cache)
+        log_fields = dict(task_type=task_type.value, provider=provider.value, model=model)
+
+        if cache is not None and not cacheable:
+            cache.record_bypass()
+            logger.info("llm_cache", status="bypass", **log_fields)
+            cache = None
+
+        key = None
+        if cache is not None:
+            key = make_key(provider.value, model, system_prompt, prompt, temperature, max_tokens)
+            response, tier = await cache.alookup(key)
+            if response is not None:
+                logger.info("llm_cache", status="hit", tier=tier, key=key[:16], **log_fields)
+                return response
+            logger.info("llm_cache", status="miss", key=key[:16], **log_fields)
+
+        response = await self._call(provider, model, prompt, task_type, system_prompt, temperature, max_tokens)
+        if cache is not None:
+            await cache.aset(key, response, task_type=task_type.value, model=model)
+        return response
+
+    @retry(**RETRY_CONFIG)
+    async def _call(
+        self,
+        provider: LLMProvider,
+        model: str,
+        prompt: str,
+        task_type: TaskType,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int
+    ) -> str:
+        """Call the routed provider, retrying transient errors.
+
+        Each attempt queues in the shared LLM scheduler for the model's
+        RPM/TPM budget and a concurrency slot.
+        """
+        scheduler = get_llm_scheduler()
+        if scheduler is None:
+            return await self._provider_complete(
+                provider, model, prompt, task_type, system_prompt, temperature, max_tokens
+            )
+
+        prompt_tokens = estimate_tokens(system_prompt) + estimate_tokens(prompt)
+        async with scheduler.acquire(model, task_type.value, prompt_tokens + max_tokens) as grant:
+            response = await self._provider_complete(
+                provider, model, prompt, task_type, system_prompt, temperature, max_tokens
+            )
+            grant.settle(prompt_tokens + estimate_tokens(response))
+        return response
+
+    async def _provider_complete(
+        self,
+        provider: LLMProvider,
+        model: str,
+        prompt: str,
+        task_type: TaskType,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int
+    ) -> str:
+        if provider == LLMProvider.OPENAI:
             return await self._openai_complete(
                 prompt, model, system_prompt, temperature, max_tokens
             )
-        elif self.provider == LLMProvider.GOOGLE and self.google_client:
-            return await self._google_complete(
-                prompt, task_type, system_prompt, temperature, max_tokens
-            )
-        else:
-            # Fallback: try OpenAI first, then Google
-            if self.openai_client:
-                return await self._openai_complete(
-                    prompt, model, system_prompt, temperature, max_tokens
-                )
-            elif self.google_client:
-                return await self._google_complete(
-                    prompt, task_type, system_prompt, temperature, max_tokens
-                )
-            else:
-                raise RuntimeError("No LLM provider configured. Set OPENAI_API_KEY or GOOGLE_API_KEY.")
+        return await self._google_complete(
+            prompt, task_type, system_prompt, temperature, max_tokens
+        )
     
     async def _openai_complete(
         self,
@@ -180,13 +272,7 @@ class LLMClient:
         max_tokens: int
     ) -> str:
         """Call Google Gemini API."""
-        # Select Gemini model based on task complexity
-        if task_type in [TaskType.PLANNING, TaskType.VERIFICATION, TaskType.SYNTHESIS]:
-            model_name = "gemini-pro"
-        else:
-            model_name = "gemini-pro"  # Gemini Flash when available
-        
-        model = self.google_client.GenerativeModel(model_name)
+        model = self.google_client.GenerativeModel(self._gemini_model_for_task(task_type))
         
         full_prompt = prompt
         if system_prompt:
@@ -207,29 +293,76 @@ class LLMClient:
         prompt: str,
         task_type: TaskType = TaskType.EXTRACTION,
         system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        use_cache: Optional[bool] = None,
+        semantic_text: Optional[str] = None,
+        semantic_scope: Optional[str] = None,
+        validate: Optional[Callable[[Dict[str, Any]], Any]] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """Generate a JSON response.
-        
-        Adds JSON mode instructions and parses the response.
-        
+
+        Adds JSON mode instructions and parses the response. A cached
+        response that fails to parse, or that `validate` rejects, is
+        dropped from the cache, so the next call asks the provider again.
+
         Args:
             prompt: User prompt
             task_type: Task type for model selection
             system_prompt: Optional system message
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum response tokens
+            use_cache: See `complete`; False also skips the semantic cache
+            semantic_text: The question the prompt asks. When given, the
+                response to an earlier prompt with a sufficiently similar
+                question may be served (see backend/utils/semantic_cache.py)
+            semantic_scope: Rest of the prompt's variable part (e.g. the URL
+                and content asked about), which must match exactly
+            validate: Called with the parsed response; raising rejects it
+                and the exception propagates to the caller. Rejected
+                responses are not added to the semantic index, and a
+                semantic match it rejects is not served
             **kwargs: Additional parameters
-            
+
         Returns:
             Parsed JSON dictionary
         """
         import json
-        
-        json_system = (system_prompt or "") + "\n\nRespond ONLY with valid JSON. No markdown, no explanation."
-        
+
+        json_system = ((system_prompt or "") + "\n\nRespond ONLY with valid JSON. No markdown, no explanation.").strip()
+
+        semantic = None
+        candidate = None
+        if semantic_text and use_cache is not False and task_type.value in settings.SEMANTIC_CACHE_TASK_TYPES:
+            semantic = get_semantic_cache()
+        if semantic is not None:
+            provider, model = self._route(task_type)
+            partition = partition_key(
+                task_type.value, provider.value, model, json_system, temperature, max_tokens, semantic_scope or ""
+            )
+            candidate, similarity = semantic.lookup(partition, semantic_text)
+            log_fields = dict(task_type=task_type.value, model=model, similarity=round(similarity, 4))
+            if candidate is not None and validate is not None:
+                try:
+                    validate(json.loads(candidate))
+                except Exception:
+                    candidate = None  # Not usable for this caller; ask the provider
+            if candidate is None:
+                semantic.record("misses")
+                logger.info("llm_semantic_cache", status="miss", **log_fields)
+            elif not settings.SEMANTIC_CACHE_AUDIT:
+                semantic.record("hits")
+                logger.info("llm_semantic_cache", status="hit", **log_fields)
+                return json.loads(candidate)
+
         response = await self.complete(
             prompt=prompt,
             task_type=task_type,
-            system_prompt=json_system.strip(),
+            system_prompt=json_system,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            use_cache=use_cache,
             **kwargs
         )
         
@@ -240,7 +373,30 @@ class LLMClient:
             lines = cleaned.split("\n")
             cleaned = "\n".join(lines[1:-1])
         
-        return json.loads(cleaned)
+        try:
+            parsed = json.loads(cleaned)
+            if validate is not None:
+                validate(parsed)
+        except Exception:
+            cache, cacheable = self._cache_for(task_type, use_cache)
+            if cache is not None and cacheable:
+                provider, model = self._route(task_type)
+                cache.invalidate(make_key(provider.value, model, json_system, prompt, temperature, max_tokens))
+            raise
+
+        if semantic is not None:
+            if candidate is not None:
+                # Audit mode: the match was not served; log whether it would have been the same
+                semantic.record("would_hits")
+                logger.info(
+                    "llm_semantic_cache",
+                    status="would_hit",
+                    same_response=json.loads(candidate) == parsed,
+                    **log_fields
+                )
+            # Only responses the caller accepted are indexed
+            semantic.add(partition, semantic_text, cleaned)
+        return parsed
 
 
 # Global client instance
@@ -0,0 +1,339 @@
+"""Full-page fetching for LLM extraction.
+
+Search snippets are often a sentence or two, and news results carry none,
+so extraction has little to work with. This optional stage downloads the
+pages behind the top-ranked results and reduces them to their main text.
+
+- Requests go through the shared HTTP pool (`pages` connection slots).
+- Result URLs come from third parties, so each host (including every
+  redirect hop) must resolve to public addresses only; loopback, private
+  and link-local targets are refused.
+- Each domain has its own rate limiter (QPS plus concurrency cap), so a
+  burst of results from one site does not hammer it.
+- Bodies are streamed and reading stops at a byte cap; non-HTML content
+  is not downloaded at all.
+- Navigation, scripts, link lists and other boilerplate are removed.
+- Extracted text is cached on disk by content hash, keyed from the
+  canonical URL, so a page is never fetched twice while its entry is
+  fresh, and identical pages at different URLs are stored once. Failed
+  fetches are remembered for a shorter time.
+- Cache reads and writes and the text extraction run in worker threads,
+  off the event loop.
+"""
+
+import asyncio
+import hashlib
+import ipaddress
+import os
+import re
+import socket
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from lxml import etree, html as lxml_html
+
+from backend.config import settings
+from backend.utils.dedup import canonicalize_url
+from backend.utils.http_pool import get_http_pool
+from backend.utils.rate_limit import ProviderRateLimiter
+from backend.utils.single_flight import SingleFlight
+
+
+POOL_KEY = "pages"
+
+HTML_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+
+# Elements that never hold article text
+_DROP_TAGS = [
+    "script", "style", "noscript", "nav", "header", "footer", "aside", "form",
+    "iframe", "svg", "button", "select", "template", "figure"
+]
+# class/id fragments of page furniture
+_BOILERPLATE = re.compile(
+    r"nav|menu|footer|header|sidebar|cookie|consent|banner|subscribe|newsletter|share|social"
+    r"|comment|related|recommend|advert|promo|breadcrumb|popup|modal",
+    re.I
+)
+_BLOCK_TAGS = ["p", "h1", "h2", "h3", "h4", "li", "blockquote", "pre", "td", "dd"]
+_MIN_BLOCK_WORDS = 6
+_MAX_LINK_DENSITY = 0.5
+
+
+def _is_public(address: str) -> bool:
+    """Whether an IP address is publicly routable."""
+    ip = ipaddress.ip_address(address.split("%")[0])  # Drop an IPv6 zone index
+    return ip.is_global and not ip.is_multicast
+
+
+def extract_main_text(content: bytes, max_chars: Optional[int] = None) -> str:
+    """Main text of an HTML page with boilerplate removed.
+
+    Prefers an <article> or <main> element when the page has one. Short
+    blocks (other than headings) and blocks that are mostly link text are
+    dropped.
+    """
+    max_chars = settings.PAGE_TEXT_MAX_CHARS if max_chars is None else max_chars
+    if not content or not content.strip():
+        return ""
+    try:
+        document = lxml_html.document_fromstring(content)
+    except (etree.LxmlError, ValueError):
+        return ""
+
+    etree.strip_elements(document, etree.Comment, *_DROP_TAGS, with_tail=False)
+    for element in document.xpath("//*[@class or @id]"):
+        marker = f"{element.get('class', '')} {element.get('id', '')}"
+        if _BOILERPLATE.search(marker) and element.tag not in ("html", "body", "article", "main"):
+            element.drop_tree()
+
+    roots = document.xpath("//article") or document.xpath("//main") or [document]
+    blocks: List[str] = []
+    seen = set()
+    length = 0
+    for root in roots:
+        for block in root.iter(*_BLOCK_TAGS):
+            if block.getparent() is not None and block.getparent().tag in _BLOCK_TAGS:
+                continue  # Text already taken with the enclosing block
+            text = " ".join(block.text_content().split())
+            words = len(text.split())
+            if not text or text in seen:
+                continue
+            if not block.tag.startswith("h") and words < _MIN_BLOCK_WORDS:
+                continue
+            link_chars = sum(len(a.text_content()) for a in block.iter("a"))
+            if link_chars / len(text) > _MAX_LINK_DENSITY:
+                continue
+            seen.add(text)
+            blocks.append(text)
+            length += len(text) + 1
+            if length >= max_chars:
+                break
+        if length >= max_chars:
+            break
+
+    if not blocks:
+        # No block structure (e.g. plain text); fall back to all visible text
+        blocks = [" ".join(document.text_content().split())]
+    return "\n".join(blocks)[:max_chars]
+
+
+class PageCache:
+    """SQLite store of extracted page text, addressed by content hash."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS page_urls ("
+            "url TEXT PRIMARY KEY, content_hash TEXT, expires_at REAL, error TEXT)"
+        )
+        self._db.execute("CREATE TABLE IF NOT EXISTS page_texts (content_hash TEXT PRIMARY KEY, text TEXT)")
+        self._db.commit()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Cached outcome for a URL: {'text': ...} or {'error': ...}; None if unknown or expired."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT u.content_hash, u.expires_at, u.error, t.text FROM page_urls u "
+                "LEFT JOIN page_texts t ON t.content_hash = u.content_hash WHERE u.url = ?",
+                (url,)
+            ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        content_hash, _, error, text = row
+        if error is not None or text is None:
+            return {"error": error or "missing text"}
+        return {"text": text, "content_hash": content_hash}
+
+    def set_text(self, url: str, text: str, ttl: float) -> str:
+        content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        with self._lock:
+            self._db.execute("INSERT OR IGNORE INTO page_texts (content_hash, text) VALUES (?, ?)", (content_hash, text))
+            self._db.execute(
+                "INSERT OR REPLACE INTO page_urls (url, content_hash, expires_at, error) VALUES (?, ?, ?, NULL)",
+                (url, content_hash, time.time() + ttl)
+            )
+            self._db.commit()
+        return content_hash
+
+    def set_error(self, url: str, error: str, ttl: float):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO page_urls (url, content_hash, expires_at, error) VALUES (?, NULL, ?, ?)",
+                (url, time.time() + ttl, error)
+            )
+            self._db.commit()
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            urls = self._db.execute("SELECT COUNT(*) FROM page_urls").fetchone()[0]
+            texts = self._db.execute("SELECT COUNT(*) FROM page_texts").fetchone()[0]
+        return {"urls": urls, "texts": texts}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class PageFetchError(Exception):
+    """Raised when a page cannot be used for extraction."""
+    pass
+
+
+class PageFetcher:
+    """Fetches result pages politely and returns their main text."""
+
+    def __init__(self, cache_path: Optional[str] = None):
+        path = settings.PAGE_CACHE_PATH if cache_path is None else cache_path
+        self.cache = PageCache(path) if path else None
+        self._domains: "OrderedDict[str, ProviderRateLimiter]" = OrderedDict()
+        self._flight = SingleFlight()
+        self._counters = {
+            "requests": 0,
+            "fetched": 0,
+            "cache_hits": 0,
+            "failures": 0,
+            "truncated": 0,
+            "bytes_downloaded": 0
+        }
+
+    def _domain_limiter(self, domain: str) -> ProviderRateLimiter:
+        limiter = self._domains.get(domain)
+        if limiter is None:
+            # Make room by dropping the least recently used domains with nothing queued or in flight
+            excess = len(self._domains) + 1 - settings.PAGE_FETCH_DOMAIN_LIMITERS
+            idle = [name for name, other in self._domains.items() if not other.queue_depth and not other.in_flight]
+            for name in idle[:max(excess, 0)]:
+                del self._domains[name]
+            limiter = self._domains[domain] = ProviderRateLimiter(
+                domain,
+                qps=settings.PAGE_FETCH_DOMAIN_QPS,
+                burst=settings.PAGE_FETCH_DOMAIN_BURST,
+                max_concurrency=settings.PAGE_FETCH_DOMAIN_CONCURRENCY
+            )
+        self._domains.move_to_end(domain)
+        return limiter
+
+    @staticmethod
+    async def _public_host(url: str) -> str:
+        """Host of `url`, after checking that it only resolves to public addresses.
+
+        Raises:
+            PageFetchError: For non-HTTP URLs and hosts that fail the check
+        """
+        parts = urlsplit(url)
+        domain = (parts.hostname or "").lower()
+        if parts.scheme not in ("http", "https") or not domain:
+            raise PageFetchError("not an absolute http(s) URL")
+        if settings.PAGE_FETCH_ALLOW_PRIVATE_HOSTS:
+            return domain
+        try:
+            port = parts.port or (443 if parts.scheme == "https" else 80)
+            addresses = await asyncio.get_running_loop().getaddrinfo(domain, port, type=socket.SOCK_STREAM)
+        except (socket.gaierror, ValueError) as e:
+            raise PageFetchError(f"cannot resolve {domain}") from e
+        for *_, sockaddr in addresses:
+            if not _is_public(sockaddr[0]):
+                raise PageFetchError(f"{domain} resolves to non-public address {sockaddr[0]}")
+        return domain
+
+    async def fetch(self, url: str) -> Optional[str]:
+        """Main text of the page at `url`, or None if it cannot be fetched."""
+        self._counters["requests"] += 1
+        key = canonicalize_url(url)
+        if self.cache is not None:
+            cached = await asyncio.to_thread(self.cache.get, key)
+            if cached is not None:
+                self._counters["cache_hits"] += 1
+                return cached.get("text")
+        return await self._flight.do(key, lambda: self._fetch_and_store(url, key))
+
+    async def fetch_many(self, urls: List[str]) -> Dict[str, str]:
+        """Fetch pages concurrently; returns text by URL for the pages that succeeded."""
+        texts = await asyncio.gather(*(self.fetch(url) for url in urls))
+        return {url: text for url, text in zip(urls, texts) if text}
+
+    async def _fetch_and_store(self, url: str, key: str) -> Optional[str]:
+        try:
+            text = await asyncio.wait_for(self._download(url), timeout=settings.PAGE_FETCH_TIMEOUT_SECONDS)
+            if not text:
+                raise PageFetchError("no main text")
+        except Exception as e:
+            # HTTP, TLS, decoding and timeout errors all just mean "use the snippet"
+            self._counters["failures"] += 1
+            if self.cache is not None:
+                await asyncio.to_thread(
+                    self.cache.set_error, key, str(e) or type(e).__name__, settings.PAGE_CACHE_FAILURE_TTL_SECONDS
+                )
+            return None
+
+        self._counters["fetched"] += 1
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.set_text, key, text, settings.PAGE_CACHE_TTL_SECONDS)
+        return text
+
+    async def _download(self, url: str) -> str:
+        pool = get_http_pool()
+        max_bytes = settings.PAGE_FETCH_MAX_BYTES
+
+        # Redirects are followed here rather than by the client, so every hop's host is checked
+        for _ in range(settings.PAGE_FETCH_MAX_REDIRECTS + 1):
+            domain = await self._public_host(url)
+            async with self._domain_limiter(domain).acquire(), pool.slot(POOL_KEY):
+                async with pool.client.stream("GET", url, follow_redirects=False) as response:
+                    if response.is_redirect and response.next_request is not None:
+                        url = str(response.next_request.url)
+                        continue
+                    response.raise_for_status()
+                    content_type = response.headers.get("content-type", "text/html").split(";")[0].strip().lower()
+                    if content_type not in HTML_TYPES:
+                        raise PageFetchError(f"unsupported content type {content_type}")
+
+                    chunks: List[bytes] = []
+                    size = 0
+                    async for chunk in response.aiter_bytes():
+                        chunks.append(chunk)
+                        size += len(chunk)
+                        if size >= max_bytes:
+                            # Stop reading; the connection is closed instead of drained
+                            self._counters["truncated"] += 1
+                            break
+                    self._counters["bytes_downloaded"] += min(size, max_bytes)
+
+            return await asyncio.to_thread(extract_main_text, b"".join(chunks)[:max_bytes])
+        raise PageFetchError("too many redirects")
+
+    def stats(self) -> Dict[str, Any]:
+        """Fetch counters and cache size."""
+        return {
+            **self._counters,
+            "domains": len(self._domains),
+            "cache": self.cache.counts() if self.cache is not None else None
+        }
+
+    def close(self):
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
+
+# Global fetcher instance
+_page_fetcher: Optional[PageFetcher] = None
+
+
+def get_page_fetcher() -> Optional[PageFetcher]:
+    """Get the global page fetcher, or None when page fetching is disabled."""
+    global _page_fetcher
+    if not settings.PAGE_FETCH_ENABLED:
+        return None
+    if _page_fetcher is None:
+        _page_fetcher = PageFetcher()
+    return _page_fetcher
@@ -0,0 +1,194 @@
+"""Per-provider health scoreboard and circuit breaker.
+
+Per FR-021 a failing provider must not fail the research run. This goes
+further: once a provider keeps failing (e.g. DuckDuckGo 403s on cloud IPs),
+its circuit opens and calls skip it immediately instead of each paying the
+full timeout. After a cooldown one probe call is let through; if it succeeds
+the circuit closes again.
+
+States:
+- closed: calls go through, outcomes are tracked in a rolling window
+- open: calls are skipped until the cooldown expires
+- half_open: a single probe call is allowed to test recovery
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Deque, Dict, List, Optional
+
+from backend.config import settings
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CallOutcome:
+    """One recorded provider call."""
+    timestamp: float
+    success: bool
+    latency_ms: float
+
+
+class ProviderHealth:
+    """Rolling success-rate/latency tracker and circuit breaker for one provider."""
+
+    def __init__(
+        self,
+        name: str,
+        window_size: Optional[int] = None,
+        min_calls: Optional[int] = None,
+        failure_threshold: Optional[float] = None,
+        cooldown_seconds: Optional[float] = None
+    ):
+        self.name = name
+        self.window_size = window_size or settings.PROVIDER_HEALTH_WINDOW
+        self.min_calls = min_calls or settings.CIRCUIT_MIN_CALLS
+        self.failure_threshold = failure_threshold or settings.CIRCUIT_FAILURE_THRESHOLD
+        self.cooldown_seconds = cooldown_seconds or settings.CIRCUIT_COOLDOWN_SECONDS
+
+        self.outcomes: Deque[CallOutcome] = deque(maxlen=self.window_size)
+        self.state = CircuitState.CLOSED
+        self.opened_at: Optional[float] = None
+        self.probe_in_flight = False
+        self.probe_started_at: Optional[float] = None
+        self.total_calls = 0
+        self.total_failures = 0
+        self.skipped_calls = 0
+        self.times_opened = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def success_rate(self) -> Optional[float]:
+        """Share of successful calls in the rolling window."""
+        if not self.outcomes:
+            return None
+        return sum(1 for o in self.outcomes if o.success) / len(self.outcomes)
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """Latency percentile (0-100) in ms over the rolling window."""
+        if not self.outcomes:
+            return None
+        latencies = sorted(o.latency_ms for o in self.outcomes)
+        index = min(len(latencies) - 1, int(round(percentile / 100 * (len(latencies) - 1))))
+        return latencies[index]
+
+    def allow(self) -> bool:
+        """Whether a call may go to the provider now.
+
+        In half-open state only one probe call is allowed at a time.
+        """
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self.opened_at >= self.cooldown_seconds:
+                self.state = CircuitState.HALF_OPEN
+            else:
+                self.skipped_calls += 1
+                return False
+
+        if self.state == CircuitState.HALF_OPEN:
+            # A probe that never reported back (e.g. cancelled) is given up on after a cooldown
+            probe_stale = (
+                self.probe_started_at is not None
+                and time.monotonic() - self.probe_started_at >= self.cooldown_seconds
+            )
+            if self.probe_in_flight and not probe_stale:
+                self.skipped_calls += 1
+                return False
+            self.probe_in_flight = True
+            self.probe_started_at = time.monotonic()
+
+        return True
+
+    def record(self, success: bool, latency_ms: float, error: Optional[str] = None):
+        """Record a call outcome and update the circuit state."""
+        self.outcomes.append(CallOutcome(time.time(), success, latency_ms))
+        self.total_calls += 1
+        if not success:
+            self.total_failures += 1
+            self.last_error = error
+
+        if self.state == CircuitState.HALF_OPEN:
+            self.probe_in_flight = False
+            if success:
+                self.state = CircuitState.CLOSED
+                # Start fresh so old failures don't reopen the circuit immediately
+                self.outcomes.clear()
+            else:
+                self._open()
+            return
+
+        if self.state == CircuitState.CLOSED and len(self.outcomes) >= self.min_calls:
+            recent = list(self.outcomes)[-self.min_calls:]
+            failure_rate = sum(1 for o in recent if not o.success) / len(recent)
+            if failure_rate >= self.failure_threshold:
+                self._open()
+
+    def _open(self):
+        self.state = CircuitState.OPEN
+        self.opened_at = time.monotonic()
+        self.times_opened += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current health and breaker state."""
+        success_rate = self.success_rate
+        retry_in = None
+        if self.state == CircuitState.OPEN:
+            retry_in = max(0.0, self.cooldown_seconds - (time.monotonic() - self.opened_at))
+        return {
+            "provider": self.name,
+            "state": self.state.value,
+            "success_rate": round(success_rate, 3) if success_rate is not None else None,
+            "latency_p50_ms": self.latency_percentile(50),
+            "latency_p95_ms": self.latency_percentile(95),
+            "window_calls": len(self.outcomes),
+            "total_calls": self.total_calls,
+            "total_failures": self.total_failures,
+            "skipped_calls": self.skipped_calls,
+            "times_opened": self.times_opened,
+            "retry_in_seconds": round(retry_in, 1) if retry_in is not None else None,
+            "last_error": self.last_error
+        }
+
+
+class ProviderHealthBoard:
+    """Scoreboard of ProviderHealth entries keyed by provider name."""
+
+    def __init__(self):
+        self._providers: Dict[str, ProviderHealth] = {}
+
+    def get(self, provider: str) -> ProviderHealth:
+        if provider not in self._providers:
+            self._providers[provider] = ProviderHealth(provider)
+        return self._providers[provider]
+
+    def allow(self, provider: str) -> bool:
+        return self.get(provider).allow()
+
+    def record_success(self, provider: str, latency_ms: float):
+        self.get(provider).record(True, latency_ms)
+
+    def record_failure(self, provider: str, latency_ms: float, error: Optional[str] = None):
+        self.get(provider).record(False, latency_ms, error)
+
+    def snapshot(self, providers: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Health of the given providers (default: all tracked ones)."""
+        names = providers if providers is not None else sorted(self._providers)
+        return [self.get(name).snapshot() for name in names]
+
+
+# Global scoreboard instance
+_health_board: Optional[ProviderHealthBoard] = None
+
+
+def get_health_board() -> ProviderHealthBoard:
+    """Get or create the global provider health scoreboard."""
+    global _health_board
+    if _health_board is None:
+        _health_board = ProviderHealthBoard()
+    return _health_board
@@ -0,0 +1,136 @@
+"""Lazy registry of search providers.
+
+Providers are registered by import path ("module:Class") and imported on
+first lookup, so a deployment only pays the import cost of the providers
+it actually searches (and of their dependencies such as duckduckgo_search
+or bs4). Third-party packages can add providers through the
+`researcher_agent.search_providers` entry point group:
+
+    [project.entry-points."researcher_agent.search_providers"]
+    arxiv = "my_package.arxiv:ArxivProvider"
+
+Built-in names cannot be overridden by entry points.
+"""
+
+from collections.abc import MutableMapping
+from importlib import import_module
+from importlib.metadata import entry_points
+from typing import Dict, Iterator, Mapping, Optional, Type, Union
+
+from .search_providers.base import BaseSearchProvider
+
+
+ENTRY_POINT_GROUP = "researcher_agent.search_providers"
+
+BUILTIN_PROVIDERS: Dict[str, str] = {
+    "google_news": "backend.utils.search_providers.google:GoogleNewsProvider",
+    "linkedin": "backend.utils.search_providers.linkedin:LinkedInProvider",
+    "wikipedia": "backend.utils.search_providers.wikipedia:WikipediaProvider",
+    "duckduckgo": "backend.utils.search_providers.ddg:DuckDuckGoProvider",
+    "reddit": "backend.utils.search_providers.reddit:RedditProvider",
+    "github": "backend.utils.search_providers.github:GitHubProvider",
+    "instagram": "backend.utils.search_providers.instagram:InstagramProvider",
+    "youtube": "backend.utils.search_providers.youtube:YouTubeProvider",
+    "medium": "backend.utils.search_providers.medium:MediumProvider",
+}
+
+ProviderEntry = Union[str, Type[BaseSearchProvider]]
+
+
+def load_provider_class(path: str) -> Type[BaseSearchProvider]:
+    """Import a provider class from a "module:Class" path.
+
+    Raises:
+        ImportError: If the module or class cannot be imported.
+        TypeError: If the target is not a BaseSearchProvider subclass.
+    """
+    module_name, _, attr = path.partition(":")
+    if not module_name or not attr:
+        raise ImportError(f"Invalid provider path {path!r}, expected 'module:Class'")
+
+    target = import_module(module_name)
+    for part in attr.split("."):
+        try:
+            target = getattr(target, part)
+        except AttributeError as e:
+            raise ImportError(f"Cannot import {attr!r} from {module_name!r}") from e
+
+    if not (isinstance(target, type) and issubclass(target, BaseSearchProvider)):
+        raise TypeError(f"{path!r} is not a BaseSearchProvider subclass")
+    return target
+
+
+class ProviderRegistry(MutableMapping):
+    """Provider name -> provider class, importing each class on first lookup.
+
+    Entries may be classes or "module:Class" paths; a path is replaced by
+    its class once loaded. Entry points are only read (not imported) the
+    first time a name is missing or all names are listed. Membership
+    checks and `copy()` never import anything, so `unittest.mock.patch.dict`
+    works without loading every provider.
+    """
+
+    def __init__(
+        self,
+        providers: Optional[Mapping[str, ProviderEntry]] = None,
+        entry_point_group: Optional[str] = ENTRY_POINT_GROUP
+    ):
+        self._entries: Dict[str, ProviderEntry] = dict(providers or {})
+        self._entry_point_group = entry_point_group
+        self._discovered = entry_point_group is None
+
+    def _discover(self) -> None:
+        """Add providers advertised through package entry points."""
+        if self._discovered:
+            return
+        self._discovered = True
+        try:
+            advertised = entry_points(group=self._entry_point_group)
+        except Exception as e:
+            print(f"Could not read search provider entry points: {e}")
+            return
+        for entry_point in advertised:
+            if entry_point.name in self._entries:
+                print(f"Ignoring search provider entry point {entry_point.name!r}: name already registered")
+                continue
+            self._entries[entry_point.name] = entry_point.value
+
+    def __getitem__(self, name: str) -> Type[BaseSearchProvider]:
+        if name not in self:
+            raise KeyError(name)
+        entry = self._entries[name]
+        if isinstance(entry, str):
+            entry = load_provider_class(entry)
+            self._entries[name] = entry
+        return entry
+
+    def __setitem__(self, name: str, entry: ProviderEntry) -> None:
+        self._entries[name] = entry
+
+    def __delitem__(self, name: str) -> None:
+        del self._entries[name]
+
+    def __contains__(self, name: object) -> bool:
+        if name not in self._entries:
+            self._discover()
+        return name in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        self._discover()
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        self._discover()
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def copy(self) -> Dict[str, ProviderEntry]:
+        """Raw entries, without importing providers that are not loaded yet."""
+        self._discover()
+        return dict(self._entries)
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether the provider's class has been imported."""
+        return name in self._entries and not isinstance(self._entries[name], str)
@@ -0,0 +1,199 @@
+"""Per-provider result limits learned from extraction yield.
+
+Providers differ a lot in how often their results are worth the LLM
+tokens spent on them: LinkedIn and Instagram rarely return usable
+snippets, Wikipedia almost always does. For every research type this
+module tracks each provider's yield, i.e. the share of its results that
+produced extracted facts (agentic research) or were cited in the
+synthesized report (research modules), and turns it into a search plan:
+providers ordered by yield, each with a result limit scaled by how its
+yield compares to the others'.
+
+- Yields are smoothed towards the provider's yield across all research
+  types (and that towards PROVIDER_YIELD_PRIOR), so a few results do not
+  swing the plan.
+- Counts decay on every update, so the plan follows providers that get
+  better or worse.
+- A provider never drops below PROVIDER_YIELD_MIN_LIMIT, so it can earn
+  its share back.
+- Counts are persisted to SQLite and survive restarts.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from backend.config import settings
+from backend.utils.dedup import canonicalize_url
+
+
+# Research type of the agentic (plan / deep research) path
+DEEP_RESEARCH = "deep_research"
+
+_URL = re.compile(r"https?://[^\s<>\"')\]]+")
+_MIN_TITLE_CHARS = 12  # Shorter titles match too many unrelated source strings
+
+
+def cited_results(results: List[Dict[str, Any]], sources: Iterable[Any]) -> List[bool]:
+    """Which results a synthesized report cites.
+
+    Reports list their sources as URLs, titles or free text mixing both;
+    a result counts as cited when one of its URLs (after canonicalization)
+    or its title appears in a source.
+    """
+    texts = [str(source) for source in sources or [] if source]
+    cited_urls = set()
+    for url in (url for text in texts for url in _URL.findall(text)):
+        # Trailing punctuation may be the sentence's or the URL's own ("Tesla,_Inc.")
+        cited_urls.update({canonicalize_url(url), canonicalize_url(url.rstrip(".,;:"))})
+    lowered = [text.lower() for text in texts]
+
+    flags = []
+    for result in results:
+        urls = [result.get("link") or result.get("url") or ""] + list(result.get("links") or [])
+        title = (result.get("title") or "").strip().lower()
+        flags.append(
+            any(url and canonicalize_url(url) in cited_urls for url in urls)
+            or (len(title) >= _MIN_TITLE_CHARS and any(title in text for text in lowered))
+        )
+    return flags
+
+
+class ProviderYieldTracker:
+    """Decayed result and useful-result counts per (research type, provider)."""
+
+    def __init__(self, path: Optional[str] = None):
+        """Initialize the tracker.
+
+        Args:
+            path: SQLite file for the counts; empty string keeps them in memory only
+        """
+        self.path = settings.PROVIDER_YIELD_PATH if path is None else path
+        self._counts: Dict[Tuple[str, str], List[float]] = {}  # (type, provider) -> [results, useful]
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+        if self.path:
+            self._open_db()
+
+    def _open_db(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS provider_yield ("
+            "research_type TEXT NOT NULL, provider TEXT NOT NULL, results REAL NOT NULL, useful REAL NOT NULL, "
+            "PRIMARY KEY (research_type, provider))"
+        )
+        self._db.commit()
+        for research_type, provider, results, useful in self._db.execute(
+            "SELECT research_type, provider, results, useful FROM provider_yield"
+        ):
+            self._counts[(research_type, provider)] = [results, useful]
+
+    def record(self, research_type: str, results: Mapping[str, int], useful: Mapping[str, int]):
+        """Add one research run's outcome.
+
+        Args:
+            research_type: Research type the results were gathered for
+            results: Number of results used, by provider
+            useful: Number of those that produced facts or citations, by provider
+        """
+        decay = settings.PROVIDER_YIELD_DECAY
+        rows = []
+        with self._lock:
+            for provider, count in results.items():
+                if count <= 0:
+                    continue
+                counts = self._counts.setdefault((research_type, provider), [0.0, 0.0])
+                counts[0] = counts[0] * decay + count
+                counts[1] = counts[1] * decay + min(useful.get(provider, 0), count)
+                rows.append((research_type, provider, counts[0], counts[1]))
+            if self._db is not None and rows:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO provider_yield (research_type, provider, results, useful) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                self._db.commit()
+
+    def _pooled_yield(self, provider: str) -> float:
+        """Provider's yield across all research types (caller holds the lock)."""
+        results = useful = 0.0
+        for (_, name), counts in self._counts.items():
+            if name == provider:
+                results += counts[0]
+                useful += counts[1]
+        weight = settings.PROVIDER_YIELD_PRIOR_WEIGHT
+        return (useful + weight * settings.PROVIDER_YIELD_PRIOR) / (results + weight)
+
+    def yield_rate(self, research_type: str, provider: str) -> float:
+        """Smoothed share of the provider's results that turned out useful."""
+        with self._lock:
+            results, useful = self._counts.get((research_type, provider), (0.0, 0.0))
+            weight = settings.PROVIDER_YIELD_PRIOR_WEIGHT
+            return (useful + weight * self._pooled_yield(provider)) / (results + weight)
+
+    def plan(self, research_type: str, providers: List[str], limit: int) -> List[Tuple[str, int]]:
+        """Order providers by yield and scale their result limits.
+
+        A provider with the average yield of `providers` gets `limit`
+        results; others get proportionally more or fewer, between
+        PROVIDER_YIELD_MIN_LIMIT and PROVIDER_YIELD_MAX_FACTOR * limit.
+
+        Returns:
+            (provider, limit) pairs, highest yield first; ties keep the given order
+        """
+        providers = list(dict.fromkeys(providers))
+        if not providers:
+            return []
+        rates = {provider: self.yield_rate(research_type, provider) for provider in providers}
+        mean = sum(rates.values()) / len(rates)
+        ordered = sorted(providers, key=lambda provider: -rates[provider])
+        max_limit = max(limit, int(limit * settings.PROVIDER_YIELD_MAX_FACTOR))
+        min_limit = min(limit, settings.PROVIDER_YIELD_MIN_LIMIT)
+        return [
+            (provider, max(min_limit, min(max_limit, round(limit * rates[provider] / mean))) if mean else limit)
+            for provider in ordered
+        ]
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Counts and smoothed yield by research type and provider."""
+        with self._lock:
+            keys = sorted(self._counts)
+            counts = {key: list(self._counts[key]) for key in keys}
+        report: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for research_type, provider in keys:
+            results, useful = counts[(research_type, provider)]
+            report.setdefault(research_type, {})[provider] = {
+                "results": round(results, 2),
+                "useful": round(useful, 2),
+                "yield": round(self.yield_rate(research_type, provider), 3)
+            }
+        return report
+
+    def close(self):
+        """Close the SQLite connection."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+# Global tracker instance
+_yield_tracker: Optional[ProviderYieldTracker] = None
+_tracker_lock = threading.Lock()
+
+
+def get_yield_tracker() -> Optional[ProviderYieldTracker]:
+    """Get the global yield tracker, or None when adaptive limits are disabled."""
+    global _yield_tracker
+    if not settings.PROVIDER_YIELD_ENABLED:
+        return None
+    if _yield_tracker is None:
+        with _tracker_lock:
+            if _yield_tracker is None:
+                _yield_tracker = ProviderYieldTracker()
+    return _yield_tracker
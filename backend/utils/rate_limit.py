@@ -0,0 +1,195 @@
+"""Per-provider rate limiting for search upstreams.
+
+Concurrent research sessions can burst DuckDuckGo and Google News until
+they block us. Each upstream gets a token bucket (sustained QPS plus a
+burst allowance) and a cap on concurrent searches. Callers queue for
+capacity instead of failing, and the current wait and queue depth are
+exposed for monitoring.
+
+Limits are keyed by upstream service, not by provider: the site-scoped
+providers (reddit, github, ...) and LinkedIn all query DuckDuckGo and so
+share its budget.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from backend.config import settings
+
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens/second, holding at most `burst`.
+
+    Callers reserve a token up front; when the bucket is empty the balance
+    goes negative and each caller sleeps until its own token has refilled,
+    so waiters are served in arrival order without holding a lock.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.tokens = self.burst
+        self.updated_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take `tokens` now and return how long to wait before using them."""
+        self._refill()
+        self.tokens -= tokens
+        if self.tokens >= 0 or self.rate <= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def refund(self, tokens: float = 1):
+        """Give back tokens reserved by a caller that gave up waiting."""
+        self._refill()
+        self.tokens = min(self.burst, self.tokens + tokens)
+
+    def wait_time(self, tokens: float = 1) -> float:
+        """How long a new caller would wait for `tokens` right now."""
+        self._refill()
+        if self.tokens >= tokens or self.rate <= 0:
+            return 0.0
+        return (tokens - self.tokens) / self.rate
+
+    async def acquire(self, tokens: float = 1):
+        """Wait until `tokens` are available and take them."""
+        wait = self.reserve(tokens)
+        if wait <= 0:
+            return
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            self.refund(tokens)
+            raise
+
+
+class ProviderRateLimiter:
+    """Token bucket plus concurrency cap for one upstream.
+
+    The concurrency semaphore is bound to the event loop it was created on
+    and is recreated if the limiter is used from another loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        qps: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_concurrency: Optional[int] = None
+    ):
+        self.name = name
+        self.qps = qps or settings.SEARCH_RATE_LIMIT_DEFAULT_QPS
+        self.burst = burst or settings.SEARCH_RATE_LIMIT_DEFAULT_BURST
+        self.max_concurrency = max_concurrency or settings.MAX_CONCURRENT_SEARCHES
+
+        self.bucket = TokenBucket(self.qps, self.burst)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.queue_depth = 0
+        self.in_flight = 0
+        self.acquired = 0
+        self.delayed = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+            self.in_flight = 0
+        return self._semaphore
+
+    @asynccontextmanager
+    async def acquire(self, tokens: float = 1) -> AsyncIterator[None]:
+        """Queue for a concurrency slot and a rate token, then hold the slot."""
+        semaphore = self._get_semaphore()
+        start = time.monotonic()
+
+        self.queue_depth += 1
+        try:
+            await semaphore.acquire()
+            try:
+                await self.bucket.acquire(tokens)
+            except BaseException:
+                semaphore.release()
+                raise
+        finally:
+            self.queue_depth -= 1
+
+        waited = time.monotonic() - start
+        self.acquired += 1
+        if waited > 0.001:
+            self.delayed += 1
+        self.total_wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Configured limits, current wait and queue depth, and wait counters."""
+        return {
+            "qps": self.qps,
+            "burst": self.burst,
+            "max_concurrency": self.max_concurrency,
+            "tokens_available": round(max(0.0, self.bucket.tokens), 2),
+            "current_wait_seconds": round(self.bucket.wait_time(), 3),
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "acquired": self.acquired,
+            "delayed": self.delayed,
+            "avg_wait_seconds": round(self.total_wait_seconds / self.acquired, 3) if self.acquired else 0.0,
+            "max_wait_seconds": round(self.max_wait_seconds, 3)
+        }
+
+
+class SearchRateLimiter:
+    """Registry of ProviderRateLimiter entries keyed by upstream name."""
+
+    def __init__(self, limits: Optional[Dict[str, Dict[str, float]]] = None):
+        self.limits = dict(limits if limits is not None else settings.SEARCH_RATE_LIMITS)
+        self._limiters: Dict[str, ProviderRateLimiter] = {}
+
+    def get(self, upstream: str) -> ProviderRateLimiter:
+        if upstream not in self._limiters:
+            config = self.limits.get(upstream, {})
+            self._limiters[upstream] = ProviderRateLimiter(
+                upstream,
+                qps=config.get("qps"),
+                burst=config.get("burst"),
+                max_concurrency=config.get("concurrency")
+            )
+        return self._limiters[upstream]
+
+    def acquire(self, upstream: str, tokens: float = 1):
+        """Async context manager holding capacity on `upstream`."""
+        return self.get(upstream).acquire(tokens)
+
+    def stats(self) -> Dict[str, Any]:
+        """Limiter state for every upstream used so far."""
+        return {name: limiter.stats() for name, limiter in sorted(self._limiters.items())}
+
+
+# Global limiter instance
+_search_limiter: Optional[SearchRateLimiter] = None
+
+
+def get_search_limiter() -> SearchRateLimiter:
+    """Get or create the global search rate limiter."""
+    global _search_limiter
+    if _search_limiter is None:
+        _search_limiter = SearchRateLimiter()
+    return _search_limiter
@@ -0,0 +1,103 @@
+"""Local BM25 relevance ranking of search results.
+
+Every result for a sub-question is scored against the question in one
+vectorized pass, so only the most relevant ones are sent to the LLM for
+extraction instead of whatever the providers happened to return first.
+"""
+
+import re
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from backend.config import settings
+from backend.utils.search_utils import SearchResult
+
+
+_TOKEN = re.compile(r"\w+")
+
+# Words too common to say anything about relevance
+STOPWORDS = frozenset("""
+a an and are as at be been but by can could did do does for from had has have how i if in
+into is it its of on or over so than that the their them then there these they this to
+was we were what when where which while who whom why will with would you your
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens without stopwords."""
+    return [token for token in _TOKEN.findall((text or "").lower()) if token not in STOPWORDS]
+
+
+def bm25_scores(
+    query: str,
+    documents: Sequence[str],
+    k1: Optional[float] = None,
+    b: Optional[float] = None
+) -> np.ndarray:
+    """Okapi BM25 score of each document for `query`.
+
+    The documents are the corpus, so IDF reflects how distinctive a query
+    term is among this batch of results.
+    """
+    k1 = settings.BM25_K1 if k1 is None else k1
+    b = settings.BM25_B if b is None else b
+
+    query_terms = tokenize(query)
+    if not documents or not query_terms:
+        return np.zeros(len(documents))
+
+    vocabulary = {term: i for i, term in enumerate(dict.fromkeys(query_terms))}
+    query_weights = np.bincount([vocabulary[t] for t in query_terms], minlength=len(vocabulary))
+
+    # Term frequency matrix (documents x query terms) built from flat index arrays
+    doc_tokens = [tokenize(doc) for doc in documents]
+    doc_lengths = np.array([len(tokens) for tokens in doc_tokens], dtype=float)
+    rows = [i for i, tokens in enumerate(doc_tokens) for t in tokens if t in vocabulary]
+    cols = [vocabulary[t] for tokens in doc_tokens for t in tokens if t in vocabulary]
+    tf = np.zeros((len(documents), len(vocabulary)))
+    np.add.at(tf, (rows, cols), 1)
+
+    n_docs = len(documents)
+    df = np.count_nonzero(tf, axis=0)
+    idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+    avg_length = doc_lengths.mean() or 1.0
+    norm = k1 * (1 - b + b * doc_lengths / avg_length)
+
+    term_scores = idf * tf * (k1 + 1) / (tf + norm[:, None])
+    return term_scores @ query_weights
+
+
+def rank_results(
+    query: str,
+    results: List[SearchResult],
+    top_k: Optional[int] = None,
+    min_score: Optional[float] = None
+) -> List[SearchResult]:
+    """Score results against the query and keep the most relevant.
+
+    Fills each result's `relevance_score` with its BM25 score relative to
+    the best result (0-1). Results below `min_score` are dropped, unless
+    no result matches the query at all, in which case the original order
+    is kept.
+
+    Returns:
+        At most `top_k` results, best first
+    """
+    top_k = settings.MAX_SEARCH_RESULTS_PER_QUERY if top_k is None else top_k
+    min_score = settings.RELEVANCE_MIN_SCORE if min_score is None else min_score
+    if not results:
+        return []
+
+    scores = bm25_scores(query, [f"{r.title} {r.snippet}" for r in results])
+    best = scores.max()
+    if best <= 0:
+        return results[:top_k]
+
+    relative = scores / best
+    for result, score in zip(results, relative):
+        result.relevance_score = round(float(score), 4)
+
+    # Stable sort keeps provider order among equal scores
+    order = np.argsort(-relative, kind="stable")
+    return [results[i] for i in order[:top_k] if relative[i] >= min_score]
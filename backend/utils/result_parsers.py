@@ -0,0 +1,94 @@
+"""Fast-path parsers for RSS feeds and search result pages.
+
+Providers only need the first few items of a document, so the lxml fast
+path parses incrementally and stops as soon as `limit` items are found,
+reading fields with precompiled XPath expressions. A document lxml cannot
+parse falls back to a full BeautifulSoup parse.
+"""
+
+from io import BytesIO
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+
+# Fields read from each RSS <item>
+_RSS_FIELDS = {
+    "title": etree.XPath("title[1]"),
+    "link": etree.XPath("link[1]"),
+    "pub_date": etree.XPath("pubDate[1]"),
+}
+
+_RESULT_LINK_CLASS = "result__a"
+
+
+def parse_rss_items(content: bytes, limit: int) -> List[Dict[str, Optional[str]]]:
+    """First `limit` RSS items as dicts with 'title', 'link' and 'pub_date'.
+
+    Missing fields come back as None.
+    """
+    try:
+        return _parse_rss_items_lxml(content, limit)
+    except etree.LxmlError:
+        return _parse_rss_items_bs4(content, limit)
+
+
+def _text(nodes) -> Optional[str]:
+    return "".join(nodes[0].itertext()) if nodes else None
+
+
+def _parse_rss_items_lxml(content: bytes, limit: int) -> List[Dict[str, Optional[str]]]:
+    items = []
+    if limit <= 0:
+        return items
+    for _, item in etree.iterparse(BytesIO(content), events=("end",), tag="item", resolve_entities=False):
+        items.append({field: _text(xpath(item)) for field, xpath in _RSS_FIELDS.items()})
+        if len(items) >= limit:
+            break
+        item.clear()
+    return items
+
+
+def _parse_rss_items_bs4(content: bytes, limit: int) -> List[Dict[str, Optional[str]]]:
+    soup = BeautifulSoup(content, "xml")
+    return [
+        {
+            "title": item.title.text if item.title else None,
+            "link": item.link.text if item.link else None,
+            "pub_date": item.pubDate.text if item.pubDate else None,
+        }
+        for item in soup.find_all("item", limit=limit)
+    ]
+
+
+def parse_result_links(content: bytes, limit: int) -> List[Dict[str, Optional[str]]]:
+    """First `limit` DuckDuckGo HTML result links as dicts with 'title' and 'href'."""
+    try:
+        return _parse_result_links_lxml(content, limit)
+    except (etree.LxmlError, ValueError):
+        return _parse_result_links_bs4(content, limit)
+
+
+def _has_result_class(element) -> bool:
+    return _RESULT_LINK_CLASS in (element.get("class") or "").split()
+
+
+def _parse_result_links_lxml(content: bytes, limit: int) -> List[Dict[str, Optional[str]]]:
+    links = []
+    if limit <= 0:
+        return links
+    for _, link in etree.iterparse(BytesIO(content), events=("end",), tag="a", html=True):
+        if _has_result_class(link):
+            links.append({"title": "".join(link.itertext()), "href": link.get("href", "")})
+            if len(links) >= limit:
+                break
+    return links
+
+
+def _parse_result_links_bs4(content: bytes, limit: int) -> List[Dict[str, Optional[str]]]:
+    soup = BeautifulSoup(content, "html.parser")
+    return [
+        {"title": link.text, "href": link.get("href", "")}
+        for link in soup.find_all("a", class_=_RESULT_LINK_CLASS, limit=limit)
+    ]
@@ -1,38 +1,62 @@
 """Search factory and utility."""
-from typing import List, Dict, Any, Type
+import asyncio
+import sys
+import time
+from contextlib import aclosing
+from typing import AsyncIterator, List, Dict, Any, Tuple, Type, Optional
 from backend.config import settings
+from .search_cache import get_search_cache, SearchCache
+from .single_flight import get_search_flight
+from .provider_health import get_health_board
+from .http_pool import get_http_pool
+from .rate_limit import get_search_limiter
 from .search_providers.base import BaseSearchProvider
-from .search_providers.google import GoogleNewsProvider
-from .search_providers.linkedin import LinkedInProvider
-from .search_providers.wikipedia import WikipediaProvider
-from .search_providers.ddg import DuckDuckGoProvider
-from .search_providers.reddit import RedditProvider
-from .search_providers.github import GitHubProvider
-from .search_providers.instagram import InstagramProvider
-from .search_providers.youtube import YouTubeProvider
-from .search_providers.medium import MediumProvider
-
-# Registry of available providers
-PROVIDER_MAP: Dict[str, Type[BaseSearchProvider]] = {
-    "google_news": GoogleNewsProvider,
-    "linkedin": LinkedInProvider,
-    "wikipedia": WikipediaProvider,
-    "duckduckgo": DuckDuckGoProvider,
-    "reddit": RedditProvider,
-    "github": GitHubProvider,
-    "instagram": InstagramProvider,
-    "youtube": YouTubeProvider,
-    "medium": MediumProvider
-}
-
-def get_search_results(query: str, limit: int = 5, providers: List[str] = None) -> List[Dict[str, Any]]:
+from .provider_registry import BUILTIN_PROVIDERS, ProviderRegistry
+
+# Registry of available providers; each is imported on first use
+PROVIDER_MAP = ProviderRegistry(BUILTIN_PROVIDERS)
+
+# Long-lived provider instances, so sessions and connections are reused across searches
+_provider_instances: Dict[str, BaseSearchProvider] = {}
+
+
+def get_provider(provider_name: str) -> BaseSearchProvider:
+    """Get the shared instance of a registered provider.
+
+    Raises:
+        KeyError: If the provider is not registered.
+        ImportError: If the provider or one of its dependencies cannot be imported.
+    """
+    provider_class = PROVIDER_MAP[provider_name]
+    instance = _provider_instances.get(provider_name)
+    if type(instance) is not provider_class:
+        instance = provider_class()
+        _provider_instances[provider_name] = instance
+    return instance
+
+def _upstream(provider: BaseSearchProvider) -> str:
+    """Rate-limit key of the service a provider actually queries."""
+    return provider.rate_limit_key or provider.pool_key or provider.name
+
+
+def get_search_results(
+    query: str,
+    limit: int = 5,
+    providers: List[str] = None,
+    use_cache: bool = True
+) -> List[Dict[str, Any]]:
     """
     Perform search across multiple configured providers.
 
+    Blocking variant kept for scripts and callers outside the event loop.
+    Async code should use `get_search_results_async` or `gather_search_results`,
+    which also apply the per-upstream rate limits.
+
     Args:
         query: The search term.
         limit: Max results per provider.
         providers: List of provider names to use. If None, uses defaults from settings.
+        use_cache: Set False to skip cached results and fetch fresh ones.
 
     Returns:
         Combined list of results.
@@ -40,17 +64,351 @@ def get_search_results(query: str, limit: int = 5, providers: List[str] = None)
     if providers is None:
         providers = settings.SEARCH_PROVIDERS
 
+    cache = get_search_cache()
+    board = get_health_board()
     all_results = []
 
     for provider_name in providers:
         if provider_name in PROVIDER_MAP:
+            if cache is not None:
+                if not use_cache:
+                    cache.record_bypass()
+                else:
+                    cached = cache.get(provider_name, query, limit)
+                    if cached is not None:
+                        all_results.extend(cached)
+                        continue
+            if not board.allow(provider_name):
+                print(f"Skipping {provider_name}: circuit open")
+                continue
+            start = time.perf_counter()
             try:
-                provider_class = PROVIDER_MAP[provider_name]
-                provider_instance = provider_class()
+                provider_instance = get_provider(provider_name)
                 # print(f"Searching {provider_name} for '{query}'...")
                 results = provider_instance.search(query, limit=limit)
+                board.record_success(provider_name, (time.perf_counter() - start) * 1000)
                 all_results.extend(results)
+                if cache is not None:
+                    cache.set(provider_name, query, limit, results)
             except Exception as e:
+                board.record_failure(provider_name, (time.perf_counter() - start) * 1000, str(e))
                 print(f"Failed to search {provider_name}: {e}")
 
     return all_results
+
+
+def _is_site_provider(provider_class: Type[BaseSearchProvider]) -> bool:
+    # Looked up in sys.modules so grouping never imports the DuckDuckGo client
+    # itself; a loaded site-scoped provider has already imported it.
+    ddg = sys.modules.get("backend.utils.search_providers.ddg")
+    return ddg is not None and issubclass(provider_class, ddg.SiteSearchProvider)
+
+
+def _available_providers(providers: List[str]) -> List[str]:
+    """Registered providers whose classes import, in order and without repeats."""
+    names = []
+    for name in dict.fromkeys(providers):
+        if name not in PROVIDER_MAP:
+            continue
+        try:
+            PROVIDER_MAP[name]
+        except (ImportError, TypeError) as e:
+            print(f"Skipping {name}: provider unavailable ({e})")
+            continue
+        names.append(name)
+    return names
+
+
+def _group_providers(providers: List[str]) -> List[List[str]]:
+    """Split providers into search groups.
+
+    Site-scoped DuckDuckGo providers share one multiplexed group when
+    more than one is selected; every other provider is its own group.
+    Providers that fail to import are left out.
+    """
+    names = _available_providers(providers)
+    site_names = [name for name in names if _is_site_provider(PROVIDER_MAP[name])]
+    if not settings.SEARCH_MULTIPLEX_SITES or len(site_names) < 2:
+        return [[name] for name in names]
+    return [[name] for name in names if name not in site_names] + [site_names]
+
+
+async def _multiplex_sites(
+    provider_names: List[str],
+    query: str,
+    limit: int,
+    upstream: str
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Search several site-scoped providers through OR'd `site:` DDG queries.
+
+    Each upstream round takes its own token from the `upstream` rate limiter.
+    """
+    from .search_providers.ddg import search_sites
+
+    site_providers = [get_provider(name) for name in provider_names]
+    bucket = get_search_limiter().get(upstream).bucket
+    loop = asyncio.get_running_loop()
+
+    def take_token():
+        # Called from the worker thread; the bucket belongs to the event loop
+        asyncio.run_coroutine_threadsafe(bucket.acquire(), loop).result()
+
+    async with get_http_pool().slot("duckduckgo"):
+        per_provider = await asyncio.to_thread(
+            search_sites, site_providers, query, limit, before_round=take_token
+        )
+    return dict(zip(provider_names, per_provider))
+
+
+async def _search_providers(
+    provider_names: List[str],
+    query: str,
+    limit: int,
+    semaphore: asyncio.Semaphore,
+    use_cache: bool = True
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Run one query against a provider group under the fan-out semaphore.
+
+    A single provider is searched directly; a group of site-scoped providers
+    is multiplexed into as few upstream queries as possible. Cached results
+    are served without taking a semaphore slot, concurrent identical searches
+    share one upstream call, and providers with an open circuit are skipped
+    immediately. Upstream calls queue on the provider's rate limiter.
+
+    Returns:
+        Results keyed by provider name.
+    """
+    cache = get_search_cache()
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    to_fetch = []
+    for provider_name in provider_names:
+        if cache is not None:
+            if not use_cache:
+                cache.record_bypass()
+            else:
+                cached = await cache.aget(provider_name, query, limit)
+                if cached is not None:
+                    results[provider_name] = cached
+                    continue
+        to_fetch.append(provider_name)
+
+    if not to_fetch:
+        return results
+
+    board = get_health_board()
+
+    async def fetch() -> Dict[str, List[Dict[str, Any]]]:
+        allowed = []
+        for provider_name in to_fetch:
+            if board.allow(provider_name):
+                allowed.append(provider_name)
+            else:
+                print(f"Skipping {provider_name}: circuit open")
+        if not allowed:
+            return {}
+
+        # A multiplexed group only holds site-scoped providers, which share one upstream
+        upstream = _upstream(get_provider(allowed[0]))
+        multiplexed = len(allowed) > 1
+
+        # A multiplexed group takes a rate token per upstream round instead of one up front
+        async with semaphore, get_search_limiter().acquire(upstream, 0 if multiplexed else 1):
+            start = time.perf_counter()
+            try:
+                if not multiplexed:
+                    provider_instance = get_provider(allowed[0])
+                    fetched = {allowed[0]: await provider_instance.asearch(query, limit=limit)}
+                else:
+                    fetched = await _multiplex_sites(allowed, query, limit, upstream)
+            except Exception as e:
+                latency_ms = (time.perf_counter() - start) * 1000
+                for provider_name in allowed:
+                    board.record_failure(provider_name, latency_ms, str(e))
+                print(f"Failed to search {', '.join(allowed)}: {e}")
+                return {}
+            latency_ms = (time.perf_counter() - start) * 1000
+            for provider_name in allowed:
+                board.record_success(provider_name, latency_ms)
+
+        if cache is not None:
+            for provider_name, provider_results in fetched.items():
+                await cache.aset(provider_name, query, limit, provider_results)
+        return fetched
+
+    key = ("search", tuple(to_fetch), SearchCache.normalize_query(query), limit)
+    fetched = await get_search_flight().do(key, fetch)
+    for provider_name in to_fetch:
+        results[provider_name] = list(fetched.get(provider_name, []))
+    return results
+
+
+async def _stream_provider_results(
+    queries: List[str],
+    limit: int,
+    providers: List[str],
+    deadline: float,
+    max_concurrency: int,
+    use_cache: bool,
+    limits: Optional[Dict[str, int]] = None
+) -> AsyncIterator[Tuple[int, str, List[Dict[str, Any]]]]:
+    """Yield (query index, provider name, results) as each search group finishes.
+
+    Searches still running when the deadline expires, or when the consumer
+    stops iterating, are cancelled.
+    """
+    limits = limits or {}
+    groups = _group_providers(providers)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    # A multiplexed group is searched once with its largest limit and trimmed per provider
+    jobs = {
+        asyncio.create_task(_search_providers(
+            group, query, max(limits.get(name, limit) for name in group), semaphore, use_cache
+        )): query_index
+        for query_index, query in enumerate(queries)
+        for group in groups
+    }
+    if not jobs:
+        return
+
+    loop = asyncio.get_running_loop()
+    expires_at = loop.time() + deadline
+    pending = set(jobs)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, timeout=max(0.0, expires_at - loop.time()), return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                print(f"Search deadline of {deadline}s hit: {len(pending)} of {len(jobs)} searches cancelled")
+                break
+            for task in done:
+                for provider_name, provider_results in task.result().items():
+                    yield jobs[task], provider_name, provider_results[:limits.get(provider_name, limit)]
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def stream_search_results(
+    queries: List[str],
+    limit: int = 5,
+    providers: List[str] = None,
+    deadline: Optional[float] = None,
+    max_concurrency: Optional[int] = None,
+    use_cache: bool = True,
+    limits: Optional[Dict[str, int]] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Search every (query, provider) pair concurrently, yielding results as they arrive.
+
+    Results of a fast provider are yielded while slower ones are still in
+    flight. Arguments are the same as for `gather_search_results`.
+    """
+    if providers is None:
+        providers = settings.SEARCH_PROVIDERS
+    if deadline is None:
+        deadline = settings.SEARCH_FANOUT_DEADLINE_SECONDS
+    if max_concurrency is None:
+        max_concurrency = settings.SEARCH_FANOUT_CONCURRENCY
+
+    async with aclosing(_stream_provider_results(
+        queries, limit, providers, deadline, max_concurrency, use_cache, limits
+    )) as stream:
+        async for _, _, provider_results in stream:
+            for result in provider_results:
+                yield result
+
+
+async def gather_search_results(
+    queries: List[str],
+    limit: int = 5,
+    providers: List[str] = None,
+    deadline: Optional[float] = None,
+    max_concurrency: Optional[int] = None,
+    use_cache: bool = True,
+    limits: Optional[Dict[str, int]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Search every (query, provider) pair concurrently.
+
+    Args:
+        queries: The search terms.
+        limit: Max results per provider per query.
+        providers: List of provider names to use. If None, uses defaults from settings.
+        deadline: Overall time budget in seconds. Searches still running when it
+            expires are cancelled and whatever has completed is returned.
+        max_concurrency: Max searches in flight at once.
+        use_cache: Set False to skip cached results and fetch fresh ones.
+        limits: Per-provider overrides of `limit`.
+
+    Returns:
+        Combined list of results, ordered by query then provider.
+    """
+    pairs = await gather_attributed_results(
+        queries, limit, providers, deadline, max_concurrency, use_cache, limits
+    )
+    return [result for _, result in pairs]
+
+
+async def gather_attributed_results(
+    queries: List[str],
+    limit: int = 5,
+    providers: List[str] = None,
+    deadline: Optional[float] = None,
+    max_concurrency: Optional[int] = None,
+    use_cache: bool = True,
+    limits: Optional[Dict[str, int]] = None
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Same as `gather_search_results`, with each result paired with the name of its provider.
+
+    Returns:
+        (provider name, result) pairs, ordered by query then provider.
+    """
+    if providers is None:
+        providers = settings.SEARCH_PROVIDERS
+    if deadline is None:
+        deadline = settings.SEARCH_FANOUT_DEADLINE_SECONDS
+    if max_concurrency is None:
+        max_concurrency = settings.SEARCH_FANOUT_CONCURRENCY
+
+    by_pair: Dict[tuple, List[Dict[str, Any]]] = {}
+    async for query_index, provider_name, provider_results in _stream_provider_results(
+        queries, limit, providers, deadline, max_concurrency, use_cache, limits
+    ):
+        by_pair[(query_index, provider_name)] = provider_results
+
+    pairs = []
+    for query_index in range(len(queries)):
+        for group in _group_providers(providers):
+            for provider_name in group:
+                pairs.extend((provider_name, result) for result in by_pair.get((query_index, provider_name), []))
+
+    return pairs
+
+
+async def get_search_results_async(
+    query: str,
+    limit: int = 5,
+    providers: List[str] = None,
+    deadline: Optional[float] = None,
+    use_cache: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Async counterpart of `get_search_results` with providers searched concurrently.
+
+    Args:
+        query: The search term.
+        limit: Max results per provider.
+        providers: List of provider names to use. If None, uses defaults from settings.
+        deadline: Overall time budget in seconds; partial results are returned after it.
+        use_cache: Set False to skip cached results and fetch fresh ones.
+
+    Returns:
+        Combined list of results.
+    """
+    return await gather_search_results(
+        [query], limit=limit, providers=providers, deadline=deadline, use_cache=use_cache
+    )
@@ -0,0 +1,270 @@
+"""Two-tier cache for search provider results.
+
+Per FR-021 searches degrade gracefully; this cache additionally avoids
+repeating them. Results are keyed by (provider, canonical query, limit)
+and stored in:
+- a bounded in-memory LRU tier, for hot entities within one process
+- a persistent SQLite tier, shared across restarts
+
+Each provider has its own TTL (news goes stale in minutes, encyclopedia
+entries in days). Only successful searches are stored (failures raise and
+never reach the cache), so an empty list is a genuine "no results"
+answer. It is cached too, but only for SEARCH_CACHE_EMPTY_TTL_SECONDS,
+since a new query often starts returning results soon after.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.config import settings
+from backend.utils.entities import normalize_query
+
+
+class SearchCache:
+    """In-memory LRU in front of an on-disk SQLite store, with per-provider TTLs."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        path: Optional[str] = None,
+        ttls: Optional[Dict[str, int]] = None,
+        default_ttl: Optional[int] = None,
+        empty_ttl: Optional[int] = None
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Max entries in the memory tier
+            path: SQLite file for the disk tier; empty string disables it
+            ttls: TTL in seconds per provider name
+            default_ttl: TTL for providers missing from `ttls`
+            empty_ttl: Max TTL for empty result lists
+        """
+        self.max_entries = max_entries or settings.SEARCH_CACHE_MEMORY_ENTRIES
+        self.path = settings.SEARCH_CACHE_PATH if path is None else path
+        self.ttls = dict(ttls if ttls is not None else settings.SEARCH_CACHE_TTL_SECONDS)
+        self.default_ttl = default_ttl or settings.SEARCH_CACHE_DEFAULT_TTL_SECONDS
+        self.empty_ttl = settings.SEARCH_CACHE_EMPTY_TTL_SECONDS if empty_ttl is None else empty_ttl
+
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "bypasses": 0
+        }
+
+        if self.path:
+            self._open_db()
+
+    def _open_db(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS search_cache ("
+            "key TEXT PRIMARY KEY, provider TEXT, expires_at REAL, payload TEXT)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_search_cache_expiry ON search_cache(expires_at)")
+        self._db.commit()
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Normalize a query for cache keying.
+
+        Entity aliases share a key (see
+        `backend.utils.entities.normalize_query`); with query normalization
+        disabled only case and whitespace are normalized.
+        """
+        if not settings.QUERY_NORMALIZATION_ENABLED:
+            return " ".join(query.lower().split())
+        return normalize_query(query)
+
+    def make_key(self, provider: str, query: str, limit: int, namespace: str = "") -> str:
+        """Build the cache key for a (provider, query, limit) lookup.
+
+        `namespace` separates callers that store different result formats
+        for the same provider.
+        """
+        raw = "\x1f".join([namespace, provider, self.normalize_query(query), str(limit)])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, provider: str, empty: bool = False) -> int:
+        """TTL in seconds for a provider's results (or its empty answers)."""
+        ttl = self.ttls.get(provider, self.default_ttl)
+        return min(ttl, self.empty_ttl) if empty else ttl
+
+    def _remember(self, key: str, expires_at: float, payload: str):
+        """Insert into the memory tier, evicting least recently used entries."""
+        self._memory[key] = (expires_at, payload)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    def _get_memory(self, key: str, now: float) -> Optional[str]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= now:
+                del self._memory[key]
+                self._counters["expirations"] += 1
+                return None
+            self._memory.move_to_end(key)
+            self._counters["memory_hits"] += 1
+            return payload
+
+    def _get_disk(self, key: str, now: float) -> Optional[str]:
+        if self._db is None:
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT expires_at, payload FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            expires_at, payload = row
+            if expires_at <= now:
+                self._db.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                self._db.commit()
+                self._counters["expirations"] += 1
+                return None
+            self._counters["disk_hits"] += 1
+            self._remember(key, expires_at, payload)
+            return payload
+
+    def get(self, provider: str, query: str, limit: int, namespace: str = "") -> Optional[List[Dict[str, Any]]]:
+        """Look up cached results, checking memory then disk.
+
+        Returns:
+            The cached result list, or None on a miss
+        """
+        key = self.make_key(provider, query, limit, namespace)
+        now = time.time()
+        payload = self._get_memory(key, now)
+        if payload is None:
+            payload = self._get_disk(key, now)
+        if payload is None:
+            with self._lock:
+                self._counters["misses"] += 1
+            return None
+        return json.loads(payload)
+
+    def set(self, provider: str, query: str, limit: int, results: List[Dict[str, Any]], namespace: str = ""):
+        """Store results in both tiers. Empty lists get the shorter empty TTL."""
+        ttl = self.ttl_for(provider, empty=not results)
+        if ttl <= 0:
+            return
+        key = self.make_key(provider, query, limit, namespace)
+        expires_at = time.time() + ttl
+        payload = json.dumps(results, default=str)
+
+        with self._lock:
+            self._remember(key, expires_at, payload)
+            self._counters["writes"] += 1
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO search_cache (key, provider, expires_at, payload) VALUES (?, ?, ?, ?)",
+                    (key, provider, expires_at, payload)
+                )
+                self._db.commit()
+
+    async def aget(self, provider: str, query: str, limit: int, namespace: str = "") -> Optional[List[Dict[str, Any]]]:
+        """Async `get`; disk lookups run off the event loop."""
+        key = self.make_key(provider, query, limit, namespace)
+        payload = self._get_memory(key, time.time())
+        if payload is not None:
+            return json.loads(payload)
+        return await asyncio.to_thread(self.get, provider, query, limit, namespace)
+
+    async def aset(self, provider: str, query: str, limit: int, results: List[Dict[str, Any]], namespace: str = ""):
+        """Async `set`; the disk write runs off the event loop."""
+        await asyncio.to_thread(self.set, provider, query, limit, results, namespace)
+
+    def record_bypass(self):
+        """Count a lookup skipped because the caller asked to bypass the cache."""
+        with self._lock:
+            self._counters["bypasses"] += 1
+
+    def purge_expired(self) -> int:
+        """Drop expired entries from both tiers.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        removed = 0
+        with self._lock:
+            for key in [k for k, (expires_at, _) in self._memory.items() if expires_at <= now]:
+                del self._memory[key]
+                removed += 1
+            if self._db is not None:
+                cursor = self._db.execute("DELETE FROM search_cache WHERE expires_at <= ?", (now,))
+                self._db.commit()
+                removed += cursor.rowcount
+            self._counters["expirations"] += removed
+        return removed
+
+    def clear(self):
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM search_cache")
+                self._db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and tier sizes."""
+        with self._lock:
+            counters = dict(self._counters)
+            disk_entries = 0
+            if self._db is not None:
+                disk_entries = self._db.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+            memory_entries = len(self._memory)
+
+        lookups = counters["memory_hits"] + counters["disk_hits"] + counters["misses"]
+        hits = counters["memory_hits"] + counters["disk_hits"]
+        return {
+            **counters,
+            "hits": hits,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "memory_entries": memory_entries,
+            "max_memory_entries": self.max_entries,
+            "disk_entries": disk_entries,
+            "disk_path": self.path or None
+        }
+
+    def close(self):
+        """Close the SQLite connection."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+# Global cache instance
+_search_cache: Optional[SearchCache] = None
+
+
+def get_search_cache() -> Optional[SearchCache]:
+    """Get the global search cache, or None when caching is disabled."""
+    global _search_cache
+    if not settings.SEARCH_CACHE_ENABLED:
+        return None
+    if _search_cache is None:
+        _search_cache = SearchCache()
+    return _search_cache
@@ -1,9 +1,22 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from backend.utils.http_pool import get_http_pool
+
+
+class SearchProviderError(Exception):
+    """Raised when a provider's upstream refuses or fails a search."""
+    pass
+
 
 class BaseSearchProvider(ABC):
     """Abstract base class for search providers."""
 
+    # Key for per-provider connection limits and pool statistics
+    pool_key: Optional[str] = None
+    # Upstream service whose rate limit the provider draws on; defaults to pool_key
+    rate_limit_key: Optional[str] = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -15,7 +28,23 @@ class BaseSearchProvider(ABC):
         """
         Perform a search.
 
+        Errors are raised rather than swallowed; the search factory
+        degrades gracefully (FR-021) and tracks provider health.
+
         Returns:
             List of dicts with 'title', 'link', 'published_date', 'source'.
         """
         pass
+
+    async def asearch(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Perform a search without blocking the event loop.
+
+        By default the blocking `search` runs in a worker thread, holding one
+        of the provider's connection slots. Providers with native async I/O
+        should override this.
+        """
+        if self.pool_key is None:
+            return await asyncio.to_thread(self.search, query, limit)
+        async with get_http_pool().slot(self.pool_key):
+            return await asyncio.to_thread(self.search, query, limit)
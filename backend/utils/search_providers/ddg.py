@@ -1,30 +1,163 @@
-from typing import List, Dict, Any
+import threading
+from typing import Callable, List, Dict, Any, Optional
+from urllib.parse import urlparse
 from duckduckgo_search import DDGS
+from backend.config import settings
 from .base import BaseSearchProvider
 
+# One long-lived DDGS session shared by every DuckDuckGo-backed provider,
+# so its HTTP client and cookies are reused instead of rebuilt per search.
+# A session that fails is dropped, see ddgs_text().
+_ddgs: Optional[DDGS] = None
+_ddgs_lock = threading.Lock()
+
+
+def get_ddgs() -> DDGS:
+    """Get or create the shared DuckDuckGo search session."""
+    global _ddgs
+    if _ddgs is None:
+        with _ddgs_lock:
+            if _ddgs is None:
+                _ddgs = DDGS()
+    return _ddgs
+
+
+def reset_ddgs(session: Optional[DDGS] = None):
+    """Drop the shared session (only if it is still `session`, when given)."""
+    global _ddgs
+    with _ddgs_lock:
+        if session is None or _ddgs is session:
+            _ddgs = None
+
+
+def ddgs_text(query: str, max_results: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Run a text search on the shared DuckDuckGo session.
+
+    DDGS flags itself on any failed request and never clears the flag, so
+    every later call on that session raises "Exception occurred in
+    previous call." A session whose call fails is therefore dropped and
+    the next call builds a fresh one.
+    """
+    ddgs = get_ddgs()
+    try:
+        return list(ddgs.text(query, max_results=max_results))
+    except Exception:
+        if isinstance(ddgs, DDGS):
+            # Stand-ins (benchmarks/replay.py, tests) keep no such state
+            reset_ddgs(ddgs)
+        raise
+
+
 class DuckDuckGoProvider(BaseSearchProvider):
     """Search provider using DuckDuckGo."""
 
+    pool_key = "duckduckgo"
+
     @property
     def name(self) -> str:
         return "DuckDuckGo"
 
     def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
         results = []
-        try:
-            with DDGS() as ddgs:
-                # Use 'text' search for general web results
-                search_results = list(ddgs.text(query, max_results=limit))
-
-                for item in search_results:
-                    results.append({
-                        "title": item.get("title", ""),
-                        "link": item.get("href", ""),
-                        "published_date": "", # DDG text search often doesn't give date
-                        "source": "DuckDuckGo",
-                        "snippet": item.get("body", "")
-                    })
-        except Exception as e:
-            print(f"Error searching DuckDuckGo: {e}")
+        # Use 'text' search for general web results
+        search_results = ddgs_text(query, max_results=limit)
+
+        for item in search_results:
+            results.append({
+                "title": item.get("title", ""),
+                "link": item.get("href", ""),
+                "published_date": "", # DDG text search often doesn't give date
+                "source": "DuckDuckGo",
+                "snippet": item.get("body", "")
+            })
 
         return results
+
+
+class SiteSearchProvider(BaseSearchProvider):
+    """Search provider scoped to one site via a DuckDuckGo `site:` filter.
+
+    Subclasses set `site` (e.g. "reddit.com") and `name`.
+    """
+
+    site: str = ""
+    rate_limit_key = "duckduckgo"
+
+    def matches(self, url: str) -> bool:
+        """Whether a result URL belongs to this provider's site."""
+        host = (urlparse(url).hostname or "").lower()
+        return host == self.site or host.endswith("." + self.site)
+
+    def to_result(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a raw DDG text result to this provider's result format."""
+        return {
+            "title": item.get("title", ""),
+            "link": item.get("href", ""),
+            "published_date": "",
+            "source": self.name,
+            "snippet": item.get("body", "")
+        }
+
+    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        search_query = f"site:{self.site} {query}"
+        search_results = ddgs_text(search_query, max_results=limit)
+        return [self.to_result(item) for item in search_results]
+
+
+def search_sites(
+    providers: List[SiteSearchProvider],
+    query: str,
+    limit: int = 5,
+    max_rounds: Optional[int] = None,
+    before_round: Optional[Callable[[], None]] = None
+) -> List[List[Dict[str, Any]]]:
+    """Search several site-scoped providers with as few DDG queries as possible.
+
+    The sites are OR'd into one query and results are split back out by
+    domain. Providers still short of `limit` are retried together in a
+    further round. A provider that gains nothing is only dropped when the
+    round came back short, since in a full round it may just have been
+    crowded out by busier sites.
+
+    `before_round` is called before each DDG query, e.g. to wait for a
+    rate-limit token.
+
+    Returns:
+        Results for each provider, in the order given.
+    """
+    max_rounds = max_rounds or settings.SEARCH_MULTIPLEX_MAX_ROUNDS
+    results: List[List[Dict[str, Any]]] = [[] for _ in providers]
+    seen_links = set()
+    remaining = list(range(len(providers)))
+
+    for _ in range(max_rounds):
+        if not remaining:
+            break
+
+        site_filter = " OR ".join(f"site:{providers[i].site}" for i in remaining)
+        wanted = sum(limit - len(results[i]) for i in remaining)
+        # Over-fetch since results are not spread evenly across sites
+        requested = wanted * settings.SEARCH_MULTIPLEX_OVERFETCH
+        if before_round is not None:
+            before_round()
+        raw = ddgs_text(f"{site_filter} {query}", max_results=requested)
+        exhausted = len(raw) < requested
+
+        gained = {i: 0 for i in remaining}
+        for item in raw:
+            link = item.get("href", "")
+            if link in seen_links:
+                continue
+            for i in remaining:
+                if len(results[i]) < limit and providers[i].matches(link):
+                    results[i].append(providers[i].to_result(item))
+                    seen_links.add(link)
+                    gained[i] += 1
+                    break
+
+        remaining = [
+            i for i in remaining
+            if len(results[i]) < limit and (gained[i] > 0 or not exhausted)
+        ]
+
+    return results
@@ -1,40 +1,73 @@
 import requests
-from bs4 import BeautifulSoup
 from typing import List, Dict, Any
+from backend.config import settings
+from backend.utils.http_pool import get_http_pool
+from backend.utils.feed_cache import get_feed_cache
+from backend.utils.result_parsers import parse_rss_items
 from .base import BaseSearchProvider
 
 class GoogleNewsProvider(BaseSearchProvider):
     """Search provider using Google News RSS."""
 
+    pool_key = "google_news"
+
+    def __init__(self):
+        # Keep-alive session for the blocking path; the async path uses the shared pool
+        self.session = requests.Session()
+
     @property
     def name(self) -> str:
         return "Google News"
 
-    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+    def _feed_url(self, query: str) -> str:
         # Use the RSS feed for Google News
-        rss_url = f"https://news.google.com/rss/search?q={requests.utils.quote(query)}&hl=en-US&gl=US&ceid=US:en"
+        return f"{settings.GOOGLE_NEWS_RSS_URL}?q={requests.utils.quote(query)}&hl=en-US&gl=US&ceid=US:en"
 
-        try:
-            response = requests.get(rss_url, timeout=10)
+    def _parse_feed(self, content: bytes, limit: int) -> List[Dict[str, Any]]:
+        results = []
+        for item in parse_rss_items(content, limit):
+            results.append({
+                "title": item["title"] if item["title"] is not None else "No Title",
+                "link": item["link"] if item["link"] is not None else "#",
+                "published_date": item["pub_date"] or "",
+                "source": "Google News"
+            })
+
+        return results
+
+    def _read_feed(self, url: str, status_code: int, headers, content: bytes, limit: int) -> List[Dict[str, Any]]:
+        feeds = get_feed_cache()
+        if feeds is None:
+            return self._parse_feed(content, limit)
+        return feeds.read(url, status_code, headers, content, limit, self._parse_feed)
+
+    def _request_headers(self, url: str) -> Dict[str, str]:
+        # Validators from the last response make the request conditional
+        feeds = get_feed_cache()
+        return feeds.conditional_headers(url) if feeds is not None else {}
+
+    def _read_response(self, url: str, response, limit: int) -> List[Dict[str, Any]]:
+        if response.status_code != 304:
             response.raise_for_status()
+        return self._read_feed(url, response.status_code, response.headers, response.content, limit)
+
+    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        url = self._feed_url(query)
+        response = self.session.get(url, headers=self._request_headers(url), timeout=10)
+        try:
+            return self._read_response(url, response, limit)
+        except LookupError:
+            # 304 for a feed evicted after its validators were sent: fetch it in full
+            response = self.session.get(url, timeout=10)
+            return self._read_response(url, response, limit)
 
-            soup = BeautifulSoup(response.content, "xml")
-            items = soup.find_all("item", limit=limit)
-
-            results = []
-            for item in items:
-                title = item.title.text if item.title else "No Title"
-                link = item.link.text if item.link else "#"
-                pub_date = item.pubDate.text if item.pubDate else ""
-
-                results.append({
-                    "title": title,
-                    "link": link,
-                    "published_date": pub_date,
-                    "source": "Google News"
-                })
-
-            return results
-        except Exception as e:
-            print(f"Error searching Google News: {e}")
-            return []
+    async def asearch(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        url = self._feed_url(query)
+        pool = get_http_pool()
+        response = await pool.get(self.pool_key, url, headers=self._request_headers(url))
+        try:
+            return self._read_response(url, response, limit)
+        except LookupError:
+            # 304 for a feed evicted after its validators were sent: fetch it in full
+            response = await pool.get(self.pool_key, url)
+            return self._read_response(url, response, limit)
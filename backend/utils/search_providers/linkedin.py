@@ -1,53 +1,55 @@
 import requests
-from bs4 import BeautifulSoup
 from typing import List, Dict, Any
-from .base import BaseSearchProvider
+from backend.config import settings
+from backend.utils.http_pool import get_http_pool, DEFAULT_HEADERS
+from backend.utils.result_parsers import parse_result_links
+from .base import BaseSearchProvider, SearchProviderError
 
 class LinkedInProvider(BaseSearchProvider):
     """Search provider for LinkedIn via Google Search Proxy."""
 
+    pool_key = "linkedin"
+    rate_limit_key = "duckduckgo"  # Searches go through DDG's HTML endpoint
+
+    def __init__(self):
+        # Keep-alive session for the blocking path; the async path uses the shared pool
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+
     @property
     def name(self) -> str:
         return "LinkedIn"
 
-    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+    def _search_url(self, query: str) -> str:
         # We use a DuckDuckGo HTML search proxy or similar to find LinkedIn profiles
         # Note: Scraping Google/DDG results directly can be fragile.
         # This is a best-effort implementation without an API key.
-
         search_query = f"site:linkedin.com/in/ OR site:linkedin.com/company/ {query}"
-        url = f"https://html.duckduckgo.com/html/?q={requests.utils.quote(search_query)}"
-
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-
-        try:
-            response = requests.get(url, headers=headers, timeout=10)
-            # DDG 403s often on cloud IPs, but let's try.
-            # If it fails, we return empty list (graceful degradation).
-            if response.status_code != 200:
-                print(f"LinkedIn Proxy Search failed: {response.status_code}")
-                return []
-
-            soup = BeautifulSoup(response.content, "html.parser")
-            results = []
-
-            # DDG HTML structure selectors
-            links = soup.find_all("a", class_="result__a", limit=limit)
-
-            for link in links:
-                title = link.text
-                url = link['href']
-
-                results.append({
-                    "title": title,
-                    "link": url,
-                    "published_date": "",
-                    "source": "LinkedIn"
-                })
-
-            return results
-        except Exception as e:
-            print(f"Error searching LinkedIn: {e}")
-            return []
+        return f"{settings.DUCKDUCKGO_HTML_URL}?q={requests.utils.quote(search_query)}"
+
+    def _parse_results(self, status_code: int, content: bytes, limit: int) -> List[Dict[str, Any]]:
+        # DDG 403s often on cloud IPs, but let's try.
+        # Failures are reported so the circuit breaker can skip us while blocked.
+        if status_code != 200:
+            raise SearchProviderError(f"LinkedIn Proxy Search failed: {status_code}")
+
+        results = []
+
+        # DDG HTML result links (a.result__a)
+        for link in parse_result_links(content, limit):
+            results.append({
+                "title": link["title"],
+                "link": link["href"],
+                "published_date": "",
+                "source": "LinkedIn"
+            })
+
+        return results
+
+    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        response = self.session.get(self._search_url(query), timeout=10)
+        return self._parse_results(response.status_code, response.content, limit)
+
+    async def asearch(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        response = await get_http_pool().get(self.pool_key, self._search_url(query))
+        return self._parse_results(response.status_code, response.content, limit)
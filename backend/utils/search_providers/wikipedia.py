@@ -1,39 +1,34 @@
-import wikipedia
 from typing import List, Dict, Any
+from backend.utils.wikipedia_api import WikipediaAPI, WikipediaPage
 from .base import BaseSearchProvider
 
 class WikipediaProvider(BaseSearchProvider):
     """Search provider using Wikipedia API."""
 
+    pool_key = "wikipedia"
+
+    def __init__(self):
+        self.api = WikipediaAPI()
+
     @property
     def name(self) -> str:
         return "Wikipedia"
 
-    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
-        try:
-            # Search for page titles
-            titles = wikipedia.search(query, results=limit)
+    def _to_results(self, pages: List[WikipediaPage]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "title": f"Wikipedia: {page.title}",
+                "link": page.url,
+                "published_date": "",
+                "source": "Wikipedia",
+                "snippet": page.extract
+            }
+            for page in pages
+        ]
 
-            results = []
-            for title in titles:
-                try:
-                    # Get summary (limiting chars to avoid huge payload)
-                    summary = wikipedia.summary(title, sentences=2)
-                    url = wikipedia.page(title).url
-
-                    results.append({
-                        "title": f"Wikipedia: {title}",
-                        "link": url,
-                        "published_date": "",
-                        "source": "Wikipedia",
-                        "snippet": summary
-                    })
-                except wikipedia.exceptions.DisambiguationError:
-                    continue
-                except wikipedia.exceptions.PageError:
-                    continue
+    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        # Titles, two-sentence summaries and URLs in one request
+        return self._to_results(self.api.search_sync(query, limit=limit, sentences=2))
 
-            return results
-        except Exception as e:
-            print(f"Error searching Wikipedia: {e}")
-            return []
+    async def asearch(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        return self._to_results(await self.api.search(query, limit=limit, sentences=2))
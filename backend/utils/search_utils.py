@@ -11,7 +11,8 @@ Providers:
 """
 
 import asyncio
-from typing import List, Dict, Any, Optional
+import time
+from typing import AsyncIterator, List, Dict, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -20,6 +21,13 @@ import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from backend.config import settings
+from backend.utils.search_cache import get_search_cache, SearchCache
+from backend.utils.single_flight import get_search_flight
+from backend.utils.wikipedia_api import WikipediaAPI
+from backend.utils.provider_health import get_health_board
+from backend.utils.rate_limit import get_search_limiter
+from backend.utils.language import detect_english, is_english
+from backend.utils.provider_yield import get_yield_tracker
 
 
 class SearchProvider(str, Enum):
@@ -52,32 +60,19 @@ class SearchResult:
             "language": self.language,
             "relevance_score": self.relevance_score
         }
-
-
-def is_english(text: str) -> bool:
-    """Simple heuristic to check if text is likely English.
-    
-    Per NFR-008: Non-English search results MUST be filtered out.
-    """
-    if not text:
-        return False
-    
-    # Common English words for quick detection
-    english_indicators = [
-        'the', 'is', 'are', 'was', 'were', 'been', 'being',
-        'have', 'has', 'had', 'do', 'does', 'did',
-        'will', 'would', 'could', 'should', 'may', 'might',
-        'and', 'but', 'or', 'because', 'if', 'when', 'while'
-    ]
     
-    text_lower = text.lower()
-    words = text_lower.split()
-    
-    if len(words) < 3:
-        return True  # Too short to determine
-    
-    matches = sum(1 for word in words if word in english_indicators)
-    return (matches / len(words)) > 0.05  # At least 5% English indicators
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SearchResult":
+        """Rebuild a SearchResult from `to_dict` output."""
+        return cls(
+            url=data["url"],
+            title=data["title"],
+            snippet=data["snippet"],
+            source=SearchProvider(data["source"]),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            language=data.get("language", "en"),
+            relevance_score=data.get("relevance_score", 0.0)
+        )
 
 
 class SearchClient:
@@ -90,6 +85,7 @@ class SearchClient:
     def __init__(self):
         self.http_client = httpx.AsyncClient(timeout=settings.SEARCH_TIMEOUT_SECONDS)
         self.max_results = settings.MAX_SEARCH_RESULTS_PER_QUERY
+        self.wikipedia = WikipediaAPI()
     
     async def close(self):
         """Close the HTTP client."""
@@ -99,7 +95,8 @@ class SearchClient:
         self,
         query: str,
         provider: SearchProvider = SearchProvider.DUCKDUCKGO,
-        max_results: Optional[int] = None
+        max_results: Optional[int] = None,
+        use_cache: bool = True
     ) -> List[SearchResult]:
         """Execute a search query.
         
@@ -107,6 +104,7 @@ class SearchClient:
             query: Search query string
             provider: Search provider to use
             max_results: Maximum results to return
+            use_cache: Set False to skip cached results and fetch fresh ones
             
         Returns:
             List of SearchResult objects
@@ -114,16 +112,12 @@ class SearchClient:
         max_results = max_results or self.max_results
         
         try:
-            if provider == SearchProvider.DUCKDUCKGO:
-                results = await self._search_duckduckgo(query, max_results)
-            elif provider == SearchProvider.WIKIPEDIA:
-                results = await self._search_wikipedia(query, max_results)
-            else:
-                results = []
+            results = await self._fetch_cached(query, provider, max_results, use_cache)
             
             # Filter non-English results per NFR-008
             if settings.FILTER_NON_ENGLISH:
-                results = [r for r in results if is_english(r.snippet)]
+                scores = detect_english([r.snippet for r in results])
+                results = [r for r, score in zip(results, scores) if score.is_english]
             
             return results
             
@@ -132,38 +126,127 @@ class SearchClient:
             # Log error and return empty list instead of failing
             return []
     
-    async def search_all_providers(
+    async def _fetch_cached(
         self,
         query: str,
-        max_results_per_provider: Optional[int] = None
+        provider: SearchProvider,
+        max_results: int,
+        use_cache: bool
     ) -> List[SearchResult]:
-        """Search across all available providers.
+        """Fetch raw (unfiltered) results, going through the search cache.
+        
+        Concurrent identical fetches share one upstream call, and a
+        provider with an open circuit is skipped without a network call.
+        Upstream calls queue on the provider's rate limiter.
+        """
+        cache = get_search_cache()
+        if cache is not None:
+            if not use_cache:
+                cache.record_bypass()
+            else:
+                cached = await cache.aget(provider.value, query, max_results, namespace="search_client")
+                if cached is not None:
+                    return [SearchResult.from_dict(r) for r in cached]
+        
+        board = get_health_board()
+        
+        async def fetch() -> List[SearchResult]:
+            if not board.allow(provider.value):
+                return []
+            
+            async with get_search_limiter().acquire(provider.value):
+                start = time.perf_counter()
+                try:
+                    if provider == SearchProvider.DUCKDUCKGO:
+                        results = await self._search_duckduckgo(query, max_results)
+                    elif provider == SearchProvider.WIKIPEDIA:
+                        results = await self._search_wikipedia(query, max_results)
+                    else:
+                        results = []
+                except Exception as e:
+                    board.record_failure(provider.value, (time.perf_counter() - start) * 1000, str(e))
+                    raise
+                board.record_success(provider.value, (time.perf_counter() - start) * 1000)
+            
+            if cache is not None:
+                await cache.aset(
+                    provider.value, query, max_results,
+                    [r.to_dict() for r in results], namespace="search_client"
+                )
+            return results
+        
+        key = ("search_client", provider.value, SearchCache.normalize_query(query), max_results)
+        return list(await get_search_flight().do(key, fetch))
+    
+    async def stream_all_providers(
+        self,
+        query: str,
+        max_results_per_provider: Optional[int] = None,
+        use_cache: bool = True,
+        research_type: Optional[str] = None
+    ) -> AsyncIterator[SearchResult]:
+        """Search across all available providers, yielding results as they arrive.
+        
+        Providers are searched concurrently and each one's results are
+        yielded as soon as it responds, so consumers can start processing
+        while slower providers are still in flight. Searches still running
+        when the consumer stops iterating are cancelled.
         
         Args:
             query: Search query string
             max_results_per_provider: Max results per provider
+            use_cache: Set False to skip cached results and fetch fresh ones
+            research_type: When set, per-provider limits follow the yield learned for it
             
-        Returns:
-            Combined list of SearchResult objects
+        Yields:
+            SearchResult objects in arrival order
         """
         max_results = max_results_per_provider or (self.max_results // 2)
         
-        # Execute searches concurrently
+        plan = [(provider.value, max_results) for provider in (SearchProvider.DUCKDUCKGO, SearchProvider.WIKIPEDIA)]
+        tracker = get_yield_tracker() if research_type else None
+        if tracker is not None:
+            plan = tracker.plan(research_type, [name for name, _ in plan], max_results)
+        
         tasks = [
-            self.search(query, SearchProvider.DUCKDUCKGO, max_results),
-            self.search(query, SearchProvider.WIKIPEDIA, max_results)
+            asyncio.create_task(self.search(query, SearchProvider(name), limit, use_cache))
+            for name, limit in plan
         ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                # search() never raises; failures come back as empty lists
+                for result in await next_done:
+                    yield result
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+    
+    async def search_all_providers(
+        self,
+        query: str,
+        max_results_per_provider: Optional[int] = None,
+        use_cache: bool = True
+    ) -> List[SearchResult]:
+        """Search across all available providers.
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Flatten results, handling any exceptions
-        all_results = []
-        for result in results:
-            if isinstance(result, list):
-                all_results.extend(result)
-            # Skip exceptions - already logged in search()
+        Collects `stream_all_providers` into a list.
         
-        return all_results
+        Args:
+            query: Search query string
+            max_results_per_provider: Max results per provider
+            use_cache: Set False to skip cached results and fetch fresh ones
+            
+        Returns:
+            Combined list of SearchResult objects
+        """
+        return [
+            result async for result in self.stream_all_providers(
+                query, max_results_per_provider, use_cache
+            )
+        ]
     
     @retry(
         stop=stop_after_attempt(3),
@@ -173,28 +256,25 @@ class SearchClient:
     async def _search_duckduckgo(self, query: str, max_results: int) -> List[SearchResult]:
         """Search using DuckDuckGo.
         
-        Uses the duckduckgo-search library.
+        Uses the shared duckduckgo-search session in a worker thread.
+        Errors propagate so provider health is tracked; search() degrades per FR-021.
         """
-        try:
-            from duckduckgo_search import DDGS
-            
-            results = []
-            with DDGS() as ddgs:
-                for r in ddgs.text(query, max_results=max_results):
-                    results.append(SearchResult(
-                        url=r.get("href", ""),
-                        title=r.get("title", ""),
-                        snippet=r.get("body", ""),
-                        source=SearchProvider.DUCKDUCKGO,
-                        timestamp=datetime.now(),
-                        language="en"  # DuckDuckGo defaults to English
-                    ))
-            
-            return results
-            
-        except Exception as e:
-            # Return empty on error per FR-021
-            return []
+        from backend.utils.search_providers.ddg import ddgs_text
+        
+        raw_results = await asyncio.to_thread(ddgs_text, query, max_results=max_results)
+        
+        results = []
+        for r in raw_results:
+            results.append(SearchResult(
+                url=r.get("href", ""),
+                title=r.get("title", ""),
+                snippet=r.get("body", ""),
+                source=SearchProvider.DUCKDUCKGO,
+                timestamp=datetime.now(),
+                language="en"  # DuckDuckGo defaults to English
+            ))
+        
+        return results
     
     @retry(
         stop=stop_after_attempt(3),
@@ -204,37 +284,25 @@ class SearchClient:
     async def _search_wikipedia(self, query: str, max_results: int) -> List[SearchResult]:
         """Search Wikipedia for verification and background.
         
-        Uses the wikipedia library.
+        Fetches titles, intro extracts and URLs for all hits in one
+        batched MediaWiki request (English Wikipedia per NFR-007).
+        Disambiguation and missing pages are skipped.
         """
-        try:
-            import wikipedia
-            
-            # Set language to English per NFR-007
-            wikipedia.set_lang("en")
-            
-            results = []
-            search_results = wikipedia.search(query, results=max_results)
-            
-            for title in search_results[:max_results]:
-                try:
-                    page = wikipedia.page(title, auto_suggest=False)
-                    results.append(SearchResult(
-                        url=page.url,
-                        title=page.title,
-                        snippet=page.summary[:500] + "..." if len(page.summary) > 500 else page.summary,
-                        source=SearchProvider.WIKIPEDIA,
-                        timestamp=datetime.now(),
-                        language="en"
-                    ))
-                except (wikipedia.exceptions.DisambiguationError,
-                        wikipedia.exceptions.PageError):
-                    # Skip disambiguation pages and missing pages
-                    continue
-            
-            return results
-            
-        except Exception as e:
-            return []
+        pages = await self.wikipedia.search(query, limit=max_results)
+        
+        results = []
+        for page in pages[:max_results]:
+            summary = page.extract
+            results.append(SearchResult(
+                url=page.url,
+                title=page.title,
+                snippet=summary[:500] + "..." if len(summary) > 500 else summary,
+                source=SearchProvider.WIKIPEDIA,
+                timestamp=datetime.now(),
+                language="en"
+            ))
+        
+        return results
 
 
 # Global client instance
@@ -0,0 +1,231 @@
+"""Semantic cache for LLMClient.complete_json.
+
+The exact-match response cache (backend/utils/llm_cache.py) misses
+prompts that differ only slightly: the planner rephrases sub-questions,
+and recursion asks "What is X?" over the same snippets. This cache
+embeds the question a prompt asks with a local hashed n-gram vectorizer
+and serves the stored response of the most similar earlier prompt when
+cosine similarity reaches SEMANTIC_CACHE_THRESHOLD.
+
+Entries are only compared within a partition: the same task type,
+provider, model, system prompt, temperature and max_tokens, plus an
+exact scope such as the URL and content the question is asked over.
+Content is never embedded: a long page would swamp the question, and
+different questions over the same page would look alike. A match must
+also contain exactly the same numbers (years, amounts), which n-gram
+similarity barely distinguishes. The index is a fixed-size NumPy matrix
+used as a ring buffer, so memory stays bounded and the oldest entry is
+overwritten first.
+
+In audit mode would-be hits are logged (with whether the cached response
+matched the fresh one) but never served, for tuning the threshold.
+"""
+
+import hashlib
+import re
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from backend.config import settings
+from backend.utils.relevance import STOPWORDS
+
+
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)*")
+_WORD = re.compile(r"\w+")
+# Question words decide what is asked ("who founded" vs "when founded"), so they are kept
+_QUESTION_WORDS = frozenset("how what when where which who whom why".split())
+
+
+def _words(text: str) -> list:
+    """Lowercased word tokens without stopwords, keeping question words."""
+    return [w for w in _WORD.findall((text or "").lower()) if w not in STOPWORDS or w in _QUESTION_WORDS]
+
+
+def embed(text: str, dim: Optional[int] = None) -> np.ndarray:
+    """L2-normalized hashed n-gram vector of `text`.
+
+    Features are word unigrams and bigrams (stopwords other than
+    question words removed) and
+    character trigrams within words, so rephrasings and small edits keep
+    most of their features. Each feature is hashed to a dimension with a
+    hashed sign, which keeps collisions from only adding up.
+    """
+    dim = dim or settings.SEMANTIC_CACHE_DIM
+    words = _words(text)
+    features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    features += [f"#{w[i:i + 3]}" for w in words if len(w) > 3 for i in range(len(w) - 2)]
+
+    vector = np.zeros(dim, dtype=np.float32)
+    if not features:
+        return vector
+    hashes = np.fromiter((zlib.crc32(f.encode("utf-8")) for f in features), dtype=np.uint32, count=len(features))
+    signs = np.where(hashes & 1, 1.0, -1.0).astype(np.float32)
+    np.add.at(vector, (hashes >> 1) % dim, signs)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def number_signature(text: str) -> int:
+    """Integer id of the set of numeric tokens in `text`."""
+    numbers = sorted({token for token in _NUMBER.findall(text or "")})
+    return int.from_bytes(hashlib.sha256(" ".join(numbers).encode("utf-8")).digest()[:8], "big", signed=True)
+
+
+def partition_key(
+    task_type: str,
+    provider: str,
+    model: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int,
+    scope: str = ""
+) -> int:
+    """Integer id of the request settings and exact `scope` a semantic match must share."""
+    raw = "\x1f".join([
+        task_type, provider, model, system_prompt or "", str(float(temperature)), str(int(max_tokens)),
+        hashlib.sha256(scope.encode("utf-8")).hexdigest()
+    ])
+    return int.from_bytes(hashlib.sha256(raw.encode("utf-8")).digest()[:8], "big", signed=True)
+
+
+class SemanticCache:
+    """Bounded in-memory index of prompt vectors and their responses."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        dim: Optional[int] = None,
+        threshold: Optional[float] = None,
+        ttl: Optional[int] = None
+    ):
+        """Initialize the index.
+
+        Args:
+            max_entries: Entries kept; the oldest is overwritten beyond this
+            dim: Vector dimensions
+            threshold: Minimum cosine similarity for a match
+            ttl: Seconds an entry stays valid
+        """
+        self.max_entries = max_entries or settings.SEMANTIC_CACHE_MAX_ENTRIES
+        self.dim = dim or settings.SEMANTIC_CACHE_DIM
+        self.threshold = settings.SEMANTIC_CACHE_THRESHOLD if threshold is None else threshold
+        self.ttl = settings.LLM_CACHE_TTL_SECONDS if ttl is None else ttl
+
+        self._vectors = np.zeros((self.max_entries, self.dim), dtype=np.float32)
+        self._partitions = np.zeros(self.max_entries, dtype=np.int64)
+        self._numbers = np.zeros(self.max_entries, dtype=np.int64)
+        self._expires = np.zeros(self.max_entries)  # 0 marks an empty slot
+        self._responses: Dict[int, str] = {}
+        self._slots: Dict[Tuple[int, str], int] = {}  # (partition, text digest) -> slot
+        self._digests: Dict[int, Tuple[int, str]] = {}
+        self._next = 0
+        self._lock = threading.Lock()
+        self._counters = {
+            "hits": 0,
+            "would_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0
+        }
+
+    @staticmethod
+    def _digest(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def lookup(self, partition: int, text: str) -> Tuple[Optional[str], float]:
+        """Most similar stored response in `partition`.
+
+        Returns:
+            (response, similarity), or (None, best similarity) when nothing
+            reaches the threshold
+        """
+        vector = embed(text, self.dim)
+        numbers = number_signature(text)
+        with self._lock:
+            live = (
+                (self._partitions == partition)
+                & (self._numbers == numbers)
+                & (self._expires > time.time())
+            )
+            if not live.any():
+                return None, 0.0
+            slots = np.flatnonzero(live)
+            similarities = self._vectors[slots] @ vector
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+            if similarity < self.threshold:
+                return None, similarity
+            return self._responses[int(slots[best])], similarity
+
+    def record(self, status: str):
+        """Count a lookup outcome: "hits", "would_hits" or "misses"."""
+        with self._lock:
+            self._counters[status] += 1
+
+    def add(self, partition: int, text: str, response: str):
+        """Index a response; re-adding the same text refreshes its entry."""
+        if not response:
+            return
+        vector = embed(text, self.dim)
+        digest = (partition, self._digest(text))
+        with self._lock:
+            slot = self._slots.get(digest)
+            if slot is None:
+                slot = self._next
+                self._next = (self._next + 1) % self.max_entries
+                old = self._digests.pop(slot, None)
+                if old is not None:
+                    del self._slots[old]
+                    self._counters["evictions"] += 1
+                self._slots[digest] = slot
+                self._digests[slot] = digest
+            self._vectors[slot] = vector
+            self._partitions[slot] = partition
+            self._numbers[slot] = number_signature(text)
+            self._expires[slot] = time.time() + self.ttl
+            self._responses[slot] = response
+            self._counters["writes"] += 1
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._expires[:] = 0
+            self._responses.clear()
+            self._slots.clear()
+            self._digests.clear()
+            self._next = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and index size."""
+        with self._lock:
+            counters = dict(self._counters)
+            entries = int(np.count_nonzero(self._expires > time.time()))
+        lookups = counters["hits"] + counters["would_hits"] + counters["misses"]
+        return {
+            **counters,
+            "hit_rate": round((counters["hits"] + counters["would_hits"]) / lookups, 3) if lookups else 0.0,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "index_bytes": int(self._vectors.nbytes),
+            "threshold": self.threshold,
+            "audit": settings.SEMANTIC_CACHE_AUDIT,
+            "task_types": list(settings.SEMANTIC_CACHE_TASK_TYPES)
+        }
+
+
+# Global cache instance
+_semantic_cache: Optional[SemanticCache] = None
+
+
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """Get the global semantic cache, or None when it is disabled."""
+    global _semantic_cache
+    if not settings.SEMANTIC_CACHE_ENABLED:
+        return None
+    if _semantic_cache is None:
+        _semantic_cache = SemanticCache()
+    return _semantic_cache
@@ -0,0 +1,69 @@
+"""Single-flight coalescing of identical in-flight async calls.
+
+When several callers ask for the same key at the same time (e.g. two users
+researching the same entity, or modules planning overlapping queries),
+only the first one runs the upstream call. The rest await its result.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share a key.
+
+    The shared call runs in its own task, so one caller being cancelled
+    (e.g. by a search deadline) does not cancel it for the others.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `fn` for `key`, or join the call already in flight for it.
+
+        Args:
+            key: Identity of the call; equal keys share one execution
+            fn: Zero-argument coroutine function doing the actual work
+
+        Returns:
+            The result of the (possibly shared) call
+        """
+        self.calls += 1
+        flight_key = (asyncio.get_running_loop(), key)
+        task = self._in_flight.get(flight_key)
+
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[flight_key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(flight_key, None))
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counts of calls, upstream executions and deduplicated calls."""
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+            "coalesced_rate": round(self.coalesced / self.calls, 3) if self.calls else 0.0
+        }
+
+
+# Global instance shared by the search layers
+_search_flight: Optional[SingleFlight] = None
+
+
+def get_search_flight() -> SingleFlight:
+    """Get or create the single-flight group for search provider calls."""
+    global _search_flight
+    if _search_flight is None:
+        _search_flight = SingleFlight()
+    return _search_flight
@@ -0,0 +1,264 @@
+"""Raw search snapshots per research run (FR-020).
+
+Every agentic run stores its request, plan and, for each sub-question,
+the raw search results as they came back from the providers (duplicates
+included) together with any page text fetched for them. Changing an
+extraction prompt or model can then be evaluated by replaying a run:
+extraction, verification and synthesis are re-run from the snapshot
+with no search calls at all.
+
+Payloads are stored as zlib-compressed canonical JSON addressed by the
+SHA-256 of their content, so identical result lists and page texts
+(common across runs on the same entity) are stored once. An index links
+each payload to its request_id and sub-question. Compression and SQLite
+commits block, so async callers run the store's methods in worker threads.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from backend.config import settings
+from backend.models import AgenticResearchRequest, ResearchPlan, SubQuestion
+from backend.utils.search_utils import SearchResult
+
+
+def question_key(text: str) -> str:
+    """Key of a sub-question within a run (same normalization as DeepResearcher's visited topics)."""
+    return text.lower().strip()
+
+
+@dataclass
+class QuestionSnapshot:
+    """Stored search outcome of one sub-question."""
+    question_id: str
+    text: str
+    depth: int
+    results: List[Dict[str, Any]]  # SearchResult.to_dict() output, in arrival order
+    pages: Dict[str, str] = field(default_factory=dict)  # Page text by result URL
+
+    def search_results(self) -> List[SearchResult]:
+        """Fresh SearchResult objects (callers mutate them)."""
+        return [SearchResult.from_dict(result) for result in self.results]
+
+
+@dataclass
+class RunSnapshot:
+    """Stored inputs of one research run."""
+    request: AgenticResearchRequest
+    plan: ResearchPlan
+    created_at: float
+    questions: Dict[str, QuestionSnapshot] = field(default_factory=dict)  # By question_key()
+
+    @property
+    def request_id(self) -> str:
+        return self.request.id
+
+    def question(self, text: str) -> Optional[QuestionSnapshot]:
+        return self.questions.get(question_key(text))
+
+    @property
+    def pages(self) -> Dict[str, str]:
+        """Page text by result URL across all questions."""
+        return {url: text for question in self.questions.values() for url, text in question.pages.items()}
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "request_id": self.request_id,
+            "query": self.request.query,
+            "depth_level": self.request.depth_level.value,
+            "created_at": self.created_at,
+            "questions": [
+                {
+                    "question_id": q.question_id,
+                    "text": q.text,
+                    "depth": q.depth,
+                    "results": len(q.results),
+                    "pages": len(q.pages)
+                }
+                for q in self.questions.values()
+            ]
+        }
+
+
+class SnapshotStore:
+    """SQLite store of compressed, content-addressed search snapshots."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = settings.SNAPSHOT_PATH if path is None else path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS snapshot_blobs ("
+            "digest TEXT PRIMARY KEY, data BLOB NOT NULL, raw_bytes INTEGER NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS snapshot_runs ("
+            "request_id TEXT PRIMARY KEY, request_digest TEXT NOT NULL, plan_digest TEXT NOT NULL, created_at REAL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS snapshot_questions ("
+            "request_id TEXT NOT NULL, question_key TEXT NOT NULL, question_id TEXT, question_text TEXT, "
+            "depth INTEGER, digest TEXT NOT NULL, created_at REAL, PRIMARY KEY (request_id, question_key))"
+        )
+        self._db.commit()
+
+    def _put(self, payload: Any) -> str:
+        """Store a JSON payload and return its content address (caller holds the lock)."""
+        raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        self._db.execute(
+            "INSERT OR IGNORE INTO snapshot_blobs (digest, data, raw_bytes) VALUES (?, ?, ?)",
+            (digest, zlib.compress(raw, settings.SNAPSHOT_COMPRESSION_LEVEL), len(raw))
+        )
+        return digest
+
+    def _get(self, digest: str) -> Any:
+        """Load a payload by content address (caller holds the lock)."""
+        row = self._db.execute("SELECT data FROM snapshot_blobs WHERE digest = ?", (digest,)).fetchone()
+        if row is None:
+            raise KeyError(f"Snapshot blob {digest} missing")
+        return json.loads(zlib.decompress(row[0]))
+
+    def save_run(self, request: AgenticResearchRequest, plan: ResearchPlan):
+        """Record a run's request and plan; its sub-questions are added as they are searched."""
+        with self._lock:
+            request_digest = self._put(request.model_dump(mode="json"))
+            plan_digest = self._put(plan.model_dump(mode="json"))
+            self._db.execute(
+                "INSERT OR REPLACE INTO snapshot_runs (request_id, request_digest, plan_digest, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (request.id, request_digest, plan_digest, time.time())
+            )
+            self._db.commit()
+
+    def save_question(
+        self,
+        request_id: str,
+        question: SubQuestion,
+        results: List[Dict[str, Any]],
+        pages: Optional[Dict[str, str]] = None
+    ):
+        """Record the raw search results (and fetched page text) of one sub-question.
+
+        Args:
+            request_id: Run the question belongs to
+            question: The sub-question searched
+            results: SearchResult.to_dict() output in arrival order, duplicates included
+            pages: Page text by result URL
+        """
+        with self._lock:
+            page_digests = {url: self._put(text) for url, text in (pages or {}).items()}
+            digest = self._put({"results": results, "pages": page_digests})
+            self._db.execute(
+                "INSERT OR REPLACE INTO snapshot_questions "
+                "(request_id, question_key, question_id, question_text, depth, digest, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (request_id, question_key(question.text), question.id, question.text, question.depth,
+                 digest, time.time())
+            )
+            self._db.commit()
+
+    def load_run(self, request_id: str) -> Optional[RunSnapshot]:
+        """The stored run, or None if there is no snapshot for `request_id`."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT request_digest, plan_digest, created_at FROM snapshot_runs WHERE request_id = ?",
+                (request_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            snapshot = RunSnapshot(
+                request=AgenticResearchRequest.model_validate(self._get(row[0])),
+                plan=ResearchPlan.model_validate(self._get(row[1])),
+                created_at=row[2]
+            )
+            for key, question_id, text, depth, digest in self._db.execute(
+                "SELECT question_key, question_id, question_text, depth, digest FROM snapshot_questions "
+                "WHERE request_id = ? ORDER BY created_at",
+                (request_id,)
+            ).fetchall():
+                payload = self._get(digest)
+                snapshot.questions[key] = QuestionSnapshot(
+                    question_id=question_id,
+                    text=text,
+                    depth=depth,
+                    results=payload["results"],
+                    pages={url: self._get(page_digest) for url, page_digest in payload["pages"].items()}
+                )
+        return snapshot
+
+    def stats(self) -> Dict[str, Any]:
+        """Run, question and blob counts with raw and compressed sizes."""
+        with self._lock:
+            runs = self._db.execute("SELECT COUNT(*) FROM snapshot_runs").fetchone()[0]
+            questions = self._db.execute("SELECT COUNT(*) FROM snapshot_questions").fetchone()[0]
+            blobs, raw_bytes, stored_bytes = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(raw_bytes), 0), COALESCE(SUM(LENGTH(data)), 0) FROM snapshot_blobs"
+            ).fetchone()
+        return {
+            "runs": runs,
+            "questions": questions,
+            "blobs": blobs,
+            "raw_bytes": raw_bytes,
+            "stored_bytes": stored_bytes
+        }
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class SnapshotSearchClient:
+    """Stand-in for SearchClient serving a run's stored results.
+
+    Never makes a network call: questions without a snapshot (e.g. new
+    recursive topics from a changed extraction prompt) get no results.
+    """
+
+    def __init__(self, snapshot: RunSnapshot):
+        self.snapshot = snapshot
+        self.misses: List[str] = []
+
+    async def stream_all_providers(
+        self,
+        query: str,
+        max_results_per_provider: Optional[int] = None,
+        use_cache: bool = True,
+        research_type: Optional[str] = None
+    ) -> AsyncIterator[SearchResult]:
+        question = self.snapshot.question(query)
+        if question is None:
+            self.misses.append(query)
+            return
+        for result in question.search_results():
+            yield result
+
+    async def search_all_providers(self, query: str, *args, **kwargs) -> List[SearchResult]:
+        return [result async for result in self.stream_all_providers(query, *args, **kwargs)]
+
+
+# Global store instance
+_snapshot_store: Optional[SnapshotStore] = None
+_store_lock = threading.Lock()
+
+
+def get_snapshot_store() -> Optional[SnapshotStore]:
+    """Get the global snapshot store, or None when snapshots are disabled."""
+    global _snapshot_store
+    if not settings.SNAPSHOTS_ENABLED or not settings.SNAPSHOT_PATH:
+        return None
+    if _snapshot_store is None:
+        with _store_lock:
+            if _snapshot_store is None:
+                _snapshot_store = SnapshotStore()
+    return _snapshot_store
@@ -0,0 +1,110 @@
+"""Batched MediaWiki client for the Wikipedia search providers.
+
+Per NFR-007 lookups use English Wikipedia.
+
+A single `action=query` request with `generator=search` returns titles,
+intro extracts and canonical URLs for every hit, replacing the
+search + summary + page round trips per title (2N+1) of the `wikipedia`
+library with one request per query.
+"""
+
+import requests
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from backend.config import settings
+from backend.utils.http_pool import get_http_pool, DEFAULT_HEADERS
+
+
+# TextExtracts returns at most 20 intro extracts per request
+MAX_BATCH_SIZE = 20
+
+
+@dataclass
+class WikipediaPage:
+    """A Wikipedia search hit with its intro extract."""
+    title: str
+    url: str
+    extract: str
+
+
+class WikipediaAPI:
+    """Client for the MediaWiki Action API.
+
+    `base_url` can point at a local stand-in server for tests.
+    """
+
+    pool_key = "wikipedia"
+
+    def __init__(self, base_url: Optional[str] = None):
+        self._base_url = base_url
+        self._session: Optional[requests.Session] = None
+
+    @property
+    def base_url(self) -> str:
+        # Read per request so a changed WIKIPEDIA_API_URL reaches shared instances
+        return self._base_url or settings.WIKIPEDIA_API_URL
+
+    def build_params(self, query: str, limit: int, sentences: Optional[int] = None) -> Dict[str, Any]:
+        """Query parameters for one batched search + extracts + URLs request."""
+        limit = max(1, min(limit, MAX_BATCH_SIZE))
+        params = {
+            "action": "query",
+            "format": "json",
+            "formatversion": "2",
+            "generator": "search",
+            "gsrsearch": query,
+            "gsrlimit": limit,
+            "prop": "extracts|info|pageprops",
+            "exintro": "1",
+            "explaintext": "1",
+            "exlimit": limit,
+            "inprop": "url",
+            "ppprop": "disambiguation",
+            "redirects": "1",
+        }
+        if sentences:
+            params["exsentences"] = sentences
+        return params
+
+    def parse_response(self, data: Dict[str, Any]) -> List[WikipediaPage]:
+        """Turn an API response into pages in search rank order.
+
+        Disambiguation and missing pages are skipped.
+        """
+        pages = data.get("query", {}).get("pages", [])
+        if isinstance(pages, dict):
+            # formatversion=1 keys pages by id
+            pages = list(pages.values())
+
+        results = []
+        for page in sorted(pages, key=lambda p: p.get("index", 0)):
+            if page.get("missing") or "disambiguation" in page.get("pageprops", {}):
+                continue
+            results.append(WikipediaPage(
+                title=page.get("title", ""),
+                url=page.get("fullurl") or page.get("canonicalurl", ""),
+                extract=page.get("extract", "")
+            ))
+        return results
+
+    async def search(self, query: str, limit: int = 5, sentences: Optional[int] = None) -> List[WikipediaPage]:
+        """Search and fetch extracts for all hits in one async request."""
+        response = await get_http_pool().get(
+            self.pool_key, self.base_url, params=self.build_params(query, limit, sentences)
+        )
+        response.raise_for_status()
+        return self.parse_response(response.json())
+
+    def search_sync(self, query: str, limit: int = 5, sentences: Optional[int] = None) -> List[WikipediaPage]:
+        """Blocking variant of `search` on a keep-alive session."""
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update(DEFAULT_HEADERS)
+        response = self._session.get(
+            self.base_url,
+            params=self.build_params(query, limit, sentences),
+            timeout=settings.SEARCH_PROVIDER_TIMEOUT_SECONDS
+        )
+        response.raise_for_status()
+        return self.parse_response(response.json())